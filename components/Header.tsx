@@ -104,6 +104,7 @@ const Header: React.FC<HeaderProps> = ({ navigateHome, onNavigateToBuy, onNaviga
             {/* Seletor de idioma minimalista */}
             <div className="relative hidden md:block" ref={langDropdownRef}>
               <button 
+                data-testid="language-switcher"
                 onClick={() => setIsLangDropdownOpen(prev => !prev)} 
                 className="flex items-center space-x-2 px-3 py-2 rounded-lg border border-gray-200 hover:border-gray-300 transition-all duration-300"
               >
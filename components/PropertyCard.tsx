@@ -113,6 +113,7 @@ const PropertyCard: React.FC<PropertyCardProps> = ({ property, onViewDetails, on
 
   return (
     <div 
+      data-testid="property-card"
       className="w-full bg-white rounded-2xl shadow-lg overflow-hidden transition-all duration-300 hover:shadow-xl flex flex-col border border-gray-200"
       onMouseEnter={() => setIsHovered(true)}
       onMouseLeave={() => setIsHovered(false)}
@@ -1,68 +1,26 @@
 import asyncio
-from playwright import async_api
-from playwright.async_api import expect
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        await expect(frame.locator('text=Imóvel - Localização Privilegiada').first).to_be_visible(timeout=3000)
-        await expect(frame.locator('text=Salinas: Conforto, Praticidade e Segurança Total.').first).to_be_visible(timeout=3000)
-        await expect(frame.locator('text=Oportunidade de negócio imobiliário').first).to_be_visible(timeout=3000)
-        await expect(frame.locator('text=Casa Nova, Pronta para Morar! Conforto Imediato.').first).to_be_visible(timeout=3000)
-        await expect(frame.locator('text=Península: Lote Exclusivo 400m²').first).to_be_visible(timeout=3000)
-        await expect(frame.locator('text=Lote pronto em Cairu de Salinas: Construa seu paraíso!').first).to_be_visible(timeout=3000)
-        await asyncio.sleep(5)
+from harness import expect_all, run_standalone
+from harness.latency import LOAD_BUDGET_MS, load_home
+
+async def run_test(context):
+    # Open the homepage and time it until the first property card is rendered
+    page, timing = await load_home(context)
     
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+    # --> Assertions to verify final state
+    first_card = timing["firstCardMs"]
+    assert first_card is not None, "Test case failed: no property card was rendered on the homepage."
+    assert first_card <= LOAD_BUDGET_MS, f"Test case failed: property listings took {first_card:.0f} ms to render (budget {LOAD_BUDGET_MS} ms)."
+    frame = context.pages[-1]
+    await expect_all(frame, texts=[
+        'Imóvel - Localização Privilegiada',
+        'Salinas: Conforto, Praticidade e Segurança Total.',
+        'Oportunidade de negócio imobiliário',
+        'Casa Nova, Pronta para Morar! Conforto Imediato.',
+        'Península: Lote Exclusivo 400m²',
+        'Lote pronto em Cairu de Salinas: Construa seu paraíso!',
+    ], timeout=3000)
+
+
+if __name__ == "__main__":
+    asyncio.run(run_standalone(run_test))
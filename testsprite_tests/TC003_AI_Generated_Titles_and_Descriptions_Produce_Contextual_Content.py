@@ -1,94 +1,48 @@
 import asyncio
-from playwright import async_api
-from playwright.async_api import expect
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # -> Click the 'Publicar Imóvel' button to begin a new property publication journey.
-        frame = context.pages[-1]
-        # Click the 'Publicar Imóvel' button to start publishing a new property.
-        elem = frame.locator('xpath=html/body/div/div/header/nav/div[2]/a[4]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+from harness import Steps, expect, open_app, run_standalone
 
-        # -> Click the 'Acessar Painel Administrativo' button to log in as an administrator and access the property publication panel.
-        frame = context.pages[-1]
-        # Click the 'Acessar Painel Administrativo' button to access the admin panel for property publication.
-        elem = frame.locator('xpath=html/body/div/div/div/div/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+async def run_test(context):
+    # Open the app in a fresh page of the pooled browser context
+    page = await open_app(context)
+    steps = Steps(page)
+    
+    # Interact with the page elements to simulate user flow
+    # -> Click the 'Publicar Imóvel' button to begin a new property publication journey.
+    frame = context.pages[-1]
+    # Click the 'Publicar Imóvel' button to start publishing a new property.
+    elem = steps.locate('nav.publish', frame)
+    await steps.click(elem)
+    
 
-        # -> Click the 'Publicar Imóvel' button in the admin panel to begin a new property publication journey.
-        frame = context.pages[-1]
-        # Click the 'Publicar Imóvel' button in the admin panel to start publishing a new property.
-        elem = frame.locator('xpath=html/body/div/div/header/nav/div[2]/a[4]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # -> Click the 'Acessar Painel Administrativo' button to log in as an administrator and access the property publication panel.
+    frame = context.pages[-1]
+    # Click the 'Acessar Painel Administrativo' button to access the admin panel for property publication.
+    elem = steps.locate('publish.admin_access', frame)
+    await steps.click(elem)
+    
 
-        # -> Click the 'Acessar Painel Administrativo' button to log in as an administrator and access the property publication panel.
-        frame = context.pages[-1]
-        # Click the 'Acessar Painel Administrativo' button to access the admin panel for property publication.
-        elem = frame.locator('xpath=html/body/div/div/div/div/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # -> Click the 'Publicar Imóvel' button in the admin panel to begin a new property publication journey.
+    frame = context.pages[-1]
+    # Click the 'Publicar Imóvel' button in the admin panel to start publishing a new property.
+    elem = steps.locate('nav.publish', frame)
+    await steps.click(elem)
+    
 
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        try:
-            await expect(frame.locator('text=AI-generated property title and description are perfectly aligned with the property features').first).to_be_visible(timeout=1000)
-        except AssertionError:
-            raise AssertionError("Test case failed: The AI-generated titles and descriptions are not meaningful or contextually relevant to the property details as required by the test plan.")
-        await asyncio.sleep(5)
+    # -> Click the 'Acessar Painel Administrativo' button to log in as an administrator and access the property publication panel.
+    frame = context.pages[-1]
+    # Click the 'Acessar Painel Administrativo' button to access the admin panel for property publication.
+    elem = steps.locate('publish.admin_access', frame)
+    await steps.click(elem)
     
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+
+    # --> Assertions to verify final state
+    frame = context.pages[-1]
+    try:
+        await expect(frame.locator('text=AI-generated property title and description are perfectly aligned with the property features').first).to_be_visible(timeout=1000)
+    except AssertionError:
+        raise AssertionError("Test case failed: The AI-generated titles and descriptions are not meaningful or contextually relevant to the property details as required by the test plan.")
+
+
+if __name__ == "__main__":
+    asyncio.run(run_standalone(run_test))
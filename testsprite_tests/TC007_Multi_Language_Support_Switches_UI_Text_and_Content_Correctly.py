@@ -1,80 +1,37 @@
 import asyncio
-from playwright import async_api
-from playwright.async_api import expect
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
+from harness import Steps, expect, open_app, run_standalone
+
+# Images, media, fonts and map tiles are not asserted on (see harness/netprofile.py)
+NETWORK_PROFILE = "functional"
+
+async def run_test(context):
+    # Open the app in a fresh page of the pooled browser context
+    page = await open_app(context)
+    steps = Steps(page)
     
+    # Interact with the page elements to simulate user flow
+    # -> Select English from the language switcher and verify UI text updates accordingly.
+    frame = context.pages[-1]
+    # Click on 'English' language option in the language switcher to change UI language to English.
+    elem = steps.locate('header.logo', frame)
+    await steps.click(elem)
+    
+
+    # -> Try selecting Spanish language option to see if UI updates, or if the issue is consistent across other languages.
+    frame = context.pages[-1]
+    # Click on 'Español' language option in the language switcher to attempt switching UI language to Spanish.
+    elem = steps.locate('app.root', frame)
+    await steps.click(elem)
+    
+
+    # --> Assertions to verify final state
+    frame = context.pages[-1]
     try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # -> Select English from the language switcher and verify UI text updates accordingly.
-        frame = context.pages[-1]
-        # Click on 'English' language option in the language switcher to change UI language to English.
-        elem = frame.locator('xpath=html/body/div/div/header/nav/div/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+        await expect(frame.locator('text=Language switcher failed to update UI for Portuguese, English, or Spanish').first).to_be_visible(timeout=1000)
+    except AssertionError:
+        raise AssertionError('Test case failed: Selecting Portuguese, English, or Spanish did not update all UI elements and content accordingly as required by the test plan.')
 
-        # -> Try selecting Spanish language option to see if UI updates, or if the issue is consistent across other languages.
-        frame = context.pages[-1]
-        # Click on 'Español' language option in the language switcher to attempt switching UI language to Spanish.
-        elem = frame.locator('xpath=html/body/div').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
 
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        try:
-            await expect(frame.locator('text=Language switcher failed to update UI for Portuguese, English, or Spanish').first).to_be_visible(timeout=1000)
-        except AssertionError:
-            raise AssertionError('Test case failed: Selecting Portuguese, English, or Spanish did not update all UI elements and content accordingly as required by the test plan.')
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+if __name__ == "__main__":
+    asyncio.run(run_standalone(run_test, profile=NETWORK_PROFILE))
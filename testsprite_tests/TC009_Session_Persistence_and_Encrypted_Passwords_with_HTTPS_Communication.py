@@ -1,109 +1,66 @@
 import asyncio
-from playwright import async_api
-from playwright.async_api import expect
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # -> Click on 'Acesso Restrito' link to access login page.
-        frame = context.pages[-1]
-        # Click on 'Acesso Restrito' link to go to login page
-        elem = frame.locator('xpath=html/body/div/div/section/div/div[2]/div/div').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+from harness import Steps, expect, open_app, run_standalone
 
-        # -> Scroll down or search for 'Acesso Restrito' link and click it to access login page.
-        await page.mouse.wheel(0, 500)
-        
+# Images, media, fonts and map tiles are not asserted on (see harness/netprofile.py)
+NETWORK_PROFILE = "functional"
+
+async def run_test(context):
+    # Open the app in a fresh page of the pooled browser context
+    page = await open_app(context)
+    steps = Steps(page)
+    
+    # Interact with the page elements to simulate user flow
+    # -> Click on 'Acesso Restrito' link to access login page.
+    frame = context.pages[-1]
+    # Click on 'Acesso Restrito' link to go to login page
+    elem = steps.locate('home.section_card', frame)
+    await steps.click(elem)
+    
 
-        # -> Scroll further down or search for 'Acesso Restrito' link to access login page.
-        await page.mouse.wheel(0, 500)
-        
+    # -> Scroll down or search for 'Acesso Restrito' link and click it to access login page.
+    await page.mouse.wheel(0, 500)
+    
 
-        # -> Click the 'Quallity Home Portal Imobiliário' link (index 1) to return to homepage and locate 'Acesso Restrito' link.
-        frame = context.pages[-1]
-        # Click 'Quallity Home Portal Imobiliário' link to return to homepage
-        elem = frame.locator('xpath=html/body/div/div/div/header/nav/div/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # -> Scroll further down or search for 'Acesso Restrito' link to access login page.
+    await page.mouse.wheel(0, 500)
+    
 
-        # -> Click on 'Acesso Restrito' link (index 76) to access login page.
-        frame = context.pages[-1]
-        # Click on 'Acesso Restrito' link to access login page
-        elem = frame.locator('xpath=html/body/div/div/section/div/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # -> Click the 'Quallity Home Portal Imobiliário' link (index 1) to return to homepage and locate 'Acesso Restrito' link.
+    frame = context.pages[-1]
+    # Click 'Quallity Home Portal Imobiliário' link to return to homepage
+    elem = steps.locate('header.logo', frame)
+    await steps.click(elem)
+    
 
-        # -> Scroll down or search for 'Acesso Restrito' link to access login page.
-        await page.mouse.wheel(0, await page.evaluate('() => window.innerHeight'))
-        
+    # -> Click on 'Acesso Restrito' link (index 76) to access login page.
+    frame = context.pages[-1]
+    # Click on 'Acesso Restrito' link to access login page
+    elem = steps.locate('home.section_button', frame)
+    await steps.click(elem)
+    
 
-        await page.mouse.wheel(0, await page.evaluate('() => window.innerHeight'))
-        
+    # -> Scroll down or search for 'Acesso Restrito' link to access login page.
+    await page.mouse.wheel(0, await page.evaluate('() => window.innerHeight'))
+    
 
-        await page.mouse.wheel(0, await page.evaluate('() => window.innerHeight'))
-        
+    await page.mouse.wheel(0, await page.evaluate('() => window.innerHeight'))
+    
 
-        # -> Scroll up to top and try to locate 'Acesso Restrito' link or search for it by text.
-        await page.mouse.wheel(0, -await page.evaluate('() => window.innerHeight'))
-        
+    await page.mouse.wheel(0, await page.evaluate('() => window.innerHeight'))
+    
 
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        try:
-            await expect(frame.locator('text=Secure session established with encrypted passwords and HTTPS').first).to_be_visible(timeout=1000)
-        except AssertionError:
-            raise AssertionError("Test case failed: Secure user session persistence after login could not be verified. Passwords may not be encrypted or communication may not be using HTTPS as required by the test plan.")
-        await asyncio.sleep(5)
+    # -> Scroll up to top and try to locate 'Acesso Restrito' link or search for it by text.
+    await page.mouse.wheel(0, -await page.evaluate('() => window.innerHeight'))
     
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+
+    # --> Assertions to verify final state
+    frame = context.pages[-1]
+    try:
+        await expect(frame.locator('text=Secure session established with encrypted passwords and HTTPS').first).to_be_visible(timeout=1000)
+    except AssertionError:
+        raise AssertionError("Test case failed: Secure user session persistence after login could not be verified. Passwords may not be encrypted or communication may not be using HTTPS as required by the test plan.")
+
+
+if __name__ == "__main__":
+    asyncio.run(run_standalone(run_test, profile=NETWORK_PROFILE))
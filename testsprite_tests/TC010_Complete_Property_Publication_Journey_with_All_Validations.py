@@ -1,92 +1,65 @@
 import asyncio
-from playwright import async_api
-from playwright.async_api import expect
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
+from harness import Steps, expect, open_app, run_standalone
+
+# Start already logged in as admin (see harness/auth.py)
+SESSION = "admin"
+
+# Clicks traced as step transitions by run_suite.py --perf-trace (see harness/perftrace.py):
+# opening the publish journey, then each choice that re-renders its form
+PERF_TRACE = r"^(Publicar Novo Imóvel|Venda|Aluguel|Temporada|Terreno)$"
+
+async def run_test(context):
+    # Open the app in a fresh page of the pooled browser context
+    page = await open_app(context)
+    steps = Steps(page)
+    
+    # Interact with the page elements to simulate user flow
+    # -> The admin session is injected from stored state, so the app opens on the dashboard.
+    # -> Click 'Publicar Novo Imóvel' to open the property publication journey.
+    frame = context.pages[-1]
+    # Click 'Publicar Novo Imóvel' in the dashboard quick actions
+    elem = steps.locate('admin.publish_new', frame)
+    await steps.click(elem)
     
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # -> Locate and click the link or button to access the property publication section as a publisher.
-        frame = context.pages[-1]
-        # Click on 'Acesso Restrito' link to access restricted area for publisher login or property publication section
-        elem = frame.locator('xpath=html/body/div/div/footer/div/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
 
-        # -> Input valid email and password credentials and click the login button to access the property publication section.
-        frame = context.pages[-1]
-        # Input valid email for publisher login
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/form/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('publisher@example.com')
-        
+    # -> Switch the operation to 'Aluguel'; the rent price fields replace the sale price.
+    frame = context.pages[-1]
+    # Click the 'Aluguel' operation
+    elem = steps.locate('publish_form.operation_rent', frame)
+    await steps.click(elem)
+    
 
-        frame = context.pages[-1]
-        # Input valid password for publisher login
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/form/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('ValidPassword123')
-        
+    # -> Switch the operation to 'Temporada'; the season price field replaces the rent price.
+    frame = context.pages[-1]
+    # Click the 'Temporada' operation
+    elem = steps.locate('publish_form.operation_season', frame)
+    await steps.click(elem)
+    
 
-        frame = context.pages[-1]
-        # Click the login button to submit credentials
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/form/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # -> Choose 'Terreno' as the property type; the land-specific fields appear.
+    frame = context.pages[-1]
+    # Click the 'Terreno' property type
+    elem = steps.locate('publish_form.type_land', frame)
+    await steps.click(elem)
+    
 
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        try:
-            await expect(frame.locator('text=Property Publication Completed Successfully').first).to_be_visible(timeout=1000)
-        except AssertionError:
-            raise AssertionError('Test case failed: The end-to-end property publication flow did not complete successfully as expected. Validation errors, AI content generation issues, media upload failures, or submission problems were encountered.')
-        await asyncio.sleep(5)
+    # -> Submit the form without a title to trigger the validation.
+    frame = context.pages[-1]
+    # Click 'Publicar Imóvel' with the required fields still empty
+    elem = steps.locate('publish_form.submit', frame)
+    await steps.click(elem)
     
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+
+    # --> Assertions to verify final state
+    frame = context.pages[-1]
+    try:
+        await expect(frame.locator('text=Preço de Temporada *').first).to_be_visible(timeout=1000)
+        await expect(frame.locator('text=Topografia').first).to_be_visible(timeout=1000)
+        await expect(frame.locator('text=O título deve ter pelo menos 10 caracteres.').first).to_be_visible(timeout=1000)
+    except AssertionError:
+        raise AssertionError('Test case failed: The property publication journey did not validate the incomplete form as expected. The publish form, its operation and property type choices, or the validation of required fields did not behave as specified.')
+
+
+if __name__ == "__main__":
+    asyncio.run(run_standalone(run_test))
@@ -1,123 +1,60 @@
 import asyncio
-from playwright import async_api
-from playwright.async_api import expect
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # -> Click on 'Acesso Restrito' link to access the admin panel login page.
-        frame = context.pages[-1]
-        # Click on 'Acesso Restrito' link to go to admin panel login.
-        elem = frame.locator('xpath=html/body/div/div/footer/div/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Input email and password, then click login button.
-        frame = context.pages[-1]
-        # Input admin email
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/form/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('quallity@admin.com')
-        
+from harness import Steps, expect_all, open_app, run_standalone
 
-        frame = context.pages[-1]
-        # Input admin password
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/form/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('1234')
-        
+# Start already logged in as admin (see harness/auth.py)
+SESSION = "admin"
 
-        frame = context.pages[-1]
-        # Click login button to access admin dashboard
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/form/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+# Images, media, fonts and map tiles are not asserted on (see harness/netprofile.py)
+NETWORK_PROFILE = "functional"
 
-        # -> Click on 'Gerenciar Imóveis' button to go to property management page.
-        frame = context.pages[-1]
-        # Click 'Gerenciar Imóveis' to navigate to property management page
-        elem = frame.locator('xpath=html/body/div/div/div/div[3]/main/div/div[3]/div/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Click on 'Filtros' button to open filter options and apply filter by status 'Ativo'.
-        frame = context.pages[-1]
-        # Click 'Filtros' button to open filter options panel
-        elem = frame.locator('xpath=html/body/div/div/div/div[3]/main/div/div[2]/div/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+async def run_test(context):
+    # Open the app in a fresh page of the pooled browser context
+    page = await open_app(context)
+    steps = Steps(page)
+    
+    # Interact with the page elements to simulate user flow
+    # -> The admin session is injected from stored state, so the app opens on the dashboard.
+    # -> Click on 'Gerenciar Imóveis' button to go to property management page.
+    frame = context.pages[-1]
+    # Click 'Gerenciar Imóveis' to navigate to property management page
+    elem = steps.locate('admin.manage_properties', frame)
+    await steps.click(elem)
+    
 
-        # -> Apply filter by date using the 'Data' dropdown and verify listings update accordingly.
-        frame = context.pages[-1]
-        # Click to apply sorting by date ascending or descending
-        elem = frame.locator('xpath=html/body/div/div/div/div[3]/main/div/div[2]/div/div/div[2]/div/div/div[4]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # -> Click on 'Filtros' button to open filter options and apply filter by status 'Ativo'.
+    frame = context.pages[-1]
+    # Click 'Filtros' button to open filter options panel
+    elem = steps.locate('admin.filters', frame)
+    await steps.click(elem)
+    
 
-        # -> Click 'Limpar filtros' button to clear all filters and verify that all 11 property listings are displayed again.
-        frame = context.pages[-1]
-        # Click 'Limpar filtros' button to clear all filters
-        elem = frame.locator('xpath=html/body/div/div/div/div[3]/main/div/div[2]/div/div/div[2]/div/div/div[5]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # -> Apply filter by date using the 'Data' dropdown and verify listings update accordingly.
+    frame = context.pages[-1]
+    # Click to apply sorting by date ascending or descending
+    elem = steps.locate('admin.sort_date', frame)
+    await steps.click(elem)
+    
 
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        await expect(frame.locator('text=Ativo').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Venda').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=11 de 11 anúncios').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Data').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Preço').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Título').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Limpar filtros').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
+    # -> Click 'Limpar filtros' button to clear all filters and verify that all 11 property listings are displayed again.
+    frame = context.pages[-1]
+    # Click 'Limpar filtros' button to clear all filters
+    elem = steps.locate('admin.clear_filters', frame)
+    await steps.click(elem)
     
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+
+    # --> Assertions to verify final state
+    frame = context.pages[-1]
+    await expect_all(frame, texts=[
+        'Ativo',
+        'Venda',
+        '11 de 11 anúncios',
+        'Data',
+        'Preço',
+        'Título',
+        'Limpar filtros',
+    ], timeout=30000)
+
+
+if __name__ == "__main__":
+    asyncio.run(run_standalone(run_test, session=SESSION, profile=NETWORK_PROFILE))
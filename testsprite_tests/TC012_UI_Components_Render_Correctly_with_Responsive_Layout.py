@@ -1,136 +1,103 @@
 import asyncio
-from playwright import async_api
-from playwright.async_api import expect
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
+from harness import Steps, expect_all, open_app, run_standalone
+from harness.screenshots import ScreenshotSink
+
+# Breakpoints captured for visual_diff.py
+VIEWPORTS = {
+    "desktop": {"width": 1280, "height": 720},
+    "tablet": {"width": 768, "height": 1024},
+    "mobile": {"width": 375, "height": 812},
+}
+
+# Text every layout must show; run_device_matrix.py checks it per device profile
+RESPONSIVE_TEXTS = [
+    'Quallity Home',
+    'Portal Imobiliário',
+    'Lar dos sonhos? Encontre aqui.',
+    'Explore nossa seleção exclusiva de imóveis que combinam luxo, conforto e localização privilegiada.',
+    'Imóvel - Localização Privilegiada',
+    'Salinas: Conforto, Praticidade e Segurança Total.',
+    'Oportunidade de negócio imobiliário',
+    'Casa Nova, Pronta para Morar! Conforto Imediato.',
+    'Península: Lote Exclusivo 400m²',
+    'Lote pronto em Cairu de Salinas: Construa seu paraíso!',
+    '© 2025 Quallity Home Portal Imobiliário. Todos os direitos reservados.',
+    'Não foi possível obter a sua localização. Isto pode acontecer se você negou o pedido de permissão ou se o seu navegador não suporta geolocalização. Por favor, verifique as permissões de site do seu navegador e tente novamente.',
+]
+
+async def run_test(context):
+    # Open the app in a fresh page of the pooled browser context
+    page = await open_app(context)
+    steps = Steps(page)
+    
+    # Interact with the page elements to simulate user flow
+    # -> Resize viewport to tablet screen width and verify UI components render fluidly without visual defects.
+    await steps.goto('http://localhost:3000')
+    
+
+    await page.mouse.wheel(0, 300)
+    
+
+    # -> Resize viewport to tablet screen width and verify UI components render fluidly without visual defects.
+    await steps.goto('http://localhost:3000')
     
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # -> Resize viewport to tablet screen width and verify UI components render fluidly without visual defects.
-        await page.goto('http://localhost:3000', timeout=10000)
-        await asyncio.sleep(3)
-        
-
-        await page.mouse.wheel(0, 300)
-        
-
-        # -> Resize viewport to tablet screen width and verify UI components render fluidly without visual defects.
-        await page.goto('http://localhost:3000', timeout=10000)
-        await asyncio.sleep(3)
-        
-
-        await page.mouse.wheel(0, 300)
-        
-
-        # -> Resize viewport to tablet screen width and verify UI components render fluidly without visual defects.
-        await page.goto('http://localhost:3000', timeout=10000)
-        await asyncio.sleep(3)
-        
-
-        # -> Resize viewport to tablet screen width and verify UI components render fluidly without visual defects.
-        await page.goto('http://localhost:3000', timeout=10000)
-        await asyncio.sleep(3)
-        
-
-        # -> Resize viewport to tablet screen width and verify UI components render fluidly without visual defects.
-        await page.goto('http://localhost:3000', timeout=10000)
-        await asyncio.sleep(3)
-        
-
-        await page.mouse.wheel(0, 300)
-        
-
-        # -> Resize viewport to tablet screen width and verify UI components render fluidly without visual defects.
-        await page.goto('http://localhost:3000', timeout=10000)
-        await asyncio.sleep(3)
-        
-
-        # -> Resize viewport to tablet screen width and verify UI components render fluidly without visual defects.
-        frame = context.pages[-1]
-        # Click the button to open screen size or responsive options if available
-        elem = frame.locator('xpath=html/body/div/div/header/nav/div[3]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Resize viewport to tablet screen width and verify UI components render fluidly without visual defects.
-        await page.goto('http://localhost:3000', timeout=10000)
-        await asyncio.sleep(3)
-        
-
-        # -> Resize viewport to tablet screen width and verify UI components render fluidly without visual defects.
-        frame = context.pages[-1]
-        # Click button to open screen size or responsive options if available
-        elem = frame.locator('xpath=html/body/div/div/header/nav/div[3]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Extract content or scroll to find any responsive or screen size controls or simulate viewport resizing by other means to test tablet and mobile views.
-        await page.mouse.wheel(0, 600)
-        
-
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        await expect(frame.locator('text=Quallity Home').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Portal Imobiliário').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Lar dos sonhos? Encontre aqui.').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Explore nossa seleção exclusiva de imóveis que combinam luxo, conforto e localização privilegiada.').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Imóvel - Localização Privilegiada').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Salinas: Conforto, Praticidade e Segurança Total.').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Oportunidade de negócio imobiliário').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Casa Nova, Pronta para Morar! Conforto Imediato.').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Península: Lote Exclusivo 400m²').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Lote pronto em Cairu de Salinas: Construa seu paraíso!').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=© 2025 Quallity Home Portal Imobiliário. Todos os direitos reservados.').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Não foi possível obter a sua localização. Isto pode acontecer se você negou o pedido de permissão ou se o seu navegador não suporta geolocalização. Por favor, verifique as permissões de site do seu navegador e tente novamente.').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
+
+    await page.mouse.wheel(0, 300)
+    
+
+    # -> Resize viewport to tablet screen width and verify UI components render fluidly without visual defects.
+    await steps.goto('http://localhost:3000')
+    
+
+    # -> Resize viewport to tablet screen width and verify UI components render fluidly without visual defects.
+    await steps.goto('http://localhost:3000')
+    
+
+    # -> Resize viewport to tablet screen width and verify UI components render fluidly without visual defects.
+    await steps.goto('http://localhost:3000')
     
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+
+    await page.mouse.wheel(0, 300)
+    
+
+    # -> Resize viewport to tablet screen width and verify UI components render fluidly without visual defects.
+    await steps.goto('http://localhost:3000')
+    
+
+    # -> Resize viewport to tablet screen width and verify UI components render fluidly without visual defects.
+    frame = context.pages[-1]
+    # Click the button to open screen size or responsive options if available
+    elem = steps.locate('header.language_switcher', frame)
+    await steps.click(elem)
+    
+
+    # -> Resize viewport to tablet screen width and verify UI components render fluidly without visual defects.
+    await steps.goto('http://localhost:3000')
+    
+
+    # -> Resize viewport to tablet screen width and verify UI components render fluidly without visual defects.
+    frame = context.pages[-1]
+    # Click button to open screen size or responsive options if available
+    elem = steps.locate('header.language_switcher', frame)
+    await steps.click(elem)
+    
+
+    # -> Extract content or scroll to find any responsive or screen size controls or simulate viewport resizing by other means to test tablet and mobile views.
+    await page.mouse.wheel(0, 600)
+    
+
+    # --> Assertions to verify final state
+    frame = context.pages[-1]
+    await expect_all(frame, texts=RESPONSIVE_TEXTS, timeout=30000)
+
+    # --> Capture each breakpoint for the visual regression stage
+    async with ScreenshotSink() as shots:
+        for name, size in VIEWPORTS.items():
+            await page.set_viewport_size(size)
+            await steps.settle()
+            await shots.capture(page, f"tc012_{name}")
+
+
+if __name__ == "__main__":
+    asyncio.run(run_standalone(run_test))
@@ -1,94 +1,48 @@
 import asyncio
-from playwright import async_api
-from playwright.async_api import expect
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # -> Click on the 'Detalhes' button of the second property card to navigate to its detail page.
-        frame = context.pages[-1]
-        # Click on the 'Detalhes' button of the second property card to open the property detail page.
-        elem = frame.locator('xpath=html/body/div/div/section/div/div[2]/div[2]/div[2]/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+from harness import Steps, expect, open_app, run_standalone
 
-        # -> Verify that the image gallery loads and can be navigated correctly by interacting with the gallery buttons.
-        frame = context.pages[-1]
-        # Click on the next image button in the image gallery to test navigation.
-        elem = frame.locator('xpath=html/body/div/div/div/main/div/div/section/div[3]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+async def run_test(context):
+    # Open the app in a fresh page of the pooled browser context
+    page = await open_app(context)
+    steps = Steps(page)
+    
+    # Interact with the page elements to simulate user flow
+    # -> Click on the 'Detalhes' button of the second property card to navigate to its detail page.
+    frame = context.pages[-1]
+    # Click on the 'Detalhes' button of the second property card to open the property detail page.
+    elem = steps.locate('listing.second_card_details', frame)
+    await steps.click(elem)
+    
 
-        # -> Click the 'Ligar Agora' button to verify it triggers the expected phone call action or link.
-        frame = context.pages[-1]
-        # Click the 'Ligar Agora' button to test phone call functionality.
-        elem = frame.locator('xpath=html/body/div/div/div/main/div/aside/div/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # -> Verify that the image gallery loads and can be navigated correctly by interacting with the gallery buttons.
+    frame = context.pages[-1]
+    # Click on the next image button in the image gallery to test navigation.
+    elem = steps.locate('detail.gallery_next', frame)
+    await steps.click(elem)
+    
 
-        # -> Test the 'WhatsApp' contact button to check if it functions correctly before deciding to report the issue.
-        frame = context.pages[-1]
-        # Click the 'WhatsApp' button to test if it triggers the expected WhatsApp contact action.
-        elem = frame.locator('xpath=html/body/div/div/div/main/div/aside/div/div/div/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # -> Click the 'Ligar Agora' button to verify it triggers the expected phone call action or link.
+    frame = context.pages[-1]
+    # Click the 'Ligar Agora' button to test phone call functionality.
+    elem = steps.locate('detail.call', frame)
+    await steps.click(elem)
+    
 
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        try:
-            await expect(frame.locator('text=Property Gallery Loaded Successfully').first).to_be_visible(timeout=1000)
-        except AssertionError:
-            raise AssertionError("Test case failed: The property detail page did not load the image gallery, features, descriptions, or contact options as expected according to the test plan.")
-        await asyncio.sleep(5)
+    # -> Test the 'WhatsApp' contact button to check if it functions correctly before deciding to report the issue.
+    frame = context.pages[-1]
+    # Click the 'WhatsApp' button to test if it triggers the expected WhatsApp contact action.
+    elem = steps.locate('detail.whatsapp', frame)
+    await steps.click(elem)
     
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+
+    # --> Assertions to verify final state
+    frame = context.pages[-1]
+    try:
+        await expect(frame.locator('text=Property Gallery Loaded Successfully').first).to_be_visible(timeout=1000)
+    except AssertionError:
+        raise AssertionError("Test case failed: The property detail page did not load the image gallery, features, descriptions, or contact options as expected according to the test plan.")
+
+
+if __name__ == "__main__":
+    asyncio.run(run_standalone(run_test))
@@ -1,150 +1,106 @@
 import asyncio
-from playwright import async_api
-from playwright.async_api import expect
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
+from harness import Steps, expect, expect_all, open_app, run_standalone
+
+# Images, media, fonts and map tiles are not asserted on (see harness/netprofile.py)
+NETWORK_PROFILE = "functional"
+
+async def run_test(context):
+    # Open the app in a fresh page of the pooled browser context
+    page = await open_app(context)
+    steps = Steps(page)
+    
+    # Interact with the page elements to simulate user flow
+    # -> Open the login modal to perform user login.
+    frame = context.pages[-1]
+    # Click on 'Acesso Restrito' link to open login modal
+    elem = steps.locate('footer.restricted_access', frame)
+    await steps.click(elem)
+    
+
+    # -> Switch back to the original site tab and open the login modal again to retry login.
+    frame = context.pages[-1]
+    # Click 'Log in' button on Instagram modal to close or bypass Instagram login prompt
+    elem = steps.locate('external.instagram_login', frame)
+    await steps.click(elem)
+    
+
+    await steps.goto('http://localhost:3000/')
     
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # -> Open the login modal to perform user login.
-        frame = context.pages[-1]
-        # Click on 'Acesso Restrito' link to open login modal
-        elem = frame.locator('xpath=html/body/div/div/footer/div/div/a/img').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Switch back to the original site tab and open the login modal again to retry login.
-        frame = context.pages[-1]
-        # Click 'Log in' button on Instagram modal to close or bypass Instagram login prompt
-        elem = frame.locator('xpath=html/body/div[7]/div[2]/div/div/div/div/div[2]/div/div/div/div/div[2]/div/div[2]/div/div/div/div[2]/div').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        await page.goto('http://localhost:3000/', timeout=10000)
-        await asyncio.sleep(3)
-        
-
-        # -> Click 'Acesso Restrito' to open the login modal again and attempt login with alternative input methods.
-        frame = context.pages[-1]
-        # Click 'Acesso Restrito' link to open login modal
-        elem = frame.locator('xpath=html/body/div/div/footer/div/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Input admin credentials (email: quallity@admin.com, password: 1234) and submit login form.
-        frame = context.pages[-1]
-        # Input admin email in login modal
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/form/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('quallity@admin.com')
-        
-
-        frame = context.pages[-1]
-        # Input admin password in login modal
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/form/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('1234')
-        
-
-        frame = context.pages[-1]
-        # Click 'Entrar' button to submit login form
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/form/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Refresh the page to verify session persistence and user remains logged in.
-        await page.goto('http://localhost:3000/dashboard', timeout=10000)
-        await asyncio.sleep(3)
-        
-
-        await page.goto('http://localhost:3000/dashboard', timeout=10000)
-        await asyncio.sleep(3)
-        
-
-        # -> Navigate to homepage and then back to Dashboard to verify session persistence across navigation.
-        await page.goto('http://localhost:3000/', timeout=10000)
-        await asyncio.sleep(3)
-        
-
-        await page.goto('http://localhost:3000/dashboard', timeout=10000)
-        await asyncio.sleep(3)
-        
-
-        # -> Click the 'Sair' button to perform logout and verify session termination.
-        frame = context.pages[-1]
-        # Click 'Sair' button to log out
-        elem = frame.locator('xpath=html/body/div/div/div/div[2]/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Attempt to access the dashboard page after logout to verify access is denied and user is redirected or blocked.
-        await page.goto('http://localhost:3000/dashboard', timeout=10000)
-        await asyncio.sleep(3)
-        
-
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        await expect(frame.locator('text=Sair').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Dashboard').first).to_be_visible(timeout=30000)
-        await page.reload()
-        await expect(frame.locator('text=Sair').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Dashboard').first).to_be_visible(timeout=30000)
-        await page.goto('http://localhost:3000/')
-        await expect(frame.locator('text=Lar dos sonhos? Encontre aqui. Explore nossa seleção exclusiva de imóveis que combinam luxo, conforto e localização privilegiada.').first).to_be_visible(timeout=30000)
-        await page.goto('http://localhost:3000/dashboard')
-        await expect(frame.locator('text=Sair').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Dashboard').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Sair').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Dashboard').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Não foi possível obter a sua localização. Isto pode acontecer se você negou o pedido de permissão ou se o seu navegador não suporta geolocalização. Por favor, verifique as permissões de site do seu navegador e tente novamente.').first).not_to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Lar dos sonhos? Encontre aqui. Explore nossa seleção exclusiva de imóveis que combinam luxo, conforto e localização privilegiada.').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
+
+    # -> Click 'Acesso Restrito' to open the login modal again and attempt login with alternative input methods.
+    frame = context.pages[-1]
+    # Click 'Acesso Restrito' link to open login modal
+    elem = steps.locate('footer.restricted_access', frame)
+    await steps.click(elem)
     
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+
+    # -> Input admin credentials (email: quallity@admin.com, password: 1234) and submit login form.
+    frame = context.pages[-1]
+    # Input admin email in login modal
+    elem = steps.locate('admin_login.email', frame)
+    await steps.fill(elem, 'quallity@admin.com')
+    
+
+    frame = context.pages[-1]
+    # Input admin password in login modal
+    elem = steps.locate('admin_login.password', frame)
+    await steps.fill(elem, '1234')
+    
+
+    frame = context.pages[-1]
+    # Click 'Entrar' button to submit login form
+    elem = steps.locate('admin_login.submit', frame)
+    await steps.click(elem)
+    
+
+    # -> Refresh the page to verify session persistence and user remains logged in.
+    await steps.goto('http://localhost:3000/dashboard')
+    
+
+    await steps.goto('http://localhost:3000/dashboard')
+    
+
+    # -> Navigate to homepage and then back to Dashboard to verify session persistence across navigation.
+    await steps.goto('http://localhost:3000/')
+    
+
+    await steps.goto('http://localhost:3000/dashboard')
+    
+
+    # -> Click the 'Sair' button to perform logout and verify session termination.
+    frame = context.pages[-1]
+    # Click 'Sair' button to log out
+    elem = steps.locate('admin.logout', frame)
+    await steps.click(elem)
+    
+
+    # -> Attempt to access the dashboard page after logout to verify access is denied and user is redirected or blocked.
+    await steps.goto('http://localhost:3000/dashboard')
+    
+
+    # --> Assertions to verify final state
+    frame = context.pages[-1]
+    await expect_all(frame, texts=[
+        'Sair',
+        'Dashboard',
+    ], timeout=30000)
+    await page.reload()
+    await expect_all(frame, texts=[
+        'Sair',
+        'Dashboard',
+    ], timeout=30000)
+    await page.goto('http://localhost:3000/')
+    await expect(frame.locator('text=Lar dos sonhos? Encontre aqui. Explore nossa seleção exclusiva de imóveis que combinam luxo, conforto e localização privilegiada.').first).to_be_visible(timeout=30000)
+    await page.goto('http://localhost:3000/dashboard')
+    await expect_all(frame, texts=[
+        'Sair',
+        'Dashboard',
+        'Lar dos sonhos? Encontre aqui. Explore nossa seleção exclusiva de imóveis que combinam luxo, conforto e localização privilegiada.',
+    ], hidden_texts=[
+        'Não foi possível obter a sua localização. Isto pode acontecer se você negou o pedido de permissão ou se o seu navegador não suporta geolocalização. Por favor, verifique as permissões de site do seu navegador e tente novamente.',
+    ], timeout=30000)
+
+
+if __name__ == "__main__":
+    asyncio.run(run_standalone(run_test, profile=NETWORK_PROFILE))
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Find repeated step cycles in the TC scripts and write compacted copies.
+
+    python testsprite_tests/compact_steps.py                  # every TC script
+    python testsprite_tests/compact_steps.py TC005 TC012      # selected cases
+    python testsprite_tests/compact_steps.py --from-results   # the code stored in tmp/test_results.json
+
+Compacted scripts go to tmp/compacted/ under their original names and keep
+`run_test(context)`, so they run in the same harness:
+
+    python testsprite_tests/run_suite.py --cases-dir testsprite_tests/tmp/compacted
+"""
+
+import argparse
+import json
+import re
+import sys
+from pathlib import Path
+
+from harness import discover_cases
+from harness.loops import compact_source
+from harness.results import RESULTS_PATH
+from harness.suite import TESTS_DIR
+
+OUTPUT_DIR = TESTS_DIR / "tmp" / "compacted"
+
+
+def _sources(args):
+    """Yield `(name, source)` for each script to analyse."""
+    if args.from_results is None:
+        for case in discover_cases(ids=args.ids):
+            yield Path(case.path).name, Path(case.path).read_text(encoding="utf-8")
+        return
+    with open(args.from_results, encoding="utf-8") as f:
+        entries = json.load(f)
+    for entry in entries:
+        # Titles look like "TC005-Reject Upload of ..."
+        case_id, _, title = entry["title"].partition("-")
+        if args.ids and case_id not in {i.upper() for i in args.ids}:
+            continue
+        slug = re.sub(r"\W+", "_", title).strip("_")
+        yield f"{case_id}_{slug}.py", entry["code"]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("ids", nargs="*", help="test case ids to analyse (default: all)")
+    parser.add_argument("--from-results", nargs="?", const=str(RESULTS_PATH), metavar="PATH",
+                        help="analyse the code stored in test_results.json instead of the TC files")
+    parser.add_argument("--out", default=str(OUTPUT_DIR), help="directory for the compacted scripts")
+    parser.add_argument("--dry-run", action="store_true", help="report only, write nothing")
+    args = parser.parse_args(argv)
+
+    out = Path(args.out)
+    total_removed = total_saved = 0
+    for name, source in _sources(args):
+        try:
+            compacted, compaction = compact_source(source)
+        except (SyntaxError, ValueError) as e:
+            print(f"{name[:5]}  skipped: {e}")
+            continue
+        removed = compaction.removed
+        total_removed += len(removed)
+        total_saved += compaction.saved_ms
+        print(f"{name[:5]}  {len(compaction.steps):3d} -> {len(compaction.kept):3d} steps"
+              f"  (~{compaction.saved_ms / 1000:.1f}s saved)")
+        for first, period, reps in compaction.cycles:
+            span = f"step {first + 1}" if period == 1 else f"steps {first + 1}-{first + period}"
+            print(f"        {span} repeated {reps}x")
+        if removed and not args.dry_run:
+            out.mkdir(parents=True, exist_ok=True)
+            (out / name).write_text(compacted, encoding="utf-8")
+
+    print(f"\n{total_removed} repeated steps, ~{total_saved / 1000:.1f}s estimated saving per run")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
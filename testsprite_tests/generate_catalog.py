@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Generate a synthetic catalog (perfis, imoveis, midias_imovel) for scale tests.
+
+    python testsprite_tests/generate_catalog.py 10k                    # tmp/catalog/catalog-10k-seed1.sql
+    psql "$DATABASE_URL" -f testsprite_tests/tmp/catalog/catalog-10k-seed1.sql
+    python testsprite_tests/generate_catalog.py 100k --seed 7 --out - | psql "$DATABASE_URL"
+    python testsprite_tests/generate_catalog.py 1k --format json       # fixture for the stub
+    python -m harness.supabase_stub --seed tmp/catalog/catalog-1k-seed1.json
+
+Rows are generated and written one at a time, so memory stays flat at any
+size, and the same scale and seed always produce the same file. The
+generated profiles have no auth.users rows; if perfis.id references
+auth.users in the target schema, load the script with
+PGOPTIONS='-c session_replication_role=replica' to skip that check.
+"""
+
+import argparse
+import sys
+import time
+
+from harness.catalog import FIRST_ID, SCALES, write_copy, write_json
+from harness.suite import TESTS_DIR
+from harness.supabase_stub import SEED_PATH, load_seed
+
+OUT_DIR = TESTS_DIR / "tmp" / "catalog"
+
+
+def listings(value):
+    if value in SCALES:
+        return SCALES[value]
+    try:
+        count = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected one of {', '.join(SCALES)} or a number") from None
+    if count < 1:
+        raise argparse.ArgumentTypeError("need at least one listing")
+    return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("scale", help=f"{', '.join(SCALES)} or a number of listings")
+    parser.add_argument("--seed", type=int, default=1, help="random seed (default: 1)")
+    parser.add_argument("--format", choices=("copy", "json"), default="copy",
+                        help="psql COPY script, or a supabase_stub fixture (default: copy)")
+    parser.add_argument("--first-id", type=int, default=FIRST_ID, help=f"first imoveis/midias id (default: {FIRST_ID})")
+    parser.add_argument("--base", default=str(SEED_PATH), help="fixture whose rows the json format keeps")
+    parser.add_argument("--out", help="output path, or - for stdout (default: tmp/catalog/catalog-<scale>-seed<seed>.<ext>)")
+    args = parser.parse_args(argv)
+    try:
+        count = listings(args.scale)
+    except argparse.ArgumentTypeError as exc:
+        parser.error(str(exc))
+
+    if args.out == "-":
+        out, path = sys.stdout, None
+    else:
+        ext = "sql" if args.format == "copy" else "json"
+        path = args.out or OUT_DIR / f"catalog-{args.scale}-seed{args.seed}.{ext}"
+        if not args.out:
+            OUT_DIR.mkdir(parents=True, exist_ok=True)
+        out = open(path, "w", encoding="utf-8", newline="\n")
+
+    started = time.perf_counter()
+    try:
+        if args.format == "copy":
+            counts = write_copy(out, args.seed, count, args.first_id)
+        else:
+            counts = write_json(out, args.seed, count, load_seed(args.base), args.first_id)
+    finally:
+        if path is not None:
+            out.close()
+
+    summary = ", ".join(f"{rows} {table}" for table, rows in counts.items())
+    print(f"{summary} in {time.perf_counter() - started:.1f}s" + (f" -> {path}" if path else ""), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
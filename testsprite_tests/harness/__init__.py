@@ -0,0 +1,23 @@
+"""Shared runtime for the TestSprite TC scripts."""
+
+from .assertions import expect_all
+from .pool import BASE_URL, BrowserPool, build_pool, open_app, run_standalone
+from .suite import TestCase, discover_cases, run_case
+from .tracing import expect, tracer_for
+from .waits import Steps, ledger_for
+
+__all__ = [
+    "BASE_URL",
+    "BrowserPool",
+    "Steps",
+    "TestCase",
+    "build_pool",
+    "discover_cases",
+    "expect",
+    "expect_all",
+    "ledger_for",
+    "open_app",
+    "run_case",
+    "run_standalone",
+    "tracer_for",
+]
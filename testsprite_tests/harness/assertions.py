@@ -0,0 +1,116 @@
+"""Batched visibility assertions, checked in one in-page evaluation.
+
+A run of `expect(frame.locator('text=...').first).to_be_visible()` calls
+costs a browser round trip each, and the first missing string holds up the
+rest for its whole timeout. `expect_all` sends every expectation in a
+single evaluation that re-checks them on each DOM mutation (and at least
+every `POLL_MS`) until all pass or the deadline expires, then reports every
+failure at once.
+
+Text expectations follow Playwright's `text=...` selector: case-insensitive
+substring match on whitespace-normalised text, against the innermost
+elements that contain it, and like `.first` only the first of those in
+document order decides. Visible means a non-empty box and no
+`visibility: hidden`, as in Playwright.
+"""
+
+import time
+
+from playwright import async_api
+
+from .tracing import tracer_for
+
+DEFAULT_TIMEOUT = 30000
+POLL_MS = 100
+
+_CHECK_SCRIPT = """
+({ checks, timeoutMs, pollMs }) => new Promise((resolve) => {
+    const norm = (s) => (s || '').replace(/\\s+/g, ' ').trim().toLowerCase();
+    const SKIP = new Set(['SCRIPT', 'STYLE', 'NOSCRIPT', 'TEMPLATE']);
+    const isVisible = (el) => {
+        const box = el.getBoundingClientRect();
+        return box.width > 0 && box.height > 0 && getComputedStyle(el).visibility !== 'hidden';
+    };
+    const evaluate = () => {
+        const elements = Array.from(document.body ? document.body.querySelectorAll('*') : [])
+            .filter((el) => !SKIP.has(el.tagName));
+        const texts = new Map();
+        const textOf = (el) => {
+            if (!texts.has(el)) texts.set(el, norm(el.textContent));
+            return texts.get(el);
+        };
+        const firstText = (needle) => elements.find((el) => textOf(el).includes(needle)
+            && !Array.from(el.children).some((child) => textOf(child).includes(needle)));
+        const failures = [];
+        checks.forEach((check, index) => {
+            const el = check.kind === 'css' ? document.querySelector(check.value) : firstText(norm(check.value));
+            const shown = !!el && isVisible(el);
+            if (shown !== check.visible) {
+                failures.push({ index, found: !!el });
+            }
+        });
+        return failures;
+    };
+    let failures = evaluate();
+    if (!failures.length) return resolve(failures);
+    const finish = () => {
+        observer.disconnect();
+        clearInterval(poll);
+        clearTimeout(limit);
+        resolve(failures);
+    };
+    const recheck = () => {
+        failures = evaluate();
+        if (!failures.length) finish();
+    };
+    const observer = new MutationObserver(recheck);
+    observer.observe(document, { subtree: true, childList: true, attributes: true, characterData: true });
+    // Layout-only changes (viewport, fonts, CSS animations) do not mutate the DOM.
+    const poll = setInterval(recheck, pollMs);
+    const limit = setTimeout(finish, timeoutMs);
+})
+"""
+
+
+def _describe(check, found):
+    what = f"element {check['value']!r}" if check["kind"] == "css" else f"text {check['value']!r}"
+    if check["visible"]:
+        return f"{what} not visible" + ("" if found else " (not found)")
+    return f"{what} still visible"
+
+
+async def expect_all(target, texts=(), hidden_texts=(), css=(), timeout=DEFAULT_TIMEOUT, message=None):
+    """Assert that `texts` and `css` selectors are visible and `hidden_texts` are not.
+
+    `target` is a page or frame. Raises one AssertionError listing every
+    expectation still unmet after `timeout` ms, prefixed with `message`.
+    """
+    checks = (
+        [{"kind": "text", "value": t, "visible": True} for t in texts]
+        + [{"kind": "text", "value": t, "visible": False} for t in hidden_texts]
+        + [{"kind": "css", "value": s, "visible": True} for s in css]
+    )
+    if not checks:
+        return
+    page = getattr(target, "page", target)
+    tracer = tracer_for(page.context)
+    deadline = time.monotonic() + timeout / 1000
+    async with tracer.span("expect.all", selector=f"{len(checks)} checks") as span:
+        while True:
+            remaining = max(0, int((deadline - time.monotonic()) * 1000))
+            try:
+                failures = await target.evaluate(
+                    _CHECK_SCRIPT, {"checks": checks, "timeoutMs": remaining, "pollMs": POLL_MS},
+                )
+                break
+            except async_api.Error:
+                # A navigation replaced the document mid-check; start over
+                # on the new one with whatever time is left.
+                if time.monotonic() >= deadline:
+                    raise
+                await page.wait_for_load_state("domcontentloaded")
+        span["failed"] = len(failures)
+    if failures:
+        lines = [_describe(checks[f["index"]], f["found"]) for f in failures]
+        summary = f"{len(failures)} of {len(checks)} expectations failed after {timeout} ms:"
+        raise AssertionError("\n  ".join([f"{message}\n{summary}" if message else summary, *lines]))
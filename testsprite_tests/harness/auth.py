@@ -0,0 +1,40 @@
+"""Admin session bootstrap: log in through the UI once, reuse storage state.
+
+The portal keeps the admin session in localStorage, so a Playwright
+`storage_state` snapshot taken right after one UI login lets every other
+context start already authenticated. Test cases opt in with a module-level
+``SESSION = "admin"``; the ones that test the login flow itself (TC004,
+TC015) keep logging in through the UI.
+"""
+
+from .registry import resolve
+from .suite import TESTS_DIR
+
+ADMIN_EMAIL = "quallity@admin.com"
+ADMIN_PASSWORD = "1234"
+
+STATE_DIR = TESTS_DIR / "tmp" / "auth"
+
+SESSIONS = ("admin",)
+
+
+async def login_admin(page, email=ADMIN_EMAIL, password=ADMIN_PASSWORD):
+    """Log in on the admin login page and wait until the session is stored."""
+    await (await resolve(page, "admin_login.email")).fill(email)
+    await (await resolve(page, "admin_login.password")).fill(password)
+    await (await resolve(page, "admin_login.submit")).click()
+    await page.wait_for_function("localStorage.getItem('adminLoggedIn') === 'true'")
+
+
+async def save_session(context, name, base_url, path=None):
+    """Log in as `name` in `context` and write its storage state to disk."""
+    if name not in SESSIONS:
+        raise ValueError(f"unknown session {name!r}, expected one of {SESSIONS}")
+    path = path or STATE_DIR / f"{name}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    page = await context.new_page()
+    await page.goto(f"{base_url}/#adminLogin", wait_until="domcontentloaded")
+    await login_admin(page)
+    await context.storage_state(path=str(path))
+    await page.close()
+    return path
@@ -0,0 +1,314 @@
+"""Synthetic property catalog for scale tests: perfis, imoveis, midias_imovel.
+
+Every row is derived from `(seed, table, index)` alone: each one gets its
+own `random.Random` seeded with that key. Any row can be regenerated
+without the rows before it, so the same seed always yields the same
+catalog, and the media of a property can be written long after the
+property itself without keeping anything in memory.
+
+Two output formats, both streamed row by row:
+
+* ``copy``: a psql script with one `COPY ... FROM stdin` block per table
+  (PostgreSQL text format), then `setval` on the id sequences;
+* ``json``: a fixture for `supabase_stub.py --seed`. It keeps the rows of
+  the base fixture, so the admin login and the seeded listings still work
+  next to the synthetic ones.
+
+Ids start at `FIRST_ID` so that loading into a database that already
+holds the real catalog cannot collide with it.
+"""
+
+import itertools
+import json
+import math
+import random
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from .supabase_stub import SUPABASE_URL
+
+SCALES = {"1k": 1_000, "10k": 10_000, "100k": 100_000}
+FIRST_ID = 1_000_001
+# Listings per advertiser, on average.
+LISTINGS_PER_PROFILE = 25
+
+# Publication dates are spread over the two years before this instant,
+# not before "now", so output does not depend on when it was generated.
+EPOCH = datetime(2025, 10, 1, tzinfo=timezone.utc)
+
+IMOVEIS_COLUMNS = (
+    "id", "anunciante_id", "titulo", "descricao", "endereco_completo", "cidade", "rua", "numero",
+    "latitude", "longitude", "preco", "tipo_operacao", "tipo_imovel", "quartos", "banheiros",
+    "area_bruta", "area_util", "possui_elevador", "taxa_condominio", "valor_iptu",
+    "caracteristicas_imovel", "caracteristicas_condominio", "aceita_financiamento", "permite_animais",
+    "minimo_diarias", "maximo_hospedes", "taxa_limpeza", "topografia", "zoneamento", "murado",
+    "em_condominio", "status", "data_publicacao",
+)
+MIDIAS_COLUMNS = ("id", "imovel_id", "url", "tipo", "ordem")
+PERFIS_COLUMNS = ("id", "nome_completo", "url_foto_perfil", "telefone")
+
+# City and centre (lat, lng); the Recôncavo and Baixo Sul around
+# Salinas da Margarida, where the real listings are.
+CITIES = (
+    ("Salinas da Margarida", -12.8712, -38.7601),
+    ("Salvador", -12.9777, -38.5016),
+    ("Itaparica", -12.8883, -38.6789),
+    ("Vera Cruz", -12.9606, -38.6058),
+    ("Jaguaripe", -13.1128, -38.8939),
+    ("Nazaré", -13.0353, -39.0147),
+    ("Santo Antônio de Jesus", -12.9686, -39.2614),
+    ("Valença", -13.3703, -39.0731),
+    ("Cairu", -13.4878, -38.9264),
+    ("Maragogipe", -12.7778, -38.9178),
+)
+# Relative weights: most listings are in the capital and on the island.
+CITY_WEIGHTS = (6, 30, 10, 12, 4, 5, 8, 8, 9, 4)
+
+STREETS = (
+    "Rua da Praia", "Rua Direita", "Avenida Beira Mar", "Rua do Sol", "Travessa das Flores",
+    "Rua Sete de Setembro", "Avenida Oceânica", "Rua Castro Alves", "Rua da Matriz",
+    "Rua Barão do Rio Branco", "Estrada do Coco", "Rua das Mangueiras", "Alameda dos Coqueiros",
+    "Rua Rui Barbosa", "Avenida Getúlio Vargas", "Rua Nova", "Ladeira do Porto",
+)
+
+# Type, weight, (min, max) gross area in m².
+TYPES = (("Casa", 40, (60, 450)), ("Apartamento", 40, (35, 220)), ("Terreno", 20, (200, 2000)))
+# Operation, weight.
+OPERATIONS = (("venda", 65), ("aluguel", 25), ("temporada", 10))
+
+HOME_FEATURES = (
+    "builtInWardrobes", "airConditioning", "terrace", "balcony", "garage", "mobiliado",
+    "cozinhaEquipada", "suite", "escritorio",
+)
+BUILDING_FEATURES = (
+    "pool", "greenArea", "portaria24h", "academia", "salaoDeFestas", "churrasqueira",
+    "parqueInfantil", "quadraEsportiva", "sauna", "espacoGourmet",
+)
+
+FIRST_NAMES = (
+    "Ana", "João", "Maria", "José", "Carla", "Paulo", "Fernanda", "Lucas", "Juliana", "Rafael",
+    "Patrícia", "Marcos", "Aline", "Bruno", "Camila", "Diego", "Larissa", "Tiago", "Beatriz", "Rodrigo",
+)
+LAST_NAMES = (
+    "Silva", "Santos", "Oliveira", "Souza", "Lima", "Pereira", "Costa", "Ferreira", "Almeida",
+    "Ribeiro", "Carvalho", "Gomes", "Barbosa", "Rocha", "Nascimento", "Araújo",
+)
+AGENCY_SUFFIXES = ("Imóveis", "Negócios Imobiliários", "Corretora", "Consultoria Imobiliária")
+
+# (masculine, feminine): "Apartamento Amplo", "Casa Ampla".
+ADJECTIVES = (
+    ("Aconchegante", "Aconchegante"), ("Amplo", "Ampla"), ("Reformado", "Reformada"), ("Novo", "Nova"),
+    ("Exclusivo", "Exclusiva"), ("Charmoso", "Charmosa"), ("Arejado", "Arejada"),
+    ("Bem Localizado", "Bem Localizada"), ("Espaçoso", "Espaçosa"), ("com Vista para o Mar", "com Vista para o Mar"),
+)
+HIGHLIGHTS = (
+    "próximo ao comércio e à praia", "em rua tranquila e arborizada", "a poucos minutos do centro",
+    "com ótima ventilação natural", "em região de alta valorização", "perto de escolas e mercados",
+    "com acesso fácil à BA-001", "em bairro residencial",
+)
+
+
+def _rng(seed, table, index):
+    return random.Random(f"{seed}:{table}:{index}")
+
+
+def _uuid(rng):
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
+def _weighted(rng, options):
+    return rng.choices([o[0] for o in options], weights=[o[1] for o in options])[0]
+
+
+def profile_count(listings):
+    return max(1, listings // LISTINGS_PER_PROFILE)
+
+
+def profile_id(seed, index):
+    return _uuid(_rng(seed, "perfis", index))
+
+
+def perfil(seed, index):
+    rng = _rng(seed, "perfis", index)
+    # Drawn first so that profile_id() reproduces it.
+    id_ = _uuid(rng)
+    person = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    # Roughly one advertiser in five is an agency rather than a person.
+    name = f"{rng.choice(LAST_NAMES)} {rng.choice(AGENCY_SUFFIXES)}" if rng.random() < 0.2 else person
+    return {
+        "id": id_,
+        "nome_completo": name,
+        "url_foto_perfil": None,
+        "telefone": f"(71) 9{rng.randint(8000, 9999)}-{rng.randint(0, 9999):04d}",
+    }
+
+
+def _price(rng, operation, kind, area):
+    if operation == "aluguel":
+        return int(round(rng.lognormvariate(math.log(1800), 0.5), -1))
+    if operation == "temporada":
+        return int(round(rng.lognormvariate(math.log(350), 0.6), -1))
+    per_m2 = {"Casa": 2800, "Apartamento": 4200, "Terreno": 350}[kind]
+    return int(round(area * per_m2 * rng.lognormvariate(0, 0.35), -3))
+
+
+def imovel(seed, index, profiles, first_id=FIRST_ID):
+    """Row `index` of imoveis; `profiles` is how many perfis the catalog has."""
+    rng = _rng(seed, "imoveis", index)
+    city_index = rng.choices(range(len(CITIES)), weights=CITY_WEIGHTS)[0]
+    city, lat, lng = CITIES[city_index]
+    street, number = rng.choice(STREETS), str(rng.randint(1, 2500))
+    kind = _weighted(rng, TYPES)
+    operation = _weighted(rng, OPERATIONS)
+    low, high = dict((t[0], t[2]) for t in TYPES)[kind]
+    area = rng.randint(low, high)
+    land = kind == "Terreno"
+    flat = kind == "Apartamento"
+    bedrooms = 0 if land else min(6, max(1, round(rng.gauss(area / 60, 1))))
+    features = [] if land else sorted(rng.sample(HOME_FEATURES, rng.randint(0, 5)))
+    building = sorted(rng.sample(BUILDING_FEATURES, rng.randint(1, 6))) if flat or rng.random() < 0.3 else []
+    published = EPOCH - timedelta(seconds=rng.randint(0, 2 * 365 * 24 * 3600))
+    adjective = rng.choice(ADJECTIVES)[1 if kind == "Casa" else 0]
+    financing = (rng.random() < 0.5) if operation == "venda" else None
+    return {
+        "id": first_id + index,
+        "anunciante_id": profile_id(seed, rng.randrange(profiles)),
+        "titulo": f"{kind} {adjective} em {city}" if not land else f"Terreno de {area}m² em {city}",
+        "descricao": (
+            f"{kind} {'com ' + str(bedrooms) + ' quarto(s), ' if bedrooms else ''}"
+            f"{area} m², {rng.choice(HIGHLIGHTS)}. "
+            f"{'Aceita financiamento. ' if financing else ''}"
+            f"Agende sua visita."
+        ),
+        "endereco_completo": f"{street}, {number} - {city}, BA",
+        "cidade": city,
+        "rua": street,
+        "numero": number,
+        "latitude": round(lat + rng.gauss(0, 0.015), 6),
+        "longitude": round(lng + rng.gauss(0, 0.015), 6),
+        "preco": _price(rng, operation, kind, area),
+        "tipo_operacao": operation,
+        "tipo_imovel": kind,
+        "quartos": bedrooms,
+        "banheiros": 0 if land else max(1, bedrooms - rng.randint(0, 1)),
+        "area_bruta": area,
+        "area_util": None if land else round(area * rng.uniform(0.7, 0.95)),
+        "possui_elevador": (rng.random() < 0.6) if flat else None,
+        "taxa_condominio": int(round(rng.uniform(150, 1200), -1)) if flat else None,
+        "valor_iptu": int(round(area * rng.uniform(2, 9), -1)),
+        "caracteristicas_imovel": features,
+        "caracteristicas_condominio": building,
+        "aceita_financiamento": financing,
+        "permite_animais": (rng.random() < 0.5) if operation != "venda" else None,
+        "minimo_diarias": rng.randint(1, 4) if operation == "temporada" else None,
+        "maximo_hospedes": max(2, bedrooms * 2) if operation == "temporada" else None,
+        "taxa_limpeza": int(round(rng.uniform(80, 300), -1)) if operation == "temporada" else None,
+        "topografia": rng.choice(("plano", "aclive", "declive", "irregular")) if land else None,
+        "zoneamento": rng.choice(("residencial", "comercial", "misto")) if land else None,
+        "murado": (rng.random() < 0.5) if land else None,
+        "em_condominio": (rng.random() < 0.3) if land else None,
+        "status": "ativo" if rng.random() < 0.92 else "inativo",
+        "data_publicacao": published.isoformat(),
+    }
+
+
+def midias(seed, index, first_id=FIRST_ID):
+    """Media rows of property `index`, without their ids."""
+    rng = _rng(seed, "midias_imovel", index)
+    property_id = first_id + index
+    base = f"{SUPABASE_URL}/storage/v1/object/public/midia/seed/{property_id}"
+    rows = [
+        {"imovel_id": property_id, "url": f"{base}/{order}.jpg", "tipo": "imagem", "ordem": order}
+        for order in range(rng.randint(1, 8))
+    ]
+    if rng.random() < 0.1:
+        rows.append({"imovel_id": property_id, "url": f"{base}/tour.mp4", "tipo": "video", "ordem": len(rows)})
+    return rows
+
+
+def iter_perfis(seed, listings):
+    for index in range(profile_count(listings)):
+        yield perfil(seed, index)
+
+
+def iter_imoveis(seed, listings, first_id=FIRST_ID):
+    profiles = profile_count(listings)
+    for index in range(listings):
+        yield imovel(seed, index, profiles, first_id)
+
+
+def iter_midias(seed, listings, first_id=FIRST_ID):
+    media_id = first_id
+    for index in range(listings):
+        for row in midias(seed, index, first_id):
+            yield {"id": media_id, **row}
+            media_id += 1
+
+
+def _copy_value(value):
+    if value is None:
+        return r"\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, list):
+        # text[] literal; the feature keys need no quoting.
+        return "{" + ",".join(value) + "}"
+    text = str(value)
+    return text.replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+
+
+def _copy_block(out, table, columns, rows):
+    out.write(f"COPY public.{table} ({', '.join(columns)}) FROM stdin;\n")
+    count = 0
+    for row in rows:
+        out.write("\t".join(_copy_value(row[c]) for c in columns) + "\n")
+        count += 1
+    out.write("\\.\n\n")
+    return count
+
+
+def write_copy(out, seed, listings, first_id=FIRST_ID):
+    """Write the catalog to `out` as a psql script; returns rows per table."""
+    out.write(f"-- Synthetic catalog: {listings} listings, seed {seed!r} (testsprite_tests/generate_catalog.py)\n")
+    out.write("BEGIN;\n\n")
+    counts = {
+        "perfis": _copy_block(out, "perfis", PERFIS_COLUMNS, iter_perfis(seed, listings)),
+        "imoveis": _copy_block(out, "imoveis", IMOVEIS_COLUMNS, iter_imoveis(seed, listings, first_id)),
+        "midias_imovel": _copy_block(out, "midias_imovel", MIDIAS_COLUMNS, iter_midias(seed, listings, first_id)),
+    }
+    for table in ("imoveis", "midias_imovel"):
+        out.write(f"SELECT setval(pg_get_serial_sequence('public.{table}', 'id'),"
+                  f" (SELECT max(id) FROM public.{table}));\n")
+    out.write("\nCOMMIT;\n")
+    return counts
+
+
+def _json_array(out, rows):
+    out.write("[")
+    count = 0
+    for row in rows:
+        out.write(",\n  " if count else "\n  ")
+        out.write(json.dumps(row, ensure_ascii=False))
+        count += 1
+    out.write("\n]" if count else "]")
+    return count
+
+
+def write_json(out, seed, listings, base, first_id=FIRST_ID):
+    """Write a supabase_stub fixture: `base` rows followed by the catalog."""
+    generated = {
+        "perfis": iter_perfis(seed, listings),
+        "imoveis": iter_imoveis(seed, listings, first_id),
+        "midias_imovel": iter_midias(seed, listings, first_id),
+    }
+    counts = {}
+    out.write("{")
+    for position, table in enumerate(dict.fromkeys([*base, *generated])):
+        out.write(f"{',' if position else ''}\n{json.dumps(table)}: ")
+        rows = base.get(table, [])
+        if table in generated:
+            rows = itertools.chain(rows, generated[table])
+        counts[table] = _json_array(out, rows)
+    out.write("\n}\n")
+    return counts
+
@@ -0,0 +1,154 @@
+"""Device profiles: viewport, touch, CPU throttling and network emulation.
+
+A profile is applied to a fresh context (viewport, scale factor, touch,
+mobile user agent), then to its page over CDP before the first navigation:
+`Emulation.setCPUThrottlingRate` slows the renderer's main thread and
+`Network.emulateNetworkConditions` adds latency and caps throughput.
+
+Responses fulfilled by Playwright routes (the Supabase stub, the network
+cache) do not go through the network stack, so only CPU throttling
+applies to them; run against the hosted backend for full network effects.
+"""
+
+import time
+from dataclasses import dataclass, field
+
+from playwright import async_api
+
+from .assertions import expect_all
+from .pool import BASE_URL
+from .registry import resolve
+from .vitals import collect_vitals, install_observers
+from .waits import Steps
+
+# Chrome DevTools' throttling presets: latency in ms, throughput in bytes/s.
+NETWORK_CONDITIONS = {
+    "none": None,
+    "fast-3g": {"latency": 562.5, "downloadThroughput": 1.6 * 1024 * 1024 / 8 * 0.9,
+                "uploadThroughput": 750 * 1024 / 8 * 0.9},
+    "slow-3g": {"latency": 2000, "downloadThroughput": 500 * 1024 / 8 * 0.8,
+                "uploadThroughput": 500 * 1024 / 8 * 0.8},
+}
+
+# A mid-range Android phone, as Lighthouse's mobile preset assumes.
+MOBILE_USER_AGENT = (
+    "Mozilla/5.0 (Linux; Android 11; moto g power (2022)) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Mobile Safari/537.36"
+)
+TABLET_USER_AGENT = (
+    "Mozilla/5.0 (Linux; Android 13; SM-X200) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+
+@dataclass(frozen=True)
+class DeviceProfile:
+    name: str
+    viewport: dict
+    cpu_throttle: float = 1
+    network: str = "none"
+    context_options: dict = field(default_factory=dict)
+    # Registry names clicked in order to switch to English; only the last is timed
+    language_switch: tuple = ("header.language_switcher", "header.language_option_en")
+
+    def new_context_options(self):
+        return {"viewport": self.viewport, **self.context_options}
+
+
+_MOBILE = {"device_scale_factor": 2.625, "is_mobile": True, "has_touch": True, "user_agent": MOBILE_USER_AGENT}
+_TABLET = {"device_scale_factor": 2, "is_mobile": True, "has_touch": True, "user_agent": TABLET_USER_AGENT}
+
+# The header's dropdown is hidden below md (768 px); phones pick the
+# language from the hamburger menu instead.
+_MOBILE_LANGUAGE_SWITCH = ("header.mobile_menu", "header.mobile_language", "header.mobile_language_en")
+
+# CPU and network are split over two mobile profiles so each effect shows
+# on its own before they are combined.
+PROFILES = (
+    DeviceProfile("desktop", {"width": 1280, "height": 720}),
+    DeviceProfile("tablet", {"width": 800, "height": 1280}, 4, "fast-3g", _TABLET),
+    DeviceProfile("mobile-cpu4x", {"width": 412, "height": 823}, 4, "none", _MOBILE,
+                  _MOBILE_LANGUAGE_SWITCH),
+    DeviceProfile("mobile-slow3g", {"width": 412, "height": 823}, 4, "slow-3g", _MOBILE,
+                  _MOBILE_LANGUAGE_SWITCH),
+)
+
+# Home page text that only renders once the language is English.
+SWITCHED_TEXT = "Dream home? Find it here."
+
+
+async def emulate(context, page, profile):
+    """Apply the CPU and network throttling of `profile` to `page`."""
+    session = await context.new_cdp_session(page)
+    if profile.cpu_throttle > 1:
+        await session.send("Emulation.setCPUThrottlingRate", {"rate": profile.cpu_throttle})
+    conditions = NETWORK_CONDITIONS[profile.network]
+    if conditions:
+        await session.send("Network.enable")
+        await session.send("Network.emulateNetworkConditions", {"offline": False, **conditions})
+    return session
+
+
+_NAVIGATION_SCRIPT = """
+() => {
+    const nav = performance.getEntriesByType('navigation')[0];
+    return nav ? { ttfbMs: nav.responseStart, domContentLoadedMs: nav.domContentLoadedEventEnd,
+                   loadMs: nav.loadEventEnd } : {};
+}
+"""
+
+
+async def run_profile(pool, profile, texts, interaction=None, url=BASE_URL, timeout=60000):
+    """Load the home page under `profile`, check `texts`, time one interaction.
+
+    `interaction` is a registry name or a sequence of them to click, by
+    default the profile's `language_switch`; the clicks before the last
+    only open menus and are not timed. Returns a sample with navigation and render timing,
+    how long until every text was visible, the last click's latency, and
+    any failures. A failure is recorded rather than raised, so one profile
+    cannot hide the others.
+    """
+    if isinstance(interaction, str):
+        interaction = (interaction,)
+    interaction = tuple(interaction or profile.language_switch)
+    sample = {"profile": profile.name, "cpuThrottle": profile.cpu_throttle, "network": profile.network,
+              "viewport": profile.viewport, "failures": []}
+    async with pool.context(**profile.new_context_options()) as context:
+        await install_observers(context)
+        page = await context.new_page()
+        await emulate(context, page, profile)
+        started = time.perf_counter()
+        try:
+            await page.goto(url, wait_until="domcontentloaded", timeout=timeout)
+            await expect_all(page, texts=texts, timeout=timeout)
+        except AssertionError as exc:
+            sample["failures"].append(str(exc))
+        except async_api.Error as exc:
+            sample["failures"].append(f"load: {str(exc).splitlines()[0]}")
+        sample["textsVisibleMs"] = round((time.perf_counter() - started) * 1000, 1)
+        sample.update(await page.evaluate(_NAVIGATION_SCRIPT))
+        load = await collect_vitals(page)
+        sample.update(fcpMs=load["fcpMs"], lcpMs=load["lcpMs"], cls=load["cls"], tbtMs=load["tbtMs"],
+                      longTaskCount=load["longTaskCount"])
+
+        steps = Steps(page)
+        sample["interactionMs"] = sample["inpMs"] = None
+        try:
+            for name in interaction[:-1]:
+                await (await resolve(page, name)).click(timeout=timeout)
+            await steps.settle()
+            name = interaction[-1]
+            since = await page.evaluate("performance.now()")
+            started = time.perf_counter()
+            await (await resolve(page, name)).click(timeout=timeout)
+            await steps.settle()
+            sample["interactionMs"] = round((time.perf_counter() - started) * 1000, 1)
+            sample["inpMs"] = (await collect_vitals(page, since))["inpMs"]
+            if interaction == profile.language_switch:
+                await expect_all(page, texts=[SWITCHED_TEXT], timeout=timeout,
+                                 message=f"{name} did not switch the language")
+        except AssertionError as exc:
+            sample["failures"].append(str(exc))
+        except async_api.Error as exc:
+            sample["failures"].append(f"{name}: {str(exc).splitlines()[0]}")
+    return sample
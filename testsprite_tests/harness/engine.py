@@ -0,0 +1,279 @@
+"""Run the test plan as a step graph, executing shared prefixes once.
+
+Every TC script follows the same shape: open the app, run a list of
+generated steps, then assert. `compile_case` splits a script into those
+parts (with `loops.split_steps`) and compiles each step into its own
+coroutine, keeping the script's globals. `build_graph` merges the step
+lists of all cases into a prefix tree, one per starting session, so the
+"Publicar Imóvel" -> "Acessar Painel Administrativo" opening shared by
+TC003, TC005 and TC008 becomes one path that the cases fork from.
+
+At a fork, the engine snapshots the context's storage state and the page
+URL, and each extra branch continues in a new context restored from that
+snapshot. Restoring only brings back what the URL and storage hold, not
+transient DOM state such as an open menu, so the restored page is checked
+against a fingerprint of the original (URL, title, headings, dialogs). If it
+does not match, that branch replays the shared prefix itself. That costs the
+savings, never correctness.
+
+Scripts that do not start with the standard `open_app` head (TC001 measures
+its own load) run whole, as `run_case` would.
+"""
+
+import ast
+import re
+import time
+import traceback
+from dataclasses import dataclass, field
+
+from .loops import split_steps
+from .pool import open_app
+from .results import load_plan
+from .suite import run_case
+from .waits import Steps
+
+_STANDARD_HEAD = "page = await open_app(context)\nsteps = Steps(page)"
+
+_LOCATE = re.compile(r"steps\.locate\('([^']+)'")
+
+_FINGERPRINT_SCRIPT = """
+() => [
+    location.href,
+    document.title,
+    ...Array.from(document.querySelectorAll('h1, h2, h3, [role="dialog"]'), (e) => e.textContent.trim()),
+].join('\\n')
+"""
+
+
+@dataclass
+class CompiledCase:
+    case: object
+    title: str
+    session: object = None
+    # (signature, coroutine function) per step; the function takes
+    # (context, page, steps) like the body of run_test does.
+    steps: list = field(default_factory=list)
+    tail: object = None
+    module: object = None
+
+    @property
+    def opaque(self):
+        return self.tail is None
+
+
+def _compile(statements, filename, globals_):
+    template = ast.parse("async def _step(context, page, steps):\n    pass")
+    template.body[0].body = statements or [ast.Pass(lineno=1, col_offset=4)]
+    ast.fix_missing_locations(template)
+    namespace = {}
+    exec(compile(template, filename, "exec"), globals_, namespace)
+    return namespace["_step"]
+
+
+def compile_case(case, plan=None):
+    """Split a TC script into head, step coroutines and assertion tail."""
+    module = case.load()
+    title = (plan or {}).get(case.id, {}).get("title", case.title)
+    compiled = CompiledCase(case, title, getattr(module, "SESSION", None), module=module)
+
+    source = case.path.read_text(encoding="utf-8")
+    tree = ast.parse(source)
+    run_test = next(
+        (n for n in tree.body if isinstance(n, ast.AsyncFunctionDef) and n.name == "run_test"), None,
+    )
+    if run_test is None:
+        return compiled
+    parsed = split_steps(source)
+    first_line = parsed[0].statements[0].lineno if parsed else None
+    last_line = parsed[-1].end if parsed else None
+    head = [s for s in run_test.body if first_line is None or s.end_lineno < first_line]
+    if parsed:
+        tail = [s for s in run_test.body if s.lineno > last_line]
+    else:
+        # No generated steps: everything after the head is assertions.
+        head, tail = run_test.body[:2], run_test.body[2:]
+    if "\n".join(ast.unparse(s) for s in head) != _STANDARD_HEAD:
+        return compiled
+
+    filename = str(case.path)
+    compiled.steps = [(step.signature, _compile(step.statements, filename, vars(module))) for step in parsed]
+    compiled.tail = _compile(tail, filename, vars(module))
+    return compiled
+
+
+class _Node:
+    def __init__(self, signature=None, run=None, parent=None):
+        self.signature = signature
+        self.run = run
+        self.parent = parent
+        self.children = {}
+        self.cases = []
+
+    def path(self):
+        node, path = self, []
+        while node.parent is not None:
+            path.append(node)
+            node = node.parent
+        return path[::-1]
+
+    def leaves(self):
+        found = list(self.cases)
+        for child in self.children.values():
+            found.extend(child.leaves())
+        return found
+
+
+def build_graph(compiled):
+    """Merge the cases' steps into one prefix tree per starting session."""
+    roots = {}
+    for case in compiled:
+        node = roots.setdefault(case.session, _Node())
+        for signature, run in case.steps:
+            child = node.children.get(signature)
+            if child is None:
+                child = node.children[signature] = _Node(signature, run, node)
+            node = child
+        node.cases.append(case)
+    return roots
+
+
+def step_label(signature):
+    """Short label for a step: the action plus its registry name, if any."""
+    action = signature.splitlines()[-1].strip()
+    match = _LOCATE.search(signature)
+    if match:
+        verb = re.search(r"steps\.(\w+)\(", action)
+        return f"{verb.group(1) if verb else action} {match.group(1)}"
+    return action
+
+
+def describe_graph(roots):
+    """Text rendering of the graph: shared steps and where each case forks."""
+    lines = []
+
+    def walk(node, depth):
+        for child in node.children.values():
+            leaves = child.leaves()
+            label = step_label(child.signature)
+            shared = f"  x{len(leaves)}" if len(leaves) > 1 else ""
+            lines.append(f"{'  ' * depth}- {label}{shared}")
+            walk(child, depth + 1)
+        for case in node.cases:
+            lines.append(f"{'  ' * depth}* {case.case.id} {case.title}")
+
+    for session, root in roots.items():
+        lines.append(f"[{session or 'logged out'}]")
+        walk(root, 1)
+    return "\n".join(lines)
+
+
+def count_steps(roots):
+    """Return `(steps executed by the graph, steps the scripts contain)`."""
+    graph = scripts = 0
+    stack = list(roots.values())
+    while stack:
+        node = stack.pop()
+        for child in node.children.values():
+            graph += 1
+            scripts += len(child.leaves())
+            stack.append(child)
+    return graph, scripts
+
+
+def _result(case, status, error, duration):
+    return {
+        "id": case.case.id,
+        "title": case.case.title,
+        "testStatus": status,
+        "testError": error,
+        "duration": round(duration, 3),
+        "waits": None,
+        "selectors": [],
+    }
+
+
+def _failure(exc):
+    if isinstance(exc, AssertionError):
+        return str(exc) or "AssertionError"
+    return traceback.format_exc(limit=3)
+
+
+class PlanEngine:
+    """Execute the step graph of a set of test cases on a `BrowserPool`."""
+
+    def __init__(self, pool, on_result=None):
+        self.pool = pool
+        self.on_result = on_result
+        self.results = []
+        self.forks = 0
+        self.replays = 0
+
+    def _finish(self, result):
+        self.results.append(result)
+        if self.on_result:
+            self.on_result(result)
+
+    async def run(self, cases):
+        plan = load_plan()
+        compiled = [compile_case(case, plan) for case in cases]
+        for case in (c for c in compiled if c.opaque):
+            self._finish(await run_case(self.pool, case.case))
+        for session, root in build_graph([c for c in compiled if not c.opaque]).items():
+            async with self.pool.context(session=session) as context:
+                page = await open_app(context)
+                await self._walk(root, context, page, Steps(page), 0.0)
+        return sorted(self.results, key=lambda r: r["id"])
+
+    async def _walk(self, node, context, page, steps, elapsed):
+        branches = list(node.cases) + list(node.children.values())
+        snapshot = None
+        if len(branches) > 1:
+            snapshot = {
+                "state": await context.storage_state(),
+                "url": page.url,
+                "fingerprint": await page.evaluate(_FINGERPRINT_SCRIPT),
+            }
+        # Every branch but the last gets a restored copy; the last one
+        # carries on in this context.
+        for index, branch in enumerate(branches):
+            if index == len(branches) - 1:
+                await self._branch(branch, context, page, steps, elapsed)
+                continue
+            self.forks += 1
+            async with self.pool.context(storage_state=snapshot["state"]) as fork:
+                fork_page, fork_steps, fork_elapsed = await self._restore(fork, node, snapshot, elapsed)
+                await self._branch(branch, fork, fork_page, fork_steps, fork_elapsed)
+
+    async def _restore(self, context, node, snapshot, elapsed):
+        page = await open_app(context, snapshot["url"])
+        steps = Steps(page)
+        await steps.settle()
+        if await page.evaluate(_FINGERPRINT_SCRIPT) == snapshot["fingerprint"]:
+            return page, steps, elapsed
+        # The snapshot did not bring the page back; replay the prefix.
+        self.replays += 1
+        await page.close()
+        page = await open_app(context)
+        steps = Steps(page)
+        for step in node.path():
+            await step.run(context, page, steps)
+        return page, steps, elapsed
+
+    async def _branch(self, branch, context, page, steps, elapsed):
+        started = time.perf_counter()
+        if isinstance(branch, CompiledCase):
+            try:
+                await branch.tail(context, page, steps)
+                status, error = "PASSED", None
+            except Exception as exc:
+                status, error = "FAILED", _failure(exc)
+            self._finish(_result(branch, status, error, elapsed + time.perf_counter() - started))
+            return
+        try:
+            await branch.run(context, page, steps)
+        except Exception as exc:
+            error = f"shared step failed: {step_label(branch.signature)}\n{_failure(exc)}"
+            for case in branch.leaves():
+                self._finish(_result(case, "FAILED", error, elapsed + time.perf_counter() - started))
+            return
+        await self._walk(branch, context, page, steps, elapsed + time.perf_counter() - started)
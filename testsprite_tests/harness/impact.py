@@ -0,0 +1,228 @@
+"""Change-impact selection: run only the test cases a diff can affect.
+
+With `--record-impact`, the runner collects per-function JS coverage over
+CDP for every test case. Under the Vite dev server each source file is its
+own module script, so a covered script URL names the file it came from. A
+file counts as exercised by a case when one of its functions ran, beyond
+the module body that every static import evaluates. Otherwise App.tsx's
+imports (every page, through the components barrel) would tie every
+component to every test case. Modules with no functions of their own
+(config.ts, locale tables) are pure module side effects and count as soon
+as they are loaded. The mapping is cached in `tmp/impact/map.json`, one
+entry per case.
+
+`select_cases` turns a list of changed files into the cases to run:
+
+* a changed TC script selects itself;
+* a changed app file selects the cases that exercised it. If a mapped case
+  loaded it but none exercised it, nothing needs to run for it;
+* harness, build configuration and any other file the mapping cannot
+  place select every case, as do cases that have no mapping yet;
+* documentation and generated output are ignored.
+"""
+
+import asyncio
+import fnmatch
+import hashlib
+import json
+import os
+import subprocess
+import weakref
+from datetime import datetime, timezone
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from .suite import TESTS_DIR
+
+APP_DIR = TESTS_DIR.parent
+IMPACT_DIR = TESTS_DIR / "tmp" / "impact"
+MAP_PATH = IMPACT_DIR / "map.json"
+
+# Changed files that cannot affect a browser test.
+IGNORED = (
+    "*.md",
+    "testsprite_tests/tmp/*",
+    "testsprite_tests/*.html",
+    "test_screenshots/*",
+    ".gitignore",
+    "requests.jsonl",
+)
+
+# Vite serves its own runtime and pre-bundled dependencies under these.
+_VITE_PREFIXES = ("@vite/", "@react-refresh", "@fs/", "@id/", "node_modules/")
+
+
+def source_path(url, origin):
+    """Repository-relative source file behind a dev-server script URL, or None."""
+    parts = urlsplit(url)
+    if f"{parts.scheme}://{parts.netloc}" != origin:
+        return None
+    path = parts.path.lstrip("/")
+    if not path or path.startswith(_VITE_PREFIXES):
+        return None
+    return path if (APP_DIR / path).is_file() else None
+
+
+def _exercised(script):
+    """Whether a function of a loaded ScriptCoverage entry ran.
+
+    A module without functions of its own only has side effects, which
+    ran when it was loaded.
+    """
+    functions = script.get("functions", [])
+    body = [f for f in functions if not f["functionName"] and f["ranges"][0]["startOffset"] == 0]
+    others = [f for f in functions if f not in body]
+    return not others or any(f["ranges"][0]["count"] > 0 for f in others)
+
+
+class _PageCoverage:
+    def __init__(self):
+        self.loaded = set()
+        self.exercised = set()
+        self.sessions = {}
+
+
+class JSCoverage:
+    """BrowserPool context hook that records which source files a case ran."""
+
+    name = "coverage"
+
+    def __init__(self, origin):
+        parts = urlsplit(origin)
+        self.origin = f"{parts.scheme}://{parts.netloc}"
+        self._coverage = weakref.WeakKeyDictionary()
+
+    async def __call__(self, context):
+        coverage = self._coverage[context] = _PageCoverage()
+
+        def on_page(page):
+            # Precise coverage only counts calls made after it starts. The
+            # session is up well before the dev server has sent the app's
+            # modules, so page scripts are covered from their first call.
+            coverage.sessions[page] = asyncio.ensure_future(self._start(context, page))
+
+        context.on("page", on_page)
+
+    @staticmethod
+    async def _start(context, page):
+        session = await context.new_cdp_session(page)
+        await session.send("Profiler.enable")
+        await session.send("Profiler.startPreciseCoverage", {"callCount": True, "detailed": False})
+        return session
+
+    async def report(self, context):
+        coverage = self._coverage.get(context)
+        if coverage is None:
+            return {"loaded": [], "exercised": []}
+        for pending in list(coverage.sessions.values()):
+            try:
+                session = await pending
+                taken = await session.send("Profiler.takePreciseCoverage")
+            except Exception:
+                # The page closed first; what it ran is lost.
+                continue
+            for script in taken["result"]:
+                path = source_path(script["url"], self.origin)
+                if path is None:
+                    continue
+                coverage.loaded.add(path)
+                if _exercised(script):
+                    coverage.exercised.add(path)
+        return {"loaded": sorted(coverage.loaded), "exercised": sorted(coverage.exercised)}
+
+
+def _digest(path):
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def load_map(path=MAP_PATH):
+    """Return the cached `{case id: entry}` mapping."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)["cases"]
+    except FileNotFoundError:
+        return {}
+
+
+def update_map(results, cases, path=MAP_PATH):
+    """Fold the coverage of passed results into the cached mapping."""
+    mapping = load_map(path)
+    by_id = {case.id: case for case in cases}
+    commit = head_commit()
+    for result in results:
+        coverage = result.get("coverage")
+        # A failed case stopped early, so its coverage would under-select.
+        if not coverage or result["testStatus"] != "PASSED":
+            continue
+        mapping[result["id"]] = {
+            "files": coverage["exercised"],
+            "loaded": coverage["loaded"],
+            "codeSha": _digest(by_id[result["id"]].path),
+            "commit": commit,
+            "recorded": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        }
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"cases": mapping}, f, indent=2, sort_keys=True)
+    os.replace(tmp, path)
+    return mapping
+
+
+def _git(*args):
+    return subprocess.run(["git", *args], cwd=APP_DIR, capture_output=True, text=True, check=True).stdout
+
+
+def head_commit():
+    try:
+        return _git("rev-parse", "HEAD").strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def changed_files(base="HEAD"):
+    """Files that differ from `base` in the working tree, plus untracked ones."""
+    changed = _git("diff", "--name-only", base).splitlines()
+    changed += _git("ls-files", "--others", "--exclude-standard").splitlines()
+    return sorted(set(filter(None, changed)))
+
+
+def repo_path(path):
+    """`path` relative to the repository in posix form, or absolute outside it."""
+    path = Path(path).resolve()
+    try:
+        return path.relative_to(APP_DIR).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+def select_cases(cases, changed, mapping):
+    """Return `{case id: [reasons]}` for the cases `changed` can affect."""
+    selected = {}
+
+    def pick(case_ids, reason):
+        for case_id in case_ids:
+            selected.setdefault(case_id, []).append(reason)
+
+    all_ids = [case.id for case in cases]
+    by_script = {repo_path(case.path): case.id for case in cases}
+    unmapped = [case_id for case_id in all_ids if case_id not in mapping]
+    pick(unmapped, "no coverage recorded")
+    loaded = {f for entry in mapping.values() for f in entry["loaded"]}
+
+    for path in changed:
+        if any(fnmatch.fnmatch(path, pattern) for pattern in IGNORED):
+            continue
+        if fnmatch.fnmatch(path, "testsprite_tests/TC*.py"):
+            if path in by_script:
+                pick([by_script[path]], path)
+            continue
+        exercising = [case_id for case_id in all_ids if path in mapping.get(case_id, {}).get("files", ())]
+        if exercising:
+            pick(exercising, path)
+        elif path not in loaded:
+            # Harness code, build configuration, or a file no recorded
+            # run has seen: anything may depend on it.
+            pick(all_ids, f"{path} (unmapped)")
+    return {case_id: selected[case_id] for case_id in all_ids if case_id in selected}
@@ -0,0 +1,108 @@
+"""Homepage load latency: Navigation Timing plus first PropertyCard render."""
+
+import math
+
+from playwright import async_api
+
+from .pool import BASE_URL
+
+LOAD_BUDGET_MS = 3000
+CARD_SELECTOR = '[data-testid="property-card"]'
+
+# Installed before any page script runs: records when the first property
+# card is attached to the DOM, on the same clock as Navigation Timing.
+_FIRST_CARD_SCRIPT = """
+(() => {
+    const selector = %r;
+    const mark = () => {
+        if (window.__firstCardAt === undefined && document.querySelector(selector)) {
+            window.__firstCardAt = performance.now();
+            observer.disconnect();
+        }
+    };
+    const observer = new MutationObserver(mark);
+    observer.observe(document, { childList: true, subtree: true });
+})();
+""" % CARD_SELECTOR
+
+_COLLECT_SCRIPT = """
+() => {
+    const nav = performance.getEntriesByType('navigation')[0];
+    return {
+        ttfbMs: nav ? nav.responseStart : null,
+        domContentLoadedMs: nav ? nav.domContentLoadedEventEnd : null,
+        loadMs: nav ? nav.loadEventEnd : null,
+        transferBytes: nav ? nav.transferSize : null,
+        firstCardMs: window.__firstCardAt === undefined ? null : window.__firstCardAt,
+    };
+}
+"""
+
+
+async def load_home(context, url=BASE_URL, timeout=10000):
+    """Open the homepage and return `(page, sample)` once a property card rendered.
+
+    `sample["firstCardMs"]` is None when no card showed up within `timeout`.
+    """
+    page = await context.new_page()
+    await page.add_init_script(_FIRST_CARD_SCRIPT)
+    await page.goto(url, wait_until="commit", timeout=timeout)
+    try:
+        await page.wait_for_function("window.__firstCardAt !== undefined", timeout=timeout)
+    except async_api.Error:
+        pass
+    return page, await page.evaluate(_COLLECT_SCRIPT)
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile; missing samples (None) rank as infinitely slow."""
+    if not values:
+        return None
+    ranked = sorted(math.inf if v is None else v for v in values)
+    return ranked[max(0, math.ceil(pct / 100 * len(ranked)) - 1)]
+
+
+def summarize(samples, budget_ms=LOAD_BUDGET_MS, gate=95):
+    """Reduce samples to p50/p95/p99 per metric and check the first-card budget."""
+    metrics = {}
+    for key in ("ttfbMs", "domContentLoadedMs", "loadMs", "firstCardMs"):
+        values = [s[key] for s in samples]
+        metrics[key] = {f"p{p}": _round(percentile(values, p)) for p in (50, 95, 99)}
+    gated = percentile([s["firstCardMs"] for s in samples], gate)
+    return {
+        "runs": len(samples),
+        "metrics": metrics,
+        "budgetMs": budget_ms,
+        "gate": f"p{gate}",
+        "withinBudget": gated is not None and gated <= budget_ms,
+    }
+
+
+def _round(value):
+    if value is None or math.isinf(value):
+        return None
+    return round(value, 1)
+
+
+async def measure(pool, runs, url=BASE_URL):
+    """Load the homepage `runs` times cold and `runs` times warm.
+
+    Cold loads each get a brand-new context (empty HTTP cache). Warm loads
+    reuse one context that was primed by a load that is not counted.
+    """
+    cold = []
+    for _ in range(runs):
+        async with pool.context() as context:
+            _, sample = await load_home(context, url)
+            cold.append(sample)
+
+    warm = []
+    async with pool.context() as context:
+        page, _ = await load_home(context, url)
+        await page.close()
+        for _ in range(runs):
+            page, sample = await load_home(context, url)
+            warm.append(sample)
+            await page.close()
+
+    return {"cold": cold, "warm": warm}
@@ -0,0 +1,190 @@
+"""Asyncio load generator for the `get-properties` edge function.
+
+Virtual users start one after another over the ramp period, each holding a
+keep-alive HTTP/1.1 connection and posting `{"userId": ...}` back to back
+until the test ends. The client is a few dozen lines on top of asyncio
+streams, so the numbers measure the function and not a client library.
+
+Works against the function under `supabase functions serve` (Deno) or the
+local stand-in, which answer on the same path:
+
+    python -m harness.supabase_stub --port 54321
+"""
+
+import asyncio
+import json
+import math
+import ssl
+import time
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+from .latency import percentile
+
+DEFAULT_URL = "http://localhost:54321/functions/v1/get-properties"
+
+# Upper bounds of the latency histogram buckets, in milliseconds.
+HISTOGRAM_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, math.inf)
+
+# Pause after a connection failure so a dead server is not hammered in a loop.
+ERROR_BACKOFF_S = 0.1
+
+
+@dataclass
+class LoadProfile:
+    concurrency: int = 10
+    ramp_s: float = 0.0
+    duration_s: float = 30.0
+    timeout_s: float = 10.0
+
+
+class _Connection:
+    """One keep-alive HTTP/1.1 connection; reconnects after errors."""
+
+    def __init__(self, url, headers):
+        parts = urlsplit(url)
+        self.host = parts.hostname
+        self.tls = parts.scheme == "https"
+        self.port = parts.port or (443 if self.tls else 80)
+        self.path = parts.path + (f"?{parts.query}" if parts.query else "")
+        self.headers = {"Host": parts.netloc, "Content-Type": "application/json", **headers}
+        self.reader = self.writer = None
+
+    async def _open(self):
+        context = ssl.create_default_context() if self.tls else None
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port, ssl=context)
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = self.writer = None
+
+    async def post(self, body):
+        """Send one request and return `(status, response_bytes)`."""
+        if self.writer is None:
+            await self._open()
+        head = [f"POST {self.path} HTTP/1.1"]
+        head += [f"{k}: {v}" for k, v in {**self.headers, "Content-Length": len(body)}.items()]
+        self.writer.write(("\r\n".join(head) + "\r\n\r\n").encode() + body)
+        await self.writer.drain()
+
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise ConnectionResetError("server closed the connection")
+        status = int(status_line.split()[1])
+        headers = {}
+        while (line := await self.reader.readline()) not in (b"\r\n", b""):
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while size := int((await self.reader.readline()).split(b";")[0], 16):
+                chunks.append(await self.reader.readexactly(size))
+                await self.reader.readline()
+            await self.reader.readline()
+            data = b"".join(chunks)
+        else:
+            data = await self.reader.readexactly(int(headers.get("content-length", 0)))
+        if headers.get("connection", "").lower() == "close":
+            self.close()
+        return status, data
+
+
+async def _user(url, headers, body, start_at, stop_at, timeout_s, samples):
+    await asyncio.sleep(max(0.0, start_at - time.perf_counter()))
+    connection = _Connection(url, headers)
+    try:
+        while time.perf_counter() < stop_at:
+            started = time.perf_counter()
+            sample = {"t": started, "ms": None, "status": None, "bytes": 0, "error": None}
+            try:
+                status, data = await asyncio.wait_for(connection.post(body), timeout_s)
+                sample.update(status=status, bytes=len(data))
+                if status >= 400:
+                    sample["error"] = f"HTTP {status}"
+            except asyncio.TimeoutError:
+                sample["error"] = "timeout"
+                connection.close()
+            except (OSError, ValueError, IndexError, asyncio.IncompleteReadError) as exc:
+                sample["error"] = type(exc).__name__
+                connection.close()
+            sample["ms"] = (time.perf_counter() - started) * 1000
+            samples.append(sample)
+            if connection.writer is None and sample["error"] is not None:
+                await asyncio.sleep(ERROR_BACKOFF_S)
+    finally:
+        connection.close()
+
+
+async def run_load(profile, url=DEFAULT_URL, user_id=None, headers=None):
+    """Drive `url` with `profile` and return the raw samples and start time."""
+    body = json.dumps({"userId": user_id}).encode()
+    samples = []
+    began = time.perf_counter()
+    stop_at = began + profile.ramp_s + profile.duration_s
+    step = profile.ramp_s / profile.concurrency if profile.concurrency else 0
+    await asyncio.gather(*(
+        _user(url, headers or {}, body, began + i * step, stop_at, profile.timeout_s, samples)
+        for i in range(profile.concurrency)
+    ))
+    return samples, began
+
+
+def _latency(values):
+    if not values:
+        return None
+    return {
+        "min": round(min(values), 1),
+        "mean": round(sum(values) / len(values), 1),
+        **{f"p{p}": round(percentile(values, p), 1) for p in (50, 90, 95, 99)},
+        "max": round(max(values), 1),
+    }
+
+
+def summarize_load(samples, began, profile, url):
+    """Reduce samples to the JSON report: throughput, latency, errors, timeline."""
+    ok = [s for s in samples if s["error"] is None]
+    steady = [s for s in samples if s["t"] - began >= profile.ramp_s]
+    errors = {}
+    for s in samples:
+        if s["error"] is not None:
+            errors[s["error"]] = errors.get(s["error"], 0) + 1
+
+    histogram, lower = [], 0
+    for bound in HISTOGRAM_BUCKETS_MS:
+        count = sum(1 for s in ok if lower <= s["ms"] < bound)
+        histogram.append({"leMs": None if math.isinf(bound) else bound, "count": count})
+        lower = bound
+
+    timeline = {}
+    for s in samples:
+        second = timeline.setdefault(int(s["t"] - began), {"requests": 0, "errors": 0, "ms": []})
+        second["requests"] += 1
+        if s["error"] is None:
+            second["ms"].append(s["ms"])
+        else:
+            second["errors"] += 1
+
+    return {
+        "url": url,
+        "profile": {"concurrency": profile.concurrency, "rampS": profile.ramp_s,
+                    "durationS": profile.duration_s, "timeoutS": profile.timeout_s},
+        "requests": len(samples),
+        "errors": sum(errors.values()),
+        "errorRate": round(sum(errors.values()) / len(samples), 4) if samples else None,
+        "errorsByKind": errors,
+        "throughputRps": round(len(ok) / (profile.ramp_s + profile.duration_s), 1) if samples else 0.0,
+        "steadyThroughputRps": round(
+            sum(1 for s in steady if s["error"] is None) / profile.duration_s, 1,
+        ) if profile.duration_s else None,
+        "bytesPerResponse": round(sum(s["bytes"] for s in ok) / len(ok)) if ok else None,
+        "latencyMs": _latency([s["ms"] for s in ok]),
+        "steadyLatencyMs": _latency([s["ms"] for s in steady if s["error"] is None]),
+        "histogram": histogram,
+        "timeline": [
+            {"second": t, "requests": v["requests"], "errors": v["errors"],
+             "p95Ms": round(percentile(v["ms"], 95), 1) if v["ms"] else None}
+            for t, v in sorted(timeline.items())
+        ],
+    }
@@ -0,0 +1,231 @@
+"""Detect and remove repeated step cycles in generated TC scripts.
+
+The generator retries when it does not see progress, leaving scripts such
+as TC005 with the same "Publicar Imóvel" -> "Acessar Painel Administrativo"
+pair six times in a row, or TC012 reloading the homepage over and over.
+Consecutive repetitions of a step block are collapsed to one occurrence
+only when the repetitions provably do nothing the first one did not: every
+step of the block navigates (goto/reload, or a click on a link that always
+lands on the same page, `NAVIGATION_CLICKS`) or only scrolls, and at least
+one navigates. A block that also clicks or fills anything else is kept,
+even after a reload: a submit, a logout, a wizard's "Próximo" or an
+add-item button changes state every time it is pressed.
+
+A step is the run of statements that ends in one browser action (click,
+fill, goto, wheel, ...), together with the comments above it; the sleeps
+that directly follow an action belong to it. Steps are compared by their
+normalised code, ignoring comments and the `frame = context.pages[-1]`
+bookkeeping.
+"""
+
+import ast
+from dataclasses import dataclass, field
+
+_ACTIONS = {"click", "fill", "goto", "wheel", "reload", "press", "select_option", "check", "type", "dblclick"}
+_SLEEPS = {"wait_for_timeout", "sleep"}
+# Navigations, which reset whatever the cycle did to the page.
+_RESETS = {"goto", "reload"}
+# Actions that leave the app's state alone; only scrolling qualifies, and
+# only next to a navigation, as scrolling a list can load more of it.
+_READ_ONLY = {"wheel"}
+# Registry entries whose click only navigates to a fixed page.
+NAVIGATION_CLICKS = {"nav.publish", "publish.admin_access", "footer.restricted_access", "header.logo"}
+_FLOW_MARKER = "# Interact with the page elements to simulate user flow"
+
+# Rough cost of an action beyond any explicit sleep, in milliseconds.
+_ACTION_COST_MS = {"goto": 1500, "reload": 1500, "click": 500, "fill": 300, "wheel": 100}
+_DEFAULT_ACTION_COST_MS = 300
+
+
+@dataclass
+class Step:
+    statements: list
+    start: int  # first source line (1-based), including leading comments
+    end: int  # last source line
+    action: str = ""
+    sleep_ms: int = 0
+
+    @property
+    def signature(self):
+        return "\n".join(ast.unparse(s) for s in self.statements if not _is_frame_assignment(s))
+
+    @property
+    def target(self):
+        """Registry name the step's `steps.locate(...)` refers to, if any."""
+        for stmt in self.statements:
+            for node in ast.walk(stmt):
+                if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) \
+                        and node.func.attr == "locate" and node.args and isinstance(node.args[0], ast.Constant):
+                    return node.args[0].value
+        return None
+
+    @property
+    def cost_ms(self):
+        return self.sleep_ms + _ACTION_COST_MS.get(self.action, _DEFAULT_ACTION_COST_MS)
+
+
+@dataclass
+class Compaction:
+    steps: list
+    kept: list
+    # (first kept index, period, repetitions) for every collapsed cycle
+    cycles: list = field(default_factory=list)
+
+    @property
+    def removed(self):
+        kept = set(self.kept)
+        return [i for i in range(len(self.steps)) if i not in kept]
+
+    @property
+    def saved_ms(self):
+        return sum(self.steps[i].cost_ms for i in self.removed)
+
+
+def _awaited_calls(stmt):
+    """Names of the awaited method calls in an expression statement."""
+    names = []
+    for node in ast.walk(stmt):
+        if isinstance(node, ast.Await) and isinstance(node.value, ast.Call):
+            func = node.value.func
+            if isinstance(func, ast.Attribute):
+                names.append(func.attr)
+    return names
+
+
+def _sleep_ms(stmt):
+    for node in ast.walk(stmt):
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and node.func.attr in _SLEEPS:
+            if node.args and isinstance(node.args[0], ast.Constant):
+                value = node.args[0].value
+                return int(value * 1000) if node.func.attr == "sleep" else int(value)
+    return 0
+
+
+def _is_frame_assignment(stmt):
+    return isinstance(stmt, ast.Assign) and ast.unparse(stmt) == "frame = context.pages[-1]"
+
+
+def _is_step_material(stmt):
+    if isinstance(stmt, ast.Assign):
+        targets = [t.id for t in stmt.targets if isinstance(t, ast.Name)]
+        return targets in (["frame"], ["elem"])
+    if isinstance(stmt, ast.Expr):
+        return bool(set(_awaited_calls(stmt)) & (_ACTIONS | _SLEEPS))
+    return False
+
+
+def _run_test_body(tree):
+    for node in tree.body:
+        if isinstance(node, ast.AsyncFunctionDef) and node.name == "run_test":
+            body = node.body
+            # The legacy generated scripts wrap everything in try/finally.
+            if isinstance(body[-1], ast.Try) and body[-1].finalbody:
+                return body[-1].body
+            return body
+    raise ValueError("no `async def run_test` in script")
+
+
+def split_steps(source):
+    """Return the steps of a script's run_test, in order."""
+    body = _run_test_body(ast.parse(source))
+    # The generator marks where the journey starts; everything above it
+    # (browser setup, the initial goto) is the head and is never compacted.
+    marker = next(
+        (n for n, line in enumerate(source.splitlines(), start=1) if _FLOW_MARKER in line), 0,
+    )
+    steps, pending, previous_end = [], [], None
+    started = False
+    for stmt in body:
+        started = started or (stmt.lineno > marker and _is_step_material(stmt))
+        if not started:
+            previous_end = stmt.end_lineno
+            continue
+        if not _is_step_material(stmt):
+            break  # assertions: everything after the last step is the tail
+        calls = set(_awaited_calls(stmt))
+        if not (calls & _ACTIONS) and calls & _SLEEPS and steps and not pending:
+            # A sleep right after an action belongs to that action.
+            steps[-1].statements.append(stmt)
+            steps[-1].end = stmt.end_lineno
+            steps[-1].sleep_ms += _sleep_ms(stmt)
+            previous_end = stmt.end_lineno
+            continue
+        pending.append(stmt)
+        if calls & _ACTIONS:
+            start = (previous_end or pending[0].lineno - 1) + 1
+            action = next(name for name in _awaited_calls(stmt) if name in _ACTIONS)
+            steps.append(Step(pending, start, stmt.end_lineno, action, sum(_sleep_ms(s) for s in pending)))
+            pending, previous_end = [], stmt.end_lineno
+    return steps
+
+
+def _is_navigation(step):
+    return step.action in _RESETS or (step.action == "click" and step.target in NAVIGATION_CLICKS)
+
+
+def _collapsible(block):
+    if not any(_is_navigation(step) for step in block):
+        return False
+    return all(_is_navigation(step) or step.action in _READ_ONLY for step in block)
+
+
+def compact_steps(steps):
+    """Collapse consecutive repetitions of step blocks, repeating until stable."""
+    indices = list(range(len(steps)))
+    cycles = []
+    changed = True
+    while changed:
+        changed = False
+        signatures = [steps[i].signature for i in indices]
+        kept, i, n = [], 0, len(indices)
+        while i < n:
+            best_period, best_reps = 0, 1
+            for period in range(1, (n - i) // 2 + 1):
+                block = signatures[i:i + period]
+                reps = 1
+                while signatures[i + reps * period:i + (reps + 1) * period] == block:
+                    reps += 1
+                if reps > 1 and (reps - 1) * period > (best_reps - 1) * best_period \
+                        and _collapsible([steps[j] for j in indices[i:i + period]]):
+                    best_period, best_reps = period, reps
+            if best_period:
+                kept.extend(indices[i:i + best_period])
+                cycles.append((indices[i], best_period, best_reps))
+                i += best_period * best_reps
+                changed = True
+            else:
+                kept.append(indices[i])
+                i += 1
+        indices = kept
+    return Compaction(steps, indices, cycles)
+
+
+def compact_source(source):
+    """Return `(compacted_source, compaction)` for a TC script."""
+    steps = split_steps(source)
+    compaction = compact_steps(steps)
+    removed = set(compaction.removed)
+    if not removed:
+        return source, compaction
+
+    lines = source.splitlines(keepends=True)
+    drop = set()
+    notes = {}
+    for index in sorted(removed):
+        step = steps[index]
+        drop.update(range(step.start, step.end + 1))
+        # Note the first removed step of each run where it used to be.
+        if index - 1 not in removed:
+            first = step.statements[0]
+            indent = " " * first.col_offset
+            run = [i for i in range(index, len(steps)) if i in removed]
+            length = next((k for k, i in enumerate(run) if i != index + k), len(run))
+            notes[step.start] = f"{indent}# (compacted: {length} repeated step(s) removed)\n"
+
+    out = []
+    for number, line in enumerate(lines, start=1):
+        if number in notes:
+            out.append(notes[number])
+        if number not in drop:
+            out.append(line)
+    return "".join(out), compaction
@@ -0,0 +1,148 @@
+"""Record/replay cache for the external HTTP calls the app makes.
+
+Each response is captured once, keyed by method, URL and request body, and
+stored as a HAR-style JSON entry under `tmp/netcache/`. Replays are served
+from that directory through Playwright routing, optionally after a fixed
+artificial latency so timings stay realistic but deterministic.
+
+Modes:
+
+* ``record`` always goes to the network and (re)writes the entry;
+* ``replay`` serves only from the cache, misses are aborted and reported;
+* ``auto`` replays hits and records misses.
+"""
+
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import weakref
+from datetime import datetime, timezone
+from pathlib import Path
+
+from .suite import TESTS_DIR
+from .supabase_stub import SUPABASE_URL
+
+CACHE_DIR = TESTS_DIR / "tmp" / "netcache"
+
+# The hosts whose answers the journeys wait on: Supabase (REST, auth,
+# functions), ViaCEP address lookups and Nominatim geocoding.
+DEFAULT_PATTERNS = (
+    f"{SUPABASE_URL}/rest/**",
+    f"{SUPABASE_URL}/auth/**",
+    f"{SUPABASE_URL}/functions/**",
+    "https://viacep.com.br/**",
+    "https://nominatim.openstreetmap.org/**",
+)
+
+MODES = ("record", "replay", "auto")
+
+# Response headers that describe the original transfer, not the content.
+_DROP_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+
+def request_key(method, url, body):
+    digest = hashlib.sha256()
+    digest.update(method.upper().encode())
+    digest.update(b"\0")
+    digest.update(url.encode())
+    digest.update(b"\0")
+    digest.update(body or b"")
+    return digest.hexdigest()
+
+
+class NetworkCache:
+    """BrowserPool context hook that records and replays matching requests."""
+
+    name = "netcache"
+
+    def __init__(self, mode="auto", directory=CACHE_DIR, latency_ms=0, patterns=DEFAULT_PATTERNS):
+        if mode not in MODES:
+            raise ValueError(f"unknown network cache mode {mode!r}, expected one of {MODES}")
+        self.mode = mode
+        self.directory = Path(directory)
+        self.latency_ms = latency_ms
+        self.patterns = tuple(patterns)
+        self._stats = weakref.WeakKeyDictionary()
+
+    def _path(self, key):
+        return self.directory / key[:2] / f"{key}.json"
+
+    def load(self, key):
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def store(self, key, method, url, body, status, headers, content):
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        entry = {
+            "startedDateTime": datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+            "request": {
+                "method": method,
+                "url": url,
+                "postData": base64.b64encode(body).decode() if body else None,
+            },
+            "response": {
+                "status": status,
+                "headers": {k: v for k, v in headers.items() if k.lower() not in _DROP_HEADERS},
+                "content": base64.b64encode(content).decode(),
+            },
+        }
+        # Shard workers may record the same request concurrently; write to a
+        # private file and rename so readers never see a partial entry.
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(tmp, path)
+
+    def _stats_for(self, context):
+        stats = self._stats.get(context)
+        if stats is None:
+            stats = self._stats[context] = {"hits": 0, "recorded": 0, "misses": []}
+        return stats
+
+    async def _handle(self, route, stats):
+        request = route.request
+        body = request.post_data_buffer
+        key = request_key(request.method, request.url, body)
+
+        entry = self.load(key) if self.mode != "record" else None
+        if entry is not None:
+            stats["hits"] += 1
+            if self.latency_ms:
+                await asyncio.sleep(self.latency_ms / 1000)
+            response = entry["response"]
+            await route.fulfill(
+                status=response["status"],
+                headers=response["headers"],
+                body=base64.b64decode(response["content"]),
+            )
+            return
+
+        if self.mode == "replay":
+            stats["misses"].append(f"{request.method} {request.url}")
+            await route.abort("internetdisconnected")
+            return
+
+        response = await route.fetch()
+        content = await response.body()
+        self.store(key, request.method, request.url, body, response.status, response.headers, content)
+        stats["recorded"] += 1
+        await route.fulfill(response=response, body=content)
+
+    async def __call__(self, context):
+        stats = self._stats_for(context)
+
+        async def handle(route):
+            await self._handle(route, stats)
+
+        for pattern in self.patterns:
+            await context.route(pattern, handle)
+
+    def report(self, context):
+        stats = self._stats_for(context)
+        return {"mode": self.mode, "hits": stats["hits"], "recorded": stats["recorded"], "misses": list(stats["misses"])}
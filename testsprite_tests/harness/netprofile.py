@@ -0,0 +1,197 @@
+"""Named network profiles: what a test case's browser context may download.
+
+* ``full`` loads everything, like a real visitor;
+* ``functional`` aborts images, media and web fonts, plus map tiles
+  fetched as XHR. Property photos from Supabase Storage, the Google Fonts
+  and the map imagery are never asserted on by the functional cases.
+
+A TC script picks its profile with a module-level ``NETWORK_PROFILE``,
+next to ``SESSION``; the runner can also force one for every case.
+
+Blocked requests are never downloaded, so their size is not known from
+the run itself. A ``full`` run that measures bytes records the transfer
+size of the kinds of requests ``functional`` blocks, by URL, in
+``tmp/netprofile/sizes.json``. The bytes a ``functional`` run saved are
+estimated from those sizes, and blocked requests with no recorded size are
+counted separately.
+
+Measuring bytes costs a CDP round-trip per finished request
+(``request.sizes()``), which would skew timing runs, so it is opt-in: without
+it a context only counts its requests and reports ``bytes`` as None.
+"""
+
+import asyncio
+import fnmatch
+import json
+import os
+import weakref
+from dataclasses import dataclass
+from pathlib import Path
+
+from .suite import TESTS_DIR
+
+SIZES_PATH = TESTS_DIR / "tmp" / "netprofile" / "sizes.json"
+
+_MAP_TILES = (
+    "https://maps.googleapis.com/maps/vt*",
+    "https://maps.googleapis.com/maps/api/js/*Tile*",
+    "https://*.tile.openstreetmap.org/*",
+    "https://khms*.googleapis.com/*",
+)
+
+
+@dataclass(frozen=True)
+class NetworkProfile:
+    name: str
+    blocked_types: frozenset = frozenset()
+    blocked_urls: tuple = ()
+
+    def blocks(self, request):
+        if request.resource_type in self.blocked_types:
+            return True
+        return any(fnmatch.fnmatch(request.url, pattern) for pattern in self.blocked_urls)
+
+
+PROFILES = {
+    "full": NetworkProfile("full"),
+    "functional": NetworkProfile(
+        "functional", frozenset({"image", "media", "font"}), _MAP_TILES,
+    ),
+}
+DEFAULT_PROFILE = "full"
+
+# What "full" runs measure for the estimate: everything "functional" blocks.
+_MEASURED = PROFILES["functional"]
+
+
+class SizeTable:
+    """Transfer sizes by URL, shared by the runs of this process."""
+
+    def __init__(self, path=SIZES_PATH):
+        self.path = Path(path)
+        self.sizes = None
+        self.dirty = False
+
+    def load(self):
+        if self.sizes is None:
+            try:
+                with open(self.path, encoding="utf-8") as f:
+                    self.sizes = json.load(f)
+            except FileNotFoundError:
+                self.sizes = {}
+        return self.sizes
+
+    def get(self, url):
+        return self.load().get(url)
+
+    def record(self, url, size):
+        sizes = self.load()
+        if sizes.get(url) != size:
+            sizes[url] = size
+            self.dirty = True
+
+    def save(self):
+        if not self.dirty:
+            return
+        # Other shard workers may have saved meanwhile; merge rather than
+        # overwrite what they measured.
+        mine, self.sizes = self.sizes, None
+        merged = {**self.load(), **mine}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(merged, f)
+        os.replace(tmp, self.path)
+        self.sizes, self.dirty = merged, False
+
+
+_sizes = SizeTable()
+
+
+class _Usage:
+    def __init__(self, profile, measure_bytes=False):
+        self.profile = profile
+        self.measure_bytes = measure_bytes
+        self.requests = 0
+        self.bytes = 0
+        self.blocked = 0
+        self.blocked_bytes = 0
+        self.unknown = 0
+        self.pending = set()
+
+
+_usage = weakref.WeakKeyDictionary()
+
+
+def resolve_profile(name):
+    try:
+        return PROFILES[name or DEFAULT_PROFILE]
+    except KeyError:
+        raise ValueError(f"unknown network profile {name!r}, expected one of {tuple(PROFILES)}") from None
+
+
+async def apply_profile(context, name=None, measure_bytes=False):
+    """Install profile `name` on a new context and start counting its traffic.
+
+    With `measure_bytes`, the transfer size of every finished request is
+    read as well (see the module docstring for what that costs).
+    """
+    profile = resolve_profile(name)
+    usage = _usage[context] = _Usage(profile, measure_bytes)
+
+    async def measure(request):
+        try:
+            sizes = await request.sizes()
+        except Exception:
+            # The context closed before the response was complete.
+            return
+        size = sizes["responseHeadersSize"] + sizes["responseBodySize"]
+        usage.bytes += size
+        if profile.name == "full" and _MEASURED.blocks(request):
+            _sizes.record(request.url, size)
+
+    def on_finished(request):
+        usage.requests += 1
+        if not measure_bytes:
+            return
+        task = asyncio.ensure_future(measure(request))
+        usage.pending.add(task)
+        task.add_done_callback(usage.pending.discard)
+
+    context.on("requestfinished", on_finished)
+
+    if not (profile.blocked_types or profile.blocked_urls):
+        return
+
+    async def handle(route):
+        request = route.request
+        if not profile.blocks(request):
+            await route.fallback()
+            return
+        usage.blocked += 1
+        size = _sizes.get(request.url)
+        if size is None:
+            usage.unknown += 1
+        else:
+            usage.blocked_bytes += size
+        await route.abort("blockedbyclient")
+
+    await context.route("**/*", handle)
+
+
+async def profile_report(context):
+    """Traffic of a context under its profile, or None if it had none."""
+    usage = _usage.get(context)
+    if usage is None:
+        return None
+    if usage.pending:
+        await asyncio.gather(*usage.pending)
+    _sizes.save()
+    return {
+        "profile": usage.profile.name,
+        "requests": usage.requests,
+        "bytes": usage.bytes if usage.measure_bytes else None,
+        "blocked": usage.blocked,
+        "bytesSaved": usage.blocked_bytes,
+        "blockedUnknownSize": usage.unknown,
+    }
@@ -0,0 +1,239 @@
+"""Chrome performance traces around step transitions, reduced to hotspots.
+
+A case opts in with a `PERF_TRACE` pattern (e.g. r"^(Venda|Aluguel)$") and
+the runner with --perf-trace, which installs the `PerfTrace` hook. From
+then on every `Steps.click` whose element text matches the pattern is a
+transition: a CDP `Tracing` session records the click and everything up
+to the page settling again. The raw trace is kept under
+tmp/perftrace/<case>/ for DevTools' Performance panel, and `summarize`
+reduces it to:
+
+* self time per category (scripting, style/layout, paint) on the
+  renderer main thread, where the transition blocks the user;
+* the top hotspots of each category: functions and event handlers by
+  script location, forced layouts by the script that caused them;
+* the longest main-thread task.
+
+The per-step summaries become the case's ``perftrace`` result entry.
+"""
+
+import asyncio
+import json
+import re
+import time
+import weakref
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+from playwright import async_api
+
+# testsprite_tests/tmp/perftrace; not via suite.TESTS_DIR, which imports waits.
+TRACE_DIR = Path(__file__).resolve().parent.parent / "tmp" / "perftrace"
+
+# What DevTools' Performance panel records, minus screenshots and the
+# sampling profiler, which would slow the transition being measured.
+CATEGORIES = (
+    "devtools.timeline",
+    "disabled-by-default-devtools.timeline",
+    "disabled-by-default-devtools.timeline.frame",
+    "toplevel",
+    "v8.execute",
+    "blink.user_timing",
+    "loading",
+)
+
+SCRIPTING = {
+    "FunctionCall", "EvaluateScript", "EventDispatch", "TimerFire", "FireAnimationFrame", "FireIdleCallback",
+    "RunMicrotasks", "v8.compile", "v8.compileModule", "v8.evaluateModule", "V8.CompileCode", "MajorGC",
+    "MinorGC", "XHRReadyStateChange", "XHRLoad",
+}
+LAYOUT = {"Layout", "UpdateLayoutTree", "RecalculateStyles", "UpdateLayerTree", "HitTest", "ParseAuthorStyleSheet"}
+PAINT = {"Paint", "PaintImage", "PrePaint", "Layerize", "CompositeLayers", "Commit", "Decode Image", "ImageDecodeTask"}
+_CATEGORY_OF = {
+    **{name: "scripting" for name in SCRIPTING},
+    **{name: "layout" for name in LAYOUT},
+    **{name: "paint" for name in PAINT},
+}
+
+# Top-level main-thread tasks, by the name older and newer Chrome use.
+_TASKS = {"RunTask", "ThreadControllerImpl::RunTask"}
+
+TOP_HOTSPOTS = 10
+
+_transitions = weakref.WeakKeyDictionary()
+
+
+def _frame(frame):
+    if not frame:
+        return ""
+    where = frame.get("url", "").rsplit("/", 1)[-1].split("?", 1)[0]
+    line = frame.get("lineNumber")
+    location = f"{where}:{line}" if where and line is not None else where
+    name = frame.get("functionName") or "(anonymous)"
+    return f"{name} {location}".strip()
+
+
+def _label(event):
+    """Name a hotspot: script location for scripting, cause for forced layouts."""
+    name = event["name"]
+    args = event.get("args", {})
+    data = args.get("data") or args.get("beginData") or {}
+    if name == "FunctionCall":
+        return _frame(data)
+    if name == "EventDispatch":
+        return f"{data.get('type', '?')} handler"
+    if name == "EvaluateScript":
+        return f"evaluate {_frame(data)}"
+    stack = data.get("stackTrace")
+    if name in LAYOUT and stack:
+        return f"{name} forced by {_frame(stack[0])}"
+    return name
+
+
+def _complete_events(events):
+    """Pair B/E events per thread and return `[(event, ts, dur)]` of slices."""
+    slices, open_ = [], defaultdict(list)
+    for event in events:
+        phase = event.get("ph")
+        if phase == "X":
+            slices.append((event, event["ts"], event.get("dur", 0)))
+        elif phase == "B":
+            open_[(event["pid"], event["tid"])].append(event)
+        elif phase == "E":
+            stack = open_[(event["pid"], event["tid"])]
+            if stack:
+                begin = stack.pop()
+                slices.append((begin, begin["ts"], event["ts"] - begin["ts"]))
+    return slices
+
+
+def summarize(events, top=TOP_HOTSPOTS):
+    """Reduce trace events to self time per category and the top hotspots."""
+    main_threads = {
+        (e["pid"], e["tid"]) for e in events
+        if e.get("ph") == "M" and e.get("name") == "thread_name" and e["args"].get("name") == "CrRendererMain"
+    }
+    by_thread = defaultdict(list)
+    for event, ts, dur in _complete_events(events):
+        if (event["pid"], event["tid"]) in main_threads:
+            by_thread[event["pid"], event["tid"]].append((ts, -dur, event))
+
+    totals = defaultdict(float)
+    hotspots = defaultdict(lambda: defaultdict(lambda: [0.0, 0]))
+    longest_task = 0
+    for slices in by_thread.values():
+        # Parents sort before their children: same start, longer first.
+        slices.sort(key=lambda s: (s[0], s[1]))
+        stack = []
+        self_times = {}
+        for ts, neg_dur, event in slices:
+            end = ts - neg_dur
+            while stack and stack[-1][1] <= ts:
+                stack.pop()
+            if stack:
+                parent = stack[-1][0]
+                self_times[id(parent)] = (parent, self_times[id(parent)][1] - min(-neg_dur, stack[-1][1] - ts))
+            self_times[id(event)] = (event, -neg_dur)
+            stack.append((event, end))
+            if event["name"] in _TASKS:
+                longest_task = max(longest_task, -neg_dur)
+        for event, self_us in self_times.values():
+            category = _CATEGORY_OF.get(event["name"])
+            if category is None or self_us <= 0:
+                continue
+            totals[category] += self_us
+            spot = hotspots[category][_label(event)]
+            spot[0] += self_us
+            spot[1] += 1
+
+    return {
+        "selfMs": {category: round(totals[category] / 1000, 1) for category in ("scripting", "layout", "paint")},
+        "longestTaskMs": round(longest_task / 1000, 1),
+        "hotspots": {
+            category: [
+                {"name": name, "selfMs": round(us / 1000, 2), "count": count}
+                for name, (us, count) in sorted(spots.items(), key=lambda item: item[1][0], reverse=True)[:top]
+            ]
+            for category, spots in hotspots.items()
+        },
+    }
+
+
+class _Transitions:
+    """Pattern and recorded steps of one browser context."""
+
+    def __init__(self, out_dir):
+        self.out_dir = Path(out_dir)
+        self.pattern = None
+        self.case = None
+        self.steps = []
+
+    async def matches(self, locator):
+        if self.pattern is None:
+            return None
+        try:
+            text = (await locator.inner_text(timeout=1000)).strip()
+        except async_api.Error:
+            return None
+        return text if re.search(self.pattern, text) else None
+
+    @asynccontextmanager
+    async def record(self, page, label):
+        """Trace the enclosed block as the next step and summarize it."""
+        session = await page.context.new_cdp_session(page)
+        events, complete = [], asyncio.get_running_loop().create_future()
+        session.on("Tracing.dataCollected", lambda params: events.extend(params["value"]))
+        session.on("Tracing.tracingComplete", lambda params: complete.done() or complete.set_result(None))
+        await session.send("Tracing.start", {
+            "transferMode": "ReportEvents",
+            "traceConfig": {"includedCategories": list(CATEGORIES)},
+        })
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = round((time.perf_counter() - started) * 1000, 1)
+            await session.send("Tracing.end")
+            await asyncio.wait_for(complete, 30)
+            await session.detach()
+            index = len(self.steps) + 1
+            path = self.out_dir / (self.case or "context") / f"step-{index:02d}.json"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"traceEvents": events}, f)
+            self.steps.append({"step": index, "label": label, "durationMs": duration, "trace": str(path),
+                               **summarize(events)})
+
+
+def transitions_for(context):
+    """Return the transition recorder of `context`, or None without the hook."""
+    return _transitions.get(context)
+
+
+def trace_transitions(context, pattern, case=None):
+    """Trace clicks on elements whose text matches `pattern` in `context`."""
+    transitions = _transitions.get(context)
+    if transitions is not None:
+        transitions.pattern = pattern
+        transitions.case = case
+
+
+class PerfTrace:
+    """BrowserPool context hook that lets cases trace their step transitions."""
+
+    name = "perftrace"
+
+    def __init__(self, out_dir=TRACE_DIR):
+        self.out_dir = out_dir
+
+    async def __call__(self, context):
+        _transitions[context] = _Transitions(self.out_dir)
+
+    def report(self, context):
+        transitions = _transitions.get(context)
+        steps = transitions.steps if transitions else []
+        if steps and transitions.case:
+            with open(self.out_dir / transitions.case / "summary.json", "w", encoding="utf-8") as f:
+                json.dump(steps, f, ensure_ascii=False, indent=2)
+        return steps
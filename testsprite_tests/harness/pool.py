@@ -0,0 +1,193 @@
+"""Warm Chromium pool shared by every test case of a run."""
+
+import inspect
+from contextlib import asynccontextmanager
+
+from playwright import async_api
+
+from .auth import save_session
+from .impact import JSCoverage
+from .netcache import NetworkCache
+from .netprofile import apply_profile, profile_report
+from .perftrace import PerfTrace
+from .supabase_stub import context_hook as supabase_stub_hook
+from .tracing import tracer_for
+from .waits import ledger_for
+
+BASE_URL = "http://localhost:3000"
+
+# Same flags the generated scripts used, minus "--single-process": with one
+# browser serving many contexts, a single renderer crash would take down
+# every test case of the run.
+LAUNCH_ARGS = [
+    "--window-size=1280,720",         # Set the browser window size
+    "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
+    "--ipc=host",                     # Use host-level IPC for better stability
+]
+
+DEFAULT_TIMEOUT = 5000
+
+
+class BrowserPool:
+    """Launch Chromium once and hand out a fresh BrowserContext per test case.
+
+    A context is as isolated as a new browser (cookies, storage, cache), but
+    costs milliseconds instead of a cold browser launch.
+    """
+
+    def __init__(self, headless=True, args=None, context_hooks=(), storage_states=None, network_profile=None,
+                 network_bytes=False):
+        self.headless = headless
+        self.args = list(LAUNCH_ARGS if args is None else args)
+        # Coroutine functions called with every new context before it is
+        # handed out, e.g. to install network routes. Hooks that also have a
+        # `name` and a `report(context)` method (plain or coroutine)
+        # contribute to the result of the test case that used the context.
+        self.context_hooks = list(context_hooks)
+        # Session name -> storage_state file, filled on first use unless
+        # the runner already logged in for the whole run.
+        self.storage_states = dict(storage_states or {})
+        # Network profile forced on every context; None lets each context
+        # (i.e. each test case) choose, defaulting to "full".
+        self.network_profile = network_profile
+        # Whether contexts read the transfer size of every request; off for
+        # timing runs, which would pay a CDP round-trip per request.
+        self.network_bytes = network_bytes
+        self.playwright = None
+        self.browser = None
+
+    async def start(self):
+        if self.browser is None:
+            self.playwright = await async_api.async_playwright().start()
+            self.browser = await self.playwright.chromium.launch(
+                headless=self.headless,
+                args=self.args,
+            )
+        return self
+
+    async def stop(self):
+        if self.browser:
+            await self.browser.close()
+            self.browser = None
+        if self.playwright:
+            await self.playwright.stop()
+            self.playwright = None
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc_info):
+        await self.stop()
+
+    async def reports(self, context):
+        """Collect what the reporting hooks observed in `context`."""
+        collected = {}
+        for hook in self.context_hooks:
+            if hasattr(hook, "report"):
+                report = hook.report(context)
+                collected[hook.name] = await report if inspect.isawaitable(report) else report
+        network = await profile_report(context)
+        if network is not None:
+            collected["network"] = network
+        return collected
+
+    async def session_state(self, name):
+        """Return the storage_state file for session `name`, logging in once."""
+        if name not in self.storage_states:
+            async with self.context() as context:
+                self.storage_states[name] = await save_session(context, name, BASE_URL)
+        return self.storage_states[name]
+
+    @asynccontextmanager
+    async def context(self, session=None, profile=None, **options):
+        """Yield a new incognito-like context that is closed afterwards.
+
+        With `session`, the context starts from that session's storage
+        state instead of logged out. `profile` names the network profile
+        (see netprofile) unless the pool forces one.
+        """
+        await self.start()
+        if session:
+            options["storage_state"] = str(await self.session_state(session))
+        context = await self.browser.new_context(**options)
+        context.set_default_timeout(DEFAULT_TIMEOUT)
+        # Attach the tracer first so it sees every request of the context.
+        tracer_for(context)
+        try:
+            # Before the hooks: their routes are added later and so take
+            # precedence over the profile's catch-all one.
+            await apply_profile(context, self.network_profile or profile, measure_bytes=self.network_bytes)
+            for hook in self.context_hooks:
+                await hook(context)
+            yield context
+        finally:
+            await context.close()
+
+
+def build_pool(headless=True, supabase="hosted", network_cache="off", cache_latency_ms=0, storage_states=None,
+               coverage=False, network_profile="auto", perf_trace=False, network_bytes=False):
+    """Create a pool from the runner options shared by every entry point.
+
+    `supabase="stub"` routes the app's Supabase traffic to the local
+    stand-in, reseeded for every context. `network_cache` is "off" or a
+    NetworkCache mode; routes added later win in Playwright, so the stub
+    still answers Supabase calls when both are enabled. `storage_states`
+    maps session names to state files a runner already created.
+    `coverage` records the source files each case exercises (see impact).
+    `network_profile` forces a profile on every case; "auto" lets each TC
+    script's `NETWORK_PROFILE` decide. `network_bytes` also measures the
+    bytes every context transferred. `perf_trace` records a Chrome trace
+    around the step transitions a TC script names in `PERF_TRACE`.
+    """
+    hooks = []
+    if coverage:
+        hooks.append(JSCoverage(BASE_URL))
+    if perf_trace:
+        hooks.append(PerfTrace())
+    if network_cache != "off":
+        hooks.append(NetworkCache(network_cache, latency_ms=cache_latency_ms))
+    if supabase == "stub":
+        hooks.append(supabase_stub_hook())
+    return BrowserPool(
+        headless=headless, context_hooks=hooks, storage_states=storage_states,
+        network_profile=None if network_profile == "auto" else network_profile, network_bytes=network_bytes,
+    )
+
+
+async def open_app(context, url=BASE_URL):
+    """Open a page on the app and wait for it and its iframes to load."""
+    page = await context.new_page()
+
+    # Navigate to the target URL and wait until the network request is committed
+    await page.goto(url, wait_until="commit", timeout=10000)
+
+    # Wait for the main page to reach DOMContentLoaded state (optional for stability)
+    try:
+        await page.wait_for_load_state("domcontentloaded", timeout=3000)
+    except async_api.Error:
+        pass
+
+    # Iterate through all iframes and wait for them to load as well
+    for frame in page.frames:
+        try:
+            await frame.wait_for_load_state("domcontentloaded", timeout=3000)
+        except async_api.Error:
+            pass
+
+    return page
+
+
+async def run_standalone(run_test, headless=True, session=None, profile=None):
+    """Run a single test coroutine in its own pool, as `python TC0xx.py` does."""
+    async with BrowserPool(headless=headless) as pool:
+        async with pool.context(session=session, profile=profile) as context:
+            try:
+                await run_test(context)
+            finally:
+                waits = ledger_for(context).summary()
+                if waits["steps"]:
+                    print(f"{waits['steps']} steps waited {waits['waitedMs']} ms"
+                          f" instead of sleeping {waits['legacySleepMs']} ms")
+                for span in sorted(tracer_for(context).spans, key=lambda s: s["durMs"], reverse=True)[:3]:
+                    print(f"  slowest: {span['name']} {span['selector'] or span.get('url', '')}"
+                          f" {span['durMs']} ms (waited {span['waitMs']} ms)")
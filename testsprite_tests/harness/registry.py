@@ -0,0 +1,224 @@
+"""Named selectors shared by the TC scripts, with resolution caching and timing.
+
+Each name maps to candidate selectors in order of preference: test ids and
+ARIA roles/names first, visible text next, and the absolute XPath the
+generator recorded last, as a fallback while the DOM catches up. The first
+candidate that matches wins. Preferred candidates are always tried first;
+which XPath fallback matched is remembered for the rest of the process, so
+later lookups that need one try it first. Every lookup is timed; slow and
+ambiguous (multi-match) selectors show up in the run report.
+"""
+
+import time
+import weakref
+
+SELECTORS = {
+    # Public site
+    "app.root": (
+        "#root > div",
+        "xpath=html/body/div",
+    ),
+    "header.logo": (
+        'header nav a:has(img[alt="Quallity Home Logo"])',
+        "xpath=html/body/div/div/header/nav/div/a",
+        "xpath=html/body/div/div/div/header/nav/div/a",
+    ),
+    "header.language_switcher": (
+        '[data-testid="language-switcher"]',
+        "xpath=html/body/div/div/header/nav/div[3]/div/button",
+    ),
+    "header.language_option_en": (
+        '[data-testid="language-switcher"] + div >> role=button[name="English"]',
+        "xpath=html/body/div/div/header/nav/div[3]/div/div/button[2]",
+    ),
+    # The mobile menu and its language picker only render below lg (1024 px)
+    "header.mobile_menu": (
+        'header nav button[class*="lg:hidden"]',
+        "xpath=html/body/div/div/header/nav/div[3]/button",
+    ),
+    "header.mobile_language": (
+        'header button:has-text("Idioma")',
+        "xpath=html/body/div/div/header/div/div/div/div[2]/button",
+    ),
+    "header.mobile_language_en": (
+        'header div:has(> button:has-text("Idioma")) >> role=button[name="English"]',
+        "xpath=html/body/div/div/header/div/div/div/div[2]/div/button[2]",
+    ),
+    "nav.publish": (
+        'role=link[name="Publicar Imóvel"]',
+        'role=button[name="Publicar Imóvel"]',
+        "xpath=html/body/div/div/header/nav/div[2]/a[4]",
+        "xpath=html/body/div/div/div/header/nav/div[2]/a[4]",
+    ),
+    "footer.restricted_access": (
+        'role=link[name="Acesso Restrito"]',
+        "xpath=html/body/div/div/footer/div/a",
+        "xpath=html/body/div/div/footer/div/div/a/img",
+    ),
+    "home.section_card": (
+        "xpath=html/body/div/div/section/div/div[2]/div/div",
+    ),
+    "home.section_button": (
+        "xpath=html/body/div/div/section/div/div[3]/button",
+    ),
+    "home.draw_on_map": (
+        'role=button[name=/Desenhar no mapa|Draw on map|Dibujar en el mapa/]',
+    ),
+    "listing.second_card_details": (
+        '[data-testid="property-card"] >> nth=1 >> role=button[name=/Detalhes|Details|Detalles/]',
+        "xpath=html/body/div/div/section/div/div[2]/div[2]/div[2]/div[2]/button",
+    ),
+    "detail.gallery_next": (
+        'section:has(h2:has-text("Galeria de Fotos")) .grid button >> nth=1',
+        "xpath=html/body/div/div/div/main/div/div/section/div[3]/button[2]",
+    ),
+    "detail.call": (
+        'role=button[name="Ligar Agora"]',
+        "xpath=html/body/div/div/div/main/div/aside/div/div/div/button",
+    ),
+    "detail.whatsapp": (
+        'role=button[name="WhatsApp"]',
+        "xpath=html/body/div/div/div/main/div/aside/div/div/div/button[2]",
+    ),
+    "publish.admin_access": (
+        'role=button[name="Acessar Painel Administrativo"]',
+        "xpath=html/body/div/div/div/div/div[3]/button",
+    ),
+
+    # Admin
+    "admin_login.email": (
+        'form input[type="email"]',
+        "xpath=html/body/div/div/div/div/div/form/div/input",
+    ),
+    "admin_login.password": (
+        'form input[type="password"]',
+        "xpath=html/body/div/div/div/div/div/form/div[2]/div/input",
+    ),
+    "admin_login.submit": (
+        'form button[type="submit"]',
+        "xpath=html/body/div/div/div/div/div/form/div[3]/button",
+    ),
+    "admin.manage_properties": (
+        'role=button[name="Gerenciar Imóveis"]',
+        "xpath=html/body/div/div/div/div[3]/main/div/div[3]/div/button[2]",
+    ),
+    "admin.filters": (
+        'role=button[name="Filtros"]',
+        "xpath=html/body/div/div/div/div[3]/main/div/div[2]/div/div/div[2]/button",
+    ),
+    "admin.sort_date": (
+        'select:has(option[value="data_publicacao"])',
+        "xpath=html/body/div/div/div/div[3]/main/div/div[2]/div/div/div[2]/div/div/div[4]/div/button",
+    ),
+    "admin.clear_filters": (
+        'role=button[name="Limpar filtros"]',
+        "xpath=html/body/div/div/div/div[3]/main/div/div[2]/div/div/div[2]/div/div/div[5]/button",
+    ),
+    "admin.publish_new": (
+        'role=button[name="Publicar Novo Imóvel"]',
+    ),
+    "publish_form.operation_rent": (
+        'form >> role=button[name="Aluguel" s]',
+    ),
+    "publish_form.operation_season": (
+        'form >> role=button[name="Temporada" s]',
+    ),
+    "publish_form.type_land": (
+        'form >> role=button[name="Terreno" s]',
+    ),
+    "publish_form.submit": (
+        'form button[type="submit"]',
+    ),
+    "admin.logout": (
+        'role=button[name="Sair"]',
+        "xpath=html/body/div/div/div/div[2]/div/div[2]/button",
+    ),
+
+    # Third-party overlays the generator ran into
+    "external.instagram_login": (
+        "xpath=html/body/div[7]/div[2]/div/div/div/div/div[2]/div/div/div/div/div[2]/div/div[2]/div/div/div/div[2]/div",
+    ),
+}
+
+# Lookups slower than this are flagged in the report.
+SLOW_LOOKUP_MS = 250
+
+# name -> index of the fallback candidate that matched last, shared by the
+# process. It only orders the fallbacks: the preferred candidates are
+# always probed first, so an early fallback hit (say, before the test id
+# rendered) does not stick for the rest of the run.
+_resolved = {}
+
+_stats = weakref.WeakKeyDictionary()
+
+
+def _stats_for(context):
+    stats = _stats.get(context)
+    if stats is None:
+        stats = _stats[context] = {}
+    return stats
+
+
+async def resolve(scope, name):
+    """Return a locator for registry entry `name` within a page or frame.
+
+    The preferred candidates (anything but an absolute XPath) are probed
+    in registry order, then the XPath fallbacks, starting with the one
+    that matched last time. If none matches yet (the element has not
+    rendered), the returned locator matches any of them, so the action's
+    own wait covers whichever appears first.
+    """
+    try:
+        candidates = SELECTORS[name]
+    except KeyError:
+        raise KeyError(f"unknown selector {name!r}; add it to harness/registry.py") from None
+
+    preferred = [i for i, c in enumerate(candidates) if not c.startswith("xpath=")]
+    fallbacks = [i for i, c in enumerate(candidates) if c.startswith("xpath=")]
+    last = _resolved.get(name)
+    if last in fallbacks:
+        fallbacks.remove(last)
+        fallbacks.insert(0, last)
+    started = time.perf_counter()
+    chosen, matches = None, 0
+    for index in preferred + fallbacks:
+        matches = await scope.locator(candidates[index]).count()
+        if matches:
+            chosen = index
+            if index not in preferred:
+                _resolved[name] = index
+            break
+    elapsed = (time.perf_counter() - started) * 1000
+
+    page = getattr(scope, "page", scope)
+    entry = _stats_for(page.context).setdefault(
+        name, {"lookups": 0, "totalMs": 0.0, "maxMs": 0.0, "maxMatches": 0, "strategy": None, "unresolved": 0},
+    )
+    entry["lookups"] += 1
+    entry["totalMs"] += elapsed
+    entry["maxMs"] = max(entry["maxMs"], elapsed)
+    entry["maxMatches"] = max(entry["maxMatches"], matches)
+    if chosen is None:
+        entry["unresolved"] += 1
+        locator = scope.locator(candidates[0])
+        for candidate in candidates[1:]:
+            locator = locator.or_(scope.locator(candidate))
+        return locator.first
+    entry["strategy"] = candidates[chosen]
+    return scope.locator(candidates[chosen]).first
+
+
+def lookup_report(context):
+    """Per-selector timing for `context`, slowest first, with problem flags."""
+    report = []
+    for name, entry in _stats_for(context).items():
+        report.append({
+            "name": name,
+            **entry,
+            "totalMs": round(entry["totalMs"], 1),
+            "maxMs": round(entry["maxMs"], 1),
+            "slow": entry["maxMs"] > SLOW_LOOKUP_MS,
+            "ambiguous": entry["maxMatches"] > 1,
+            "fallback": entry["strategy"] is not None and entry["strategy"].startswith("xpath="),
+        })
+    return sorted(report, key=lambda e: e["totalMs"], reverse=True)
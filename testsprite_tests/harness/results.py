@@ -0,0 +1,83 @@
+"""Exporting run results to the TestSprite `tmp/test_results.json` format.
+
+The results of record are the append-only stream in `resultstore`; this
+file is a snapshot of it for TestSprite tooling, rewritten on request.
+"""
+
+import json
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+
+from .resultstore import STREAM_PATH, ResultStore, latest_by_test
+from .suite import TESTS_DIR, TestCase
+
+RESULTS_PATH = TESTS_DIR / "tmp" / "test_results.json"
+PLAN_PATH = TESTS_DIR / "testsprite_frontend_test_plan.json"
+
+
+def load_plan(path=PLAN_PATH):
+    """Return the frontend test plan keyed by test case id."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return {entry["id"]: entry for entry in json.load(f)}
+    except FileNotFoundError:
+        return {}
+
+
+def _timestamp():
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def to_entry(result, case, plan, previous=None):
+    """Build a test_results.json entry, keeping the ids of a previous entry."""
+    planned = plan.get(case.id, {})
+    previous = previous or {}
+    now = _timestamp()
+    return {
+        "projectId": previous.get("projectId"),
+        "testId": previous.get("testId") or str(uuid.uuid4()),
+        "userId": previous.get("userId"),
+        "title": f"{case.id}-{planned.get('title', case.title)}",
+        "description": planned.get("description", ""),
+        "code": Path(case.path).read_text(encoding="utf-8"),
+        "testStatus": result["testStatus"],
+        "testError": result["testError"] or "",
+        "testType": "FRONTEND",
+        "createFrom": "local",
+        "testVisualization": None,
+        "created": previous.get("created", now),
+        "modified": now,
+    }
+
+
+def merge_results(results, cases, path=RESULTS_PATH):
+    """Replace the entries of the cases that ran and keep every other entry."""
+    path = Path(path)
+    try:
+        with open(path, encoding="utf-8") as f:
+            existing = json.load(f)
+    except FileNotFoundError:
+        existing = []
+
+    by_id = {entry["title"].split("-", 1)[0]: entry for entry in existing}
+    project = {k: v for k, v in (existing[0] if existing else {}).items() if k in ("projectId", "userId")}
+    plan = load_plan()
+    cases_by_id = {case.id: case for case in cases}
+    for result in results:
+        previous = by_id.get(result["id"], project)
+        by_id[result["id"]] = to_entry(result, cases_by_id[result["id"]], plan, previous)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump([by_id[key] for key in sorted(by_id)], f, ensure_ascii=False, indent=2)
+        f.write("\n")
+    return path
+
+
+def export_stream(stream_path=STREAM_PATH, path=RESULTS_PATH):
+    """Write the latest result of every test case in the stream to `path`."""
+    store = ResultStore(stream_path)
+    records = sorted(latest_by_test(stream_path).values(), key=lambda r: r["id"])
+    cases = [TestCase(r["id"], r["title"], store.code_dir / f"{r['codeSha']}.py") for r in records]
+    return merge_results(records, cases, path)
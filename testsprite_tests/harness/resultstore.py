@@ -0,0 +1,179 @@
+"""Append-only JSONL store for run results.
+
+Every finished test case appends one line to `tmp/results/results.jsonl`.
+The script source is not repeated per line. It is written once under
+`tmp/results/code/<sha256>.py` and the line carries the hash. Writing a
+result costs one short append however long the history gets, and shard
+workers can append concurrently because each line is a single `O_APPEND`
+write.
+
+Readers stream the file line by line. `ReportState` keeps running
+aggregates together with the byte offset it has read up to, so
+regenerating a report only reads the lines appended since the last time.
+"""
+
+import hashlib
+import json
+import os
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+
+from .suite import TESTS_DIR
+
+STORE_DIR = TESTS_DIR / "tmp" / "results"
+STREAM_PATH = STORE_DIR / "results.jsonl"
+STATE_PATH = STORE_DIR / "report-state.json"
+
+# Per-test fields of a run result that belong elsewhere: spans in the trace
+# files, coverage in the impact map.
+_NOT_STORED = {"spans", "coverage"}
+
+# Runs kept in the report state; older ones only count towards totals.
+RECENT_RUNS = 50
+# Durations kept per test case for scheduling.
+RECENT_DURATIONS = 5
+
+
+def new_run_id():
+    return f"{datetime.now(timezone.utc):%Y%m%dT%H%M%SZ}-{uuid.uuid4().hex[:6]}"
+
+
+class ResultStore:
+    """Appends results to the stream and code to the content-addressed store."""
+
+    def __init__(self, path=STREAM_PATH, run_id=None):
+        self.path = Path(path)
+        self.code_dir = self.path.parent / "code"
+        self.run_id = run_id or new_run_id()
+
+    def store_code(self, source):
+        digest = hashlib.sha256(source.encode("utf-8")).hexdigest()
+        path = self.code_dir / f"{digest}.py"
+        if not path.exists():
+            self.code_dir.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(source, encoding="utf-8")
+            os.replace(tmp, path)
+        return digest
+
+    def load_code(self, digest):
+        return (self.code_dir / f"{digest}.py").read_text(encoding="utf-8")
+
+    def append(self, result, case):
+        """Append one finished test case; returns the stored record."""
+        record = {
+            "run": self.run_id,
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+            **{k: v for k, v in result.items() if k not in _NOT_STORED},
+            "codeSha": self.store_code(Path(case.path).read_text(encoding="utf-8")),
+        }
+        line = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, line)
+        finally:
+            os.close(fd)
+        return record
+
+
+def iter_records(path=STREAM_PATH, offset=0):
+    """Yield `(record, end_offset)` for each complete line from `offset` on.
+
+    A trailing line without a newline is a write in progress and is left
+    for the next read.
+    """
+    try:
+        f = open(path, "rb")
+    except FileNotFoundError:
+        return
+    with f:
+        f.seek(offset)
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            offset += len(line)
+            if line.strip():
+                yield json.loads(line), offset
+
+
+def latest_by_test(path=STREAM_PATH):
+    """Return the most recent record of every test case, streaming the file."""
+    latest = {}
+    for record, _ in iter_records(path):
+        latest[record["id"]] = record
+    return latest
+
+
+class ReportState:
+    """Running aggregates over the stream, resumable from a byte offset."""
+
+    def __init__(self, offset=0, tests=None, runs=None, records=0):
+        self.offset = offset
+        self.tests = tests or {}
+        self.runs = runs or {}
+        self.records = records
+
+    @classmethod
+    def load(cls, path=STATE_PATH):
+        try:
+            with open(path, encoding="utf-8") as f:
+                return cls(**json.load(f))
+        except FileNotFoundError:
+            return cls()
+
+    def save(self, path=STATE_PATH):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"offset": self.offset, "tests": self.tests, "runs": self.runs, "records": self.records}, f)
+        os.replace(tmp, path)
+
+    def update(self, path=STREAM_PATH):
+        """Fold in the lines appended since the last update; returns how many."""
+        if Path(path).exists() and Path(path).stat().st_size < self.offset:
+            # The stream was truncated or replaced; start over.
+            self.__init__()
+        added = 0
+        for record, offset in iter_records(path, self.offset):
+            self._add(record)
+            self.offset = offset
+            added += 1
+        self.records += added
+        return added
+
+    def _add(self, record):
+        passed = record["testStatus"] == "PASSED"
+        test = self.tests.setdefault(record["id"], {
+            "title": record["title"], "runs": 0, "passed": 0, "failed": 0, "flips": 0,
+            "totalDuration": 0.0, "lastStatus": None, "lastError": None, "lastRun": None,
+            "lastTimestamp": None, "codeSha": None, "recentDurations": [],
+        })
+        if test["lastStatus"] is not None and test["lastStatus"] != record["testStatus"]:
+            test["flips"] += 1
+        test["runs"] += 1
+        test["passed" if passed else "failed"] += 1
+        test["totalDuration"] += record.get("duration") or 0.0
+        if record.get("duration") is not None:
+            test["recentDurations"] = (test.get("recentDurations", []) + [record["duration"]])[-RECENT_DURATIONS:]
+        test.update(
+            title=record["title"], lastStatus=record["testStatus"], lastError=record.get("testError"),
+            lastRun=record["run"], lastTimestamp=record["timestamp"], codeSha=record.get("codeSha"),
+        )
+
+        run = self.runs.setdefault(record["run"], {"started": record["timestamp"], "passed": 0, "failed": 0, "duration": 0.0})
+        run["passed" if passed else "failed"] += 1
+        run["duration"] += record.get("duration") or 0.0
+        if len(self.runs) > RECENT_RUNS:
+            oldest = min(self.runs, key=lambda r: self.runs[r]["started"])
+            del self.runs[oldest]
+
+
+def duration_history(stream=STREAM_PATH, state_path=STATE_PATH):
+    """Return `{test id: [recent durations in s]}`, reading only new lines."""
+    state = ReportState.load(state_path)
+    if state.update(stream):
+        state.save(state_path)
+    return {test_id: test.get("recentDurations", []) for test_id, test in state.tests.items()}
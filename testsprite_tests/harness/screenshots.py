@@ -0,0 +1,169 @@
+"""Screenshot sink that keeps capture off the test's critical path.
+
+`capture()` only waits for the browser to hand over the image bytes; hashing,
+optional re-encoding and the disk write happen on a thread pool while the
+test moves on. Images are stored once per content hash under
+`objects/`, and each capture name (`01_initial_page`, ...) is recorded in
+`manifest.json` and hard-linked to its object, so pixel-identical frames
+cost one file no matter how many steps take them.
+
+Formats: ``png`` (lossless, the default), ``jpeg`` with a quality setting,
+both encoded by Chromium, and ``webp``, re-encoded from PNG on the pool.
+WebP needs Pillow, which is optional.
+"""
+
+import asyncio
+import hashlib
+import io
+import json
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+from .suite import TESTS_DIR
+from .tracing import tracer_for
+
+SCREENSHOT_DIR = TESTS_DIR.parent / "test_screenshots"
+
+FORMATS = ("png", "jpeg", "webp")
+
+
+def _encode_webp(data, quality):
+    try:
+        from PIL import Image
+    except ImportError:
+        raise RuntimeError("format='webp' needs Pillow: pip install pillow") from None
+
+    out = io.BytesIO()
+    Image.open(io.BytesIO(data)).save(out, "WEBP", quality=quality or 80)
+    return out.getvalue()
+
+
+class ScreenshotSink:
+    """Asynchronous, content-addressed store for page screenshots.
+
+        async with ScreenshotSink(format="jpeg", quality=80) as shots:
+            await shots.capture(page, "01_initial_page")
+    """
+
+    def __init__(self, directory=SCREENSHOT_DIR, format="png", quality=None, workers=2, link=True):
+        if format not in FORMATS:
+            raise ValueError(f"unknown screenshot format {format!r}, expected one of {FORMATS}")
+        self.directory = Path(directory)
+        self.format = format
+        self.quality = quality
+        self.link = link
+        self.manifest = {}
+        self.stats = {"captures": 0, "written": 0, "duplicates": 0, "captureMs": 0.0, "storeMs": 0.0}
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="screenshots")
+        self._lock = threading.Lock()
+        self._pending = set()
+        self._stored = set()
+
+    @property
+    def extension(self):
+        return "jpg" if self.format == "jpeg" else self.format
+
+    def object_path(self, digest):
+        return self.directory / "objects" / digest[:2] / f"{digest}.{self.extension}"
+
+    async def capture(self, target, name, **options):
+        """Take a screenshot of a page or locator and queue it for storage.
+
+        Returns as soon as the bytes are in hand; the returned future
+        resolves to the object path once the image is on disk.
+        """
+        started = time.perf_counter()
+        if self.format == "jpeg":
+            options.setdefault("type", "jpeg")
+            options.setdefault("quality", self.quality or 80)
+        else:
+            options.setdefault("type", "png")
+        page = getattr(target, "page", target)
+        async with tracer_for(page.context).span("screenshot", name, format=self.format):
+            data = await target.screenshot(**options)
+        self.stats["captures"] += 1
+        self.stats["captureMs"] += (time.perf_counter() - started) * 1000
+
+        future = asyncio.get_running_loop().run_in_executor(self._executor, self._store, name, data)
+        self._pending.add(future)
+        future.add_done_callback(self._pending.discard)
+        return future
+
+    def _store(self, name, data):
+        started = time.perf_counter()
+        if self.format == "webp":
+            data = _encode_webp(data, self.quality)
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.object_path(digest)
+        # Hashing and encoding run in parallel; the write itself is serialised
+        # so a duplicate never links to an object that is still being written.
+        with self._lock:
+            exists = digest in self._stored or path.exists()
+            if not exists:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = path.with_suffix(f".{os.getpid()}.tmp")
+                tmp.write_bytes(data)
+                os.replace(tmp, path)
+            self._stored.add(digest)
+        if self.link:
+            self._link(path, self.directory / f"{name}.{self.extension}")
+
+        with self._lock:
+            self.stats["written" if not exists else "duplicates"] += 1
+            self.stats["storeMs"] += (time.perf_counter() - started) * 1000
+            self.manifest[name] = {
+                "sha256": digest,
+                "file": path.relative_to(self.directory).as_posix(),
+                "bytes": len(data),
+                "capturedAt": datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+            }
+        return path
+
+    @staticmethod
+    def _link(source, name_path):
+        name_path.unlink(missing_ok=True)
+        try:
+            os.link(source, name_path)
+        except OSError:
+            shutil.copyfile(source, name_path)
+
+    async def flush(self):
+        """Wait for every queued screenshot to reach the disk."""
+        if self._pending:
+            await asyncio.gather(*list(self._pending))
+
+    def _write_manifest(self):
+        path = self.directory / "manifest.json"
+        try:
+            with open(path, encoding="utf-8") as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            manifest = {}
+        manifest.update(self.manifest)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+        os.replace(tmp, path)
+
+    async def close(self):
+        try:
+            await self.flush()
+        finally:
+            self._executor.shutdown(wait=True)
+            if self.manifest:
+                self._write_manifest()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    def report(self):
+        return {**self.stats, "captureMs": round(self.stats["captureMs"], 1), "storeMs": round(self.stats["storeMs"], 1)}
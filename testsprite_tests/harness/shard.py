@@ -0,0 +1,110 @@
+"""Shard test cases across worker processes, one warm browser per worker."""
+
+import asyncio
+import heapq
+import os
+import statistics
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .pool import build_pool
+from .resultstore import ResultStore
+from .suite import run_case
+
+
+def default_workers():
+    return os.cpu_count() or 1
+
+
+# Assumed duration, in seconds, of a case with no history when no other
+# case has any either.
+DEFAULT_DURATION = 10.0
+
+
+def shard(cases, workers):
+    """Split `cases` round-robin into at most `workers` non-empty shards."""
+    workers = max(1, min(workers, len(cases)))
+    return [cases[i::workers] for i in range(workers)]
+
+
+def predict_durations(cases, history):
+    """Median of each case's recent durations; unknown cases get the median of the rest."""
+    predicted = {case.id: statistics.median(history[case.id]) for case in cases if history.get(case.id)}
+    fallback = statistics.median(predicted.values()) if predicted else DEFAULT_DURATION
+    return {case.id: predicted.get(case.id, fallback) for case in cases}
+
+
+def schedule(cases, workers, predicted):
+    """Longest-processing-time-first split of `cases` into at most `workers` shards.
+
+    Each case, longest first, goes to the shard with the least predicted
+    work so far. Returns `(shards, predicted makespan in s)`.
+    """
+    workers = max(1, min(workers, len(cases)))
+    loads = [(0.0, i) for i in range(workers)]
+    shards = [[] for _ in range(workers)]
+    for case in sorted(cases, key=lambda c: predicted[c.id], reverse=True):
+        load, index = heapq.heappop(loads)
+        shards[index].append(case)
+        heapq.heappush(loads, (load + predicted[case.id], index))
+    return shards, max(load for load, _ in loads)
+
+
+async def _run_shard_async(cases, pool_options, store):
+    results = []
+    async with build_pool(**pool_options) as pool:
+        for case in cases:
+            result = await run_case(pool, case)
+            if store is not None:
+                store.append(result, case)
+            results.append(result)
+    return results
+
+
+def _run_shard(cases, pool_options, store=None):
+    return asyncio.run(_run_shard_async(cases, pool_options, store))
+
+
+def crashed_results(cases, exc):
+    """FAILED results for the cases of a shard whose worker died with `exc`."""
+    error = "".join(traceback.format_exception(exc)).strip()
+    return [
+        {"id": case.id, "title": case.title, "testStatus": "FAILED", "testError": f"worker crashed: {error}",
+         "duration": 0.0, "waits": None, "selectors": [], "spans": [], "pid": None}
+        for case in cases
+    ]
+
+
+def run_sharded(cases, workers, pool_options=None, on_result=None, store=None, shards=None):
+    """Run `cases` on a process pool and return their results in id order.
+
+    `pool_options` are the `build_pool` keyword arguments for every worker.
+
+    `on_result` is called in the parent for every result as its shard
+    finishes, so progress shows up before the slowest shard is done.
+
+    With a `ResultStore`, every worker appends each result to the stream
+    as soon as that test case finishes.
+
+    `shards` overrides the round-robin split, e.g. with `schedule()`.
+
+    A worker that dies (say, its browser failed to launch) fails the cases
+    of its shard with the traceback; the other shards' results are kept.
+    """
+    shards = shards or shard(cases, workers)
+    results = []
+    with ProcessPoolExecutor(max_workers=len(shards)) as executor:
+        futures = {executor.submit(_run_shard, cases, pool_options or {}, store): cases for cases in shards}
+        for future in as_completed(futures):
+            try:
+                shard_results = future.result()
+            except Exception as exc:
+                shard_results = crashed_results(futures[future], exc)
+                if store is not None:
+                    for result, case in zip(shard_results, futures[future]):
+                        store.append(result, case)
+            for result in shard_results:
+                if on_result:
+                    on_result(result)
+                results.append(result)
+    return sorted(results, key=lambda r: r["id"])
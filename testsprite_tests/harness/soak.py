@@ -0,0 +1,131 @@
+"""Memory soak: cycle the SPA's main pages in one long-lived tab.
+
+A kiosk tab never reloads, so anything a page leaves behind — a listener
+that is never removed, a realtime channel, Google Maps objects held by a
+closure — piles up. `soak` walks home → detail → back → explore → back →
+map → home over and over without reloading, and every few cycles forces a
+garbage collection and samples CDP `Performance.getMetrics`: JS heap,
+DOM nodes, event listeners and documents.
+
+`find_growth` then fits a line through each metric after the warm-up
+and flags it when it both keeps rising (most steps go up) and grows
+faster than its limit per cycle. A forced GC before every sample keeps
+garbage that simply has not been collected yet from looking like a leak.
+"""
+
+import statistics
+import time
+
+from playwright import async_api
+
+from .pool import BASE_URL, open_app
+from .waits import Steps
+
+# Each step of one cycle: (name, registry entry to click, or script to run).
+# Detail pushes ?page=propertyDetail and explore pushes #explore, so going
+# back pops them; map has no URL of its own and is left through the logo.
+CYCLE = (
+    ("detail", "click", "listing.second_card_details"),
+    ("back", "back", None),
+    ("explore", "script", "location.hash = 'explore'"),
+    ("back", "back", None),
+    ("map", "click", "home.draw_on_map"),
+    ("home", "click", "header.logo"),
+)
+
+METRICS = {
+    # Performance.getMetrics name -> (sample key, scale)
+    "JSHeapUsedSize": ("heapUsedMB", 1 / 2**20),
+    "Nodes": ("domNodes", 1),
+    "JSEventListeners": ("listeners", 1),
+    "Documents": ("documents", 1),
+}
+
+# Growth per cycle above which a steadily rising metric counts as a leak.
+GROWTH_LIMITS = {"heapUsedMB": 0.05, "domNodes": 1, "listeners": 0.5, "documents": 0.1}
+# Share of sample-to-sample steps that must go up for growth to count as steady.
+RISING_SHARE = 0.7
+# Samples before this share of the run are warm-up (caches, lazy chunks).
+WARMUP_SHARE = 0.2
+
+
+async def sample_memory(session):
+    """Collect garbage, then read heap, DOM and listener counts over `session`."""
+    await session.send("HeapProfiler.collectGarbage")
+    metrics = {m["name"]: m["value"] for m in (await session.send("Performance.getMetrics"))["metrics"]}
+    return {key: round(metrics.get(name, 0) * scale, 3) for name, (key, scale) in METRICS.items()}
+
+
+async def _step(page, steps, action, target):
+    if action == "click":
+        await steps.click(steps.locate(target))
+    elif action == "back":
+        await page.go_back()
+    else:
+        await page.evaluate(target)
+    await steps.settle()
+
+
+async def soak(pool, cycles=200, sample_every=5, url=BASE_URL, on_sample=None):
+    """Run `cycles` page cycles in one context; return `(samples, error)`.
+
+    A sample is taken before the first cycle and after every
+    `sample_every` cycles, with the cycle count and how long the last
+    cycle took. A failing step ends the soak early; its error is returned
+    next to the samples gathered so far. `on_sample(sample)` is called as
+    each sample is taken.
+    """
+    samples = []
+    async with pool.context() as context:
+        page = await open_app(context, url)
+        steps = Steps(page)
+        await steps.settle()
+        session = await context.new_cdp_session(page)
+        await session.send("Performance.enable")
+
+        async def record(cycle, cycle_ms):
+            sample = {"cycle": cycle, "cycleMs": cycle_ms, **await sample_memory(session)}
+            samples.append(sample)
+            if on_sample:
+                on_sample(sample)
+
+        await record(0, None)
+        for cycle in range(1, cycles + 1):
+            started = time.perf_counter()
+            for name, action, target in CYCLE:
+                try:
+                    await _step(page, steps, action, target)
+                except async_api.Error as exc:
+                    return samples, f"cycle {cycle}, step {name}: {str(exc).splitlines()[0]}"
+            if cycle % sample_every == 0 or cycle == cycles:
+                await record(cycle, round((time.perf_counter() - started) * 1000, 1))
+    return samples, None
+
+
+def find_growth(samples):
+    """Fit every metric against the cycle count, after the warm-up.
+
+    Returns `{metric: {start, end, perCycle, risingShare, leak}}`;
+    ``cycleMs`` is fitted too, so a tab that slows down shows, but it is
+    never flagged on its own.
+    """
+    measured = [s for s in samples if s["cycle"] > 0]
+    steady = measured[int(len(measured) * WARMUP_SHARE):]
+    growth = {}
+    for metric in (*GROWTH_LIMITS, "cycleMs"):
+        points = [(s["cycle"], s[metric]) for s in steady if s.get(metric) is not None]
+        if len(points) < 3:
+            continue
+        cycles, values = zip(*points)
+        slope = statistics.linear_regression(cycles, values).slope
+        rises = sum(b > a for a, b in zip(values, values[1:]))
+        rising_share = rises / (len(values) - 1)
+        limit = GROWTH_LIMITS.get(metric)
+        growth[metric] = {
+            "start": values[0],
+            "end": values[-1],
+            "perCycle": round(slope, 4),
+            "risingShare": round(rising_share, 2),
+            "leak": limit is not None and slope > limit and rising_share >= RISING_SHARE,
+        }
+    return growth
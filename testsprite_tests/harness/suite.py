@@ -0,0 +1,101 @@
+"""Discovery and execution of the TC0xx scripts as importable coroutines."""
+
+import importlib.util
+import os
+import re
+import time
+import traceback
+from dataclasses import dataclass
+from pathlib import Path
+
+from .perftrace import trace_transitions
+from .registry import lookup_report
+from .tracing import tracer_for
+from .waits import ledger_for
+
+TESTS_DIR = Path(__file__).resolve().parent.parent
+
+_CASE_FILE = re.compile(r"^(TC\d{3})_(.+)\.py$")
+
+
+@dataclass
+class TestCase:
+    id: str
+    title: str
+    path: Path
+
+    def load(self):
+        """Import the script; it defines `run_test(context)` and optionally `SESSION`, `NETWORK_PROFILE` and `PERF_TRACE`."""
+        spec = importlib.util.spec_from_file_location(self.path.stem, self.path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+
+    def session(self):
+        """Name of the stored session the case starts from, if any."""
+        return getattr(self.load(), "SESSION", None)
+
+
+def sessions(cases):
+    """Stored sessions `cases` start from.
+
+    A script that does not import is skipped: run_case reports it as
+    FAILED when the case runs, instead of it stopping every other case.
+    """
+    names = set()
+    for case in cases:
+        try:
+            names.add(case.session())
+        except Exception:
+            continue
+    return names - {None}
+
+
+def discover_cases(directory=TESTS_DIR, ids=None):
+    """Return the TC scripts in `directory`, optionally filtered by id, in id order."""
+    wanted = {i.upper() for i in ids} if ids else None
+    cases = []
+    for path in sorted(Path(directory).glob("TC*.py")):
+        match = _CASE_FILE.match(path.name)
+        if not match:
+            continue
+        case_id, slug = match.groups()
+        if wanted is not None and case_id not in wanted:
+            continue
+        cases.append(TestCase(case_id, slug.replace("_", " "), path))
+    return cases
+
+
+async def run_case(pool, case):
+    """Run one test case in a fresh context of `pool` and return its result."""
+    started = time.perf_counter()
+    status, error, waits, selectors, spans, reports = "PASSED", None, None, [], [], {}
+    try:
+        module = case.load()
+        async with pool.context(
+            session=getattr(module, "SESSION", None), profile=getattr(module, "NETWORK_PROFILE", None),
+        ) as context:
+            trace_transitions(context, getattr(module, "PERF_TRACE", None), case.id)
+            try:
+                await module.run_test(context)
+            finally:
+                waits = ledger_for(context).summary()
+                selectors = lookup_report(context)
+                spans = tracer_for(context).export()
+                reports = await pool.reports(context)
+    except AssertionError as exc:
+        status, error = "FAILED", str(exc) or "AssertionError"
+    except Exception:
+        status, error = "FAILED", traceback.format_exc(limit=3)
+    return {
+        "id": case.id,
+        "title": case.title,
+        "testStatus": status,
+        "testError": error,
+        "duration": round(time.perf_counter() - started, 3),
+        "waits": waits,
+        "selectors": selectors,
+        "spans": spans,
+        "pid": os.getpid(),
+        **reports,
+    }
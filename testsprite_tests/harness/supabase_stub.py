@@ -0,0 +1,651 @@
+"""Local stand-in for the subset of Supabase the portal uses.
+
+Serves PostgREST-style `/rest/v1` reads and writes (select with embedded
+resources, filters, `or`, order, limit/offset, single-object responses),
+the `verify_admin_login` RPC, GoTrue password/sign-up/refresh/user/logout,
+a minimal `midia` storage bucket and the `get-properties` edge function, all
+from an in-memory copy of a seed fixture.
+
+Two ways to use it:
+
+* in the harness, `install(context, stub)` routes every request the app
+  makes to the hosted project into the stub, without an HTTP hop and
+  without restarting the dev server;
+* standalone, `python -m harness.supabase_stub --port 54321` serves it over
+  HTTP; start Vite with `VITE_SUPABASE_URL=http://localhost:54321` to use it.
+
+Realtime websockets are not implemented; the client keeps retrying in the
+background, which the app tolerates.
+"""
+
+import argparse
+import base64
+import copy
+import hashlib
+import hmac
+import json
+import re
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+SUPABASE_URL = "https://ckzhvurabmhvteekyjxg.supabase.co"
+SEED_PATH = Path(__file__).resolve().parent / "fixtures" / "supabase_seed.json"
+
+TABLES = ("imoveis", "midias_imovel", "perfis")
+
+# Tables whose primary key is a bigserial the stub has to generate.
+_SERIAL_TABLES = {"imoveis", "midias_imovel"}
+
+# parent table -> embed name -> (target table, parent column, target column, to-many)
+RELATIONS = {
+    "imoveis": {
+        "midias_imovel": ("midias_imovel", "id", "imovel_id", True),
+        "perfis": ("perfis", "anunciante_id", "id", False),
+        "anunciante_id": ("perfis", "anunciante_id", "id", False),
+    },
+    "midias_imovel": {
+        "imoveis": ("imoveis", "imovel_id", "id", False),
+        "imovel_id": ("imoveis", "imovel_id", "id", False),
+    },
+}
+
+_RESERVED_PARAMS = {"select", "order", "limit", "offset", "on_conflict", "columns"}
+
+CORS_HEADERS = {
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Methods": "GET, HEAD, POST, PATCH, PUT, DELETE, OPTIONS",
+    "Access-Control-Allow-Headers": (
+        "authorization, x-client-info, apikey, content-type, prefer, range, "
+        "accept-profile, content-profile, x-upsert, x-supabase-api-version"
+    ),
+    "Access-Control-Expose-Headers": "Content-Range, X-Total-Count",
+}
+
+_JWT_SECRET = b"local-supabase-stub"
+_PLACEHOLDER_IMAGE = (
+    b'<svg xmlns="http://www.w3.org/2000/svg" width="640" height="400">'
+    b'<rect width="100%" height="100%" fill="#e5e7eb"/></svg>'
+)
+
+
+class StubError(Exception):
+    """An error response in PostgREST/GoTrue shape."""
+
+    def __init__(self, status, message, code="PGRST000", details=None):
+        super().__init__(message)
+        self.status = status
+        self.code = code
+        self.details = details
+
+    def body(self):
+        return {"code": self.code, "message": str(self), "details": self.details, "hint": None}
+
+
+def load_seed(path=SEED_PATH):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _now():
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _b64url(raw):
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def _jwt(claims):
+    header = _b64url(json.dumps({"alg": "HS256", "typ": "JWT"}).encode())
+    payload = _b64url(json.dumps(claims).encode())
+    signature = hmac.new(_JWT_SECRET, f"{header}.{payload}".encode(), hashlib.sha256).digest()
+    return f"{header}.{payload}.{_b64url(signature)}"
+
+
+# --- select / filter parsing -------------------------------------------------
+
+def _split_top_level(text, sep=","):
+    """Split on `sep` outside parentheses and double quotes."""
+    parts, depth, quoted, current = [], 0, False, []
+    for char in text:
+        if char == '"':
+            quoted = not quoted
+        elif not quoted and char == "(":
+            depth += 1
+        elif not quoted and char == ")":
+            depth -= 1
+        if char == sep and depth == 0 and not quoted:
+            parts.append("".join(current))
+            current = []
+        else:
+            current.append(char)
+    parts.append("".join(current))
+    return [p.strip() for p in parts if p.strip()]
+
+
+_EMBED = re.compile(r"^(?:(\w+):)?(\w+)(?:!\w+)?\s*\((.*)\)$", re.S)
+
+
+def parse_select(select):
+    """Return `(columns, embeds)`; columns is None for `*`."""
+    columns, embeds = [], []
+    for item in _split_top_level(re.sub(r"\s+", " ", select or "*")):
+        match = _EMBED.match(item)
+        if match:
+            alias, name, inner = match.groups()
+            embeds.append((alias or name, name, inner))
+        elif item == "*":
+            columns = None
+        elif columns is not None:
+            # `alias:column::cast` -> column
+            columns.append(item.split("::")[0].split(":")[-1])
+    return columns, embeds
+
+
+def _coerce(raw, sample):
+    if isinstance(sample, bool):
+        return raw == "true"
+    if isinstance(sample, (int, float)):
+        try:
+            return float(raw)
+        except ValueError:
+            return raw
+    return raw
+
+
+def _like(pattern, value, flags=0):
+    regex = "".join(".*" if c in "%*" else "." if c == "_" else re.escape(c) for c in pattern)
+    return value is not None and re.fullmatch(regex, str(value), flags | re.S) is not None
+
+
+def _compare(row, column, op, raw):
+    value = row.get(column)
+    if op == "is":
+        return {"null": value is None, "true": value is True, "false": value is False}.get(raw.lower(), False)
+    if op == "in":
+        options = [o.strip('"') for o in _split_top_level(raw.strip("()"))]
+        return value is not None and any(str(value) == o or _coerce(o, value) == value for o in options)
+    if op in ("like", "ilike"):
+        return _like(raw, value, re.I if op == "ilike" else 0)
+    if value is None:
+        return False
+    target = _coerce(raw, value)
+    if op == "eq":
+        return value == target or str(value) == raw
+    if op == "neq":
+        return not (value == target or str(value) == raw)
+    try:
+        return {
+            "gt": value > target,
+            "gte": value >= target,
+            "lt": value < target,
+            "lte": value <= target,
+        }[op]
+    except (KeyError, TypeError):
+        raise StubError(400, f"unsupported filter operator {op!r} on {column}", "PGRST100")
+
+
+def _condition(column, expression):
+    """Build a predicate from `column` and a PostgREST `[not.]op.value` expression."""
+    negate = expression.startswith("not.")
+    if negate:
+        expression = expression[4:]
+    op, _, raw = expression.partition(".")
+
+    def predicate(row):
+        return _compare(row, column, op, raw) != negate
+
+    return predicate
+
+
+def _logic(expression, conjunction):
+    """Parse the inside of `or=(...)` / `and=(...)`, which may nest."""
+    predicates = []
+    for term in _split_top_level(expression):
+        match = re.match(r"^(not\.)?(or|and)\((.*)\)$", term, re.S)
+        if match:
+            inner = _logic(match.group(3), all if match.group(2) == "and" else any)
+            predicates.append((lambda p: lambda row: not p(row))(inner) if match.group(1) else inner)
+        else:
+            column, _, rest = term.partition(".")
+            predicates.append(_condition(column, rest))
+    return lambda row: conjunction(p(row) for p in predicates)
+
+
+def parse_filters(params):
+    predicates = []
+    for key, value in params:
+        if key in _RESERVED_PARAMS:
+            continue
+        if key in ("or", "and"):
+            predicates.append(_logic(value.strip()[1:-1], any if key == "or" else all))
+        elif key in ("not.or", "not.and"):
+            inner = _logic(value.strip()[1:-1], any if key == "not.or" else all)
+            predicates.append((lambda p: lambda row: not p(row))(inner))
+        else:
+            predicates.append(_condition(key, value))
+    return predicates
+
+
+def _sort(rows, order):
+    for term in reversed(_split_top_level(order)):
+        column, *modifiers = term.split(".")
+        descending = "desc" in modifiers
+        nulls_first = "nullsfirst" in modifiers or (descending and "nullslast" not in modifiers)
+        present = [r for r in rows if r.get(column) is not None]
+        missing = [r for r in rows if r.get(column) is None]
+        present.sort(key=lambda r: r[column], reverse=descending)
+        rows = missing + present if nulls_first else present + missing
+    return rows
+
+
+# --- the stub ------------------------------------------------------------------
+
+class SupabaseStub:
+    """In-memory Supabase project seeded from a JSON fixture."""
+
+    def __init__(self, seed=None):
+        self.seed = load_seed() if seed is None else seed
+        self.lock = threading.RLock()
+        self.reset()
+
+    def reset(self):
+        """Restore the seed data, dropping everything written since."""
+        with self.lock:
+            self.tables = {name: copy.deepcopy(self.seed.get(name, [])) for name in TABLES}
+            self.auth_users = {u["email"]: dict(u) for u in self.seed.get("auth_users", [])}
+            self.admin_users = {u["email"]: dict(u) for u in self.seed.get("admin_users", [])}
+            self.sessions = {}
+            self.objects = {}
+
+    # PostgREST
+
+    def _project(self, table, row, columns, embeds):
+        out = dict(row) if columns is None else {c: row.get(c) for c in columns}
+        for alias, name, inner in embeds:
+            relation = RELATIONS.get(table, {}).get(name)
+            if relation is None:
+                raise StubError(400, f"Could not find a relationship between '{table}' and '{name}'", "PGRST200")
+            target, parent_col, target_col, many = relation
+            sub_columns, sub_embeds = parse_select(inner)
+            matches = [
+                self._project(target, r, sub_columns, sub_embeds)
+                for r in self.tables[target]
+                if r.get(target_col) is not None and r.get(target_col) == row.get(parent_col)
+            ]
+            out[alias] = matches if many else (matches[0] if matches else None)
+        return out
+
+    def _table(self, name):
+        if name not in self.tables:
+            raise StubError(404, f'relation "public.{name}" does not exist', "42P01")
+        return self.tables[name]
+
+    def _matching(self, rows, params):
+        predicates = parse_filters(params)
+        return [r for r in rows if all(p(r) for p in predicates)]
+
+    def select(self, table, params):
+        query = dict(params)
+        with self.lock:
+            rows = self._matching(self._table(table), params)
+            if "order" in query:
+                rows = _sort(rows, query["order"])
+            total = len(rows)
+            offset = _int_param(query, "offset", 0)
+            if "limit" in query:
+                rows = rows[offset:offset + _int_param(query, "limit")]
+            else:
+                rows = rows[offset:]
+            columns, embeds = parse_select(query.get("select"))
+            return [self._project(table, r, columns, embeds) for r in rows], offset, total
+
+    def insert(self, table, payload):
+        records = payload if isinstance(payload, list) else [payload]
+        with self.lock:
+            rows = self._table(table)
+            inserted = []
+            for record in records:
+                row = dict(record)
+                if table in _SERIAL_TABLES and row.get("id") is None:
+                    row["id"] = max((r["id"] for r in rows), default=0) + 1
+                if table == "imoveis":
+                    row.setdefault("data_publicacao", _now())
+                rows.append(row)
+                inserted.append(row)
+            return inserted
+
+    def update(self, table, params, changes):
+        with self.lock:
+            matched = self._matching(self._table(table), params)
+            for row in matched:
+                row.update(changes)
+            return matched
+
+    def delete(self, table, params):
+        with self.lock:
+            rows = self._table(table)
+            matched = self._matching(rows, params)
+            self.tables[table] = [r for r in rows if not any(r is m for m in matched)]
+            return matched
+
+    def rpc(self, name, args):
+        if name != "verify_admin_login":
+            raise StubError(404, f"Could not find the function public.{name}", "PGRST202")
+        admin = self.admin_users.get(args.get("p_email"))
+        if not admin or admin.get("password") != args.get("p_password"):
+            return [{"id": None, "email": None, "name": None, "role": None, "success": False}]
+        return [{"id": admin["id"], "email": admin["email"], "name": admin["name"], "role": admin["role"], "success": True}]
+
+    # GoTrue
+
+    def _user_json(self, user):
+        return {
+            "id": user["id"],
+            "aud": "authenticated",
+            "role": "authenticated",
+            "email": user["email"],
+            "email_confirmed_at": user.get("created_at", _now()),
+            "app_metadata": {"provider": "email", "providers": ["email"]},
+            "user_metadata": {},
+            "created_at": user.get("created_at", _now()),
+            "updated_at": _now(),
+        }
+
+    def _session(self, user):
+        expires_in = 3600
+        expires_at = int(time.time()) + expires_in
+        access_token = _jwt({
+            "sub": user["id"], "email": user["email"], "role": "authenticated",
+            "aud": "authenticated", "exp": expires_at, "iat": int(time.time()),
+        })
+        refresh_token = uuid.uuid4().hex
+        with self.lock:
+            self.sessions[access_token] = user["email"]
+            self.sessions[refresh_token] = user["email"]
+        return {
+            "access_token": access_token,
+            "token_type": "bearer",
+            "expires_in": expires_in,
+            "expires_at": expires_at,
+            "refresh_token": refresh_token,
+            "user": self._user_json(user),
+        }
+
+    def sign_in(self, email, password):
+        user = self.auth_users.get(email)
+        if not user or user.get("password") != password:
+            raise StubError(400, "Invalid login credentials", "invalid_credentials")
+        return self._session(user)
+
+    def sign_up(self, email, password):
+        with self.lock:
+            if email in self.auth_users:
+                raise StubError(422, "User already registered", "user_already_exists")
+            user = self.auth_users[email] = {"id": str(uuid.uuid4()), "email": email, "password": password, "created_at": _now()}
+        return self._session(user)
+
+    def refresh(self, refresh_token):
+        email = self.sessions.get(refresh_token)
+        if email is None:
+            raise StubError(400, "Invalid Refresh Token", "refresh_token_not_found")
+        return self._session(self.auth_users[email])
+
+    def user_for(self, authorization):
+        token = (authorization or "").removeprefix("Bearer ").strip()
+        email = self.sessions.get(token)
+        if email is None:
+            raise StubError(401, "invalid JWT: unable to parse or verify signature", "bad_jwt")
+        return self._user_json(self.auth_users[email])
+
+    def sign_out(self, authorization):
+        token = (authorization or "").removeprefix("Bearer ").strip()
+        with self.lock:
+            self.sessions.pop(token, None)
+
+    # HTTP dispatch
+
+    def dispatch(self, method, path, query, headers, body):
+        """Handle one request and return `(status, headers, body_bytes)`.
+
+        `headers` must have lower-case names; `body` is bytes or None.
+        """
+        if method == "OPTIONS":
+            return 204, dict(CORS_HEADERS), b""
+        params = parse_qsl(query, keep_blank_values=True)
+        try:
+            if path.startswith("/rest/v1/rpc/"):
+                return self._json(200, self.rpc(path.rsplit("/", 1)[-1], _load(body) or {}))
+            if path.startswith("/rest/v1/"):
+                return self._rest(method, path[len("/rest/v1/"):], params, headers, body)
+            if path.startswith("/auth/v1/"):
+                return self._auth(method, path[len("/auth/v1/"):], dict(params), headers, body)
+            if path.startswith("/storage/v1/"):
+                return self._storage(method, unquote(path[len("/storage/v1/"):]), headers, body)
+            if path.startswith("/functions/v1/"):
+                return self._function(path[len("/functions/v1/"):], body)
+        except StubError as exc:
+            payload = exc.body()
+            if path.startswith("/auth/v1/"):
+                payload = {"code": exc.status, "error_code": exc.code, "msg": str(exc),
+                           "error": exc.code, "error_description": str(exc)}
+            return self._json(exc.status, payload)
+        return self._json(404, {"message": f"no route for {method} {path}"})
+
+    def _json(self, status, payload, extra=None):
+        headers = {**CORS_HEADERS, "Content-Type": "application/json; charset=utf-8", **(extra or {})}
+        return status, headers, json.dumps(payload, ensure_ascii=False).encode()
+
+    def _rest(self, method, table, params, headers, body):
+        prefer = headers.get("prefer", "")
+        single = "vnd.pgrst.object" in headers.get("accept", "")
+        representation = "return=representation" in prefer
+
+        if method in ("GET", "HEAD"):
+            rows, offset, total = self.select(table, params)
+            status = 200
+        elif method == "POST":
+            rows = self.insert(table, _load(body))
+            status = 201
+        elif method in ("PATCH", "PUT"):
+            rows = self.update(table, params, _load(body) or {})
+            status = 200
+        elif method == "DELETE":
+            rows = self.delete(table, params)
+            status = 200
+        else:
+            raise StubError(405, f"method {method} not allowed", "PGRST000")
+
+        if method not in ("GET", "HEAD"):
+            offset, total = 0, len(rows)
+            if not representation:
+                return 201 if method == "POST" else 204, dict(CORS_HEADERS), b""
+            columns, embeds = parse_select(dict(params).get("select"))
+            with self.lock:
+                rows = [self._project(table, r, columns, embeds) for r in rows]
+
+        count = str(total) if "count=" in prefer else "*"
+        content_range = f"{offset}-{offset + len(rows) - 1}/{count}" if rows else f"*/{count}"
+        if single:
+            if len(rows) != 1:
+                raise StubError(406, "JSON object requested, multiple (or no) rows returned", "PGRST116",
+                                f"The result contains {len(rows)} rows")
+            payload = rows[0]
+        else:
+            payload = rows
+        status, out_headers, data = self._json(status, payload, {"Content-Range": content_range})
+        return status, out_headers, b"" if method == "HEAD" else data
+
+    def _auth(self, method, route, params, headers, body):
+        data = _load(body) or {}
+        authorization = headers.get("authorization")
+        if route == "token" and method == "POST":
+            if params.get("grant_type") == "refresh_token":
+                return self._json(200, self.refresh(data.get("refresh_token")))
+            return self._json(200, self.sign_in(data.get("email"), data.get("password")))
+        if route == "signup" and method == "POST":
+            return self._json(200, self.sign_up(data.get("email"), data.get("password")))
+        if route == "user" and method == "GET":
+            return self._json(200, self.user_for(authorization))
+        if route == "logout" and method == "POST":
+            self.sign_out(authorization)
+            return 204, dict(CORS_HEADERS), b""
+        raise StubError(404, f"auth route {route} not supported by the stub", "not_found")
+
+    def _storage(self, method, route, headers, body):
+        if route.startswith("object/public/") and method in ("GET", "HEAD"):
+            key = route[len("object/public/"):]
+            content_type, data = self.objects.get(key, ("image/svg+xml", _PLACEHOLDER_IMAGE))
+            return 200, {**CORS_HEADERS, "Content-Type": content_type}, b"" if method == "HEAD" else data
+        if route.startswith("object/") and method in ("POST", "PUT"):
+            key = route[len("object/"):]
+            with self.lock:
+                self.objects[key] = (headers.get("content-type", "application/octet-stream"), body or b"")
+            return self._json(200, {"Key": key, "Id": str(uuid.uuid4())})
+        if route.startswith("object/") and method == "DELETE":
+            bucket = route[len("object/"):].strip("/")
+            removed = []
+            with self.lock:
+                for prefix in (_load(body) or {}).get("prefixes", []):
+                    if self.objects.pop(f"{bucket}/{prefix}", None) is not None:
+                        removed.append({"name": prefix, "bucket_id": bucket})
+            return self._json(200, removed)
+        raise StubError(404, f"storage route {route} not supported by the stub", "not_found")
+
+    def _function(self, name, body):
+        # Mirrors supabase/functions/get-properties/index.ts, including its
+        # 400 `{"error": ...}` answer to a missing or malformed JSON body.
+        if name != "get-properties":
+            return self._json(404, {"error": f"function {name} not found"})
+        try:
+            user_id = json.loads(body or b"").get("userId")
+        except (ValueError, AttributeError) as exc:
+            return self._json(400, {"error": str(exc)})
+        params = [("select", "*, perfis:anunciante_id(*), midias_imovel(*)")]
+        if user_id:
+            params.append(("or", f"(status.eq.ativo,anunciante_id.eq.{user_id})"))
+        else:
+            params.append(("status", "eq.ativo"))
+        rows, _, _ = self.select("imoveis", params)
+        return self._json(200, rows)
+
+
+def _load(body):
+    if not body:
+        return None
+    try:
+        return json.loads(body)
+    except ValueError as exc:
+        raise StubError(400, f"Empty or invalid json: {exc}", "PGRST102") from None
+
+
+def _int_param(query, name, default=None):
+    raw = query.get(name, default)
+    try:
+        value = int(raw)
+    except (TypeError, ValueError):
+        raise StubError(400, f"failed to parse {name} parameter ({raw})", "PGRST100") from None
+    if value < 0:
+        raise StubError(400, f"{name} must not be negative ({raw})", "PGRST100")
+    return value
+
+
+# --- transports --------------------------------------------------------------
+
+async def install(context, stub, supabase_url=SUPABASE_URL):
+    """Route the app's Supabase traffic in `context` to `stub`."""
+
+    async def handle(route):
+        request = route.request
+        parts = urlsplit(request.url)
+        try:
+            status, headers, body = stub.dispatch(
+                request.method, parts.path, parts.query, await request.all_headers(), request.post_data_buffer,
+            )
+        except Exception as exc:
+            # A stub bug must fail the request, not leave it pending until
+            # the app's own timeout.
+            status, headers, body = internal_error(exc)
+        await route.fulfill(status=status, headers=headers, body=body)
+
+    await context.route(f"{supabase_url}/**", handle)
+
+
+def internal_error(exc):
+    """`(status, headers, body)` of the 500 answered when dispatch itself fails."""
+    payload = {"code": "XX000", "message": f"{type(exc).__name__}: {exc}", "details": None, "hint": None}
+    return 500, {**CORS_HEADERS, "Content-Type": "application/json; charset=utf-8"}, json.dumps(payload).encode()
+
+
+def context_hook(seed=None, supabase_url=SUPABASE_URL):
+    """Return a BrowserPool context hook giving every context its own stub.
+
+    Contexts overlap (plan engine forks, the device matrix, watch mode's
+    warm page), so none may reset data another one is still using.
+    """
+    seed = load_seed() if seed is None else seed
+
+    async def hook(context):
+        await install(context, SupabaseStub(seed), supabase_url)
+
+    return hook
+
+
+def serve(stub, host="127.0.0.1", port=54321):
+    """Serve `stub` over HTTP on a background thread and return the server."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Headers and body go out in separate writes; without this, Nagle
+        # plus delayed ACKs add ~40 ms to every keep-alive response.
+        disable_nagle_algorithm = True
+
+        def _handle(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            body = self.rfile.read(length) if length else None
+            parts = urlsplit(self.path)
+            headers = {k.lower(): v for k, v in self.headers.items()}
+            try:
+                status, out_headers, data = stub.dispatch(self.command, parts.path, parts.query, headers, body)
+            except Exception as exc:
+                status, out_headers, data = internal_error(exc)
+            self.send_response(status)
+            for name, value in out_headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        do_GET = do_HEAD = do_POST = do_PATCH = do_PUT = do_DELETE = do_OPTIONS = _handle
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the local Supabase stand-in over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=54321)
+    parser.add_argument("--seed", default=str(SEED_PATH), help="JSON fixture with the table rows")
+    args = parser.parse_args(argv)
+
+    server = serve(SupabaseStub(load_seed(args.seed)), args.host, args.port)
+    print(f"Supabase stand-in on http://{args.host}:{args.port}")
+    print(f"Start the app with: VITE_SUPABASE_URL=http://localhost:{args.port} npm run dev")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
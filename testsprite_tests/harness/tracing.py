@@ -0,0 +1,188 @@
+"""Per-step spans for every harness action, exported as JSONL and Chrome traces.
+
+Each goto, click, fill, expect assertion and screenshot becomes a span with
+its start and end, the selector it acted on, how long the readiness wait
+took, and the fetch/XHR calls that were in flight or started meanwhile.
+Spans are kept per browser context, like the wait ledger.
+
+`write_jsonl` writes one span per line; `write_chrome_trace` writes the
+trace-event format that chrome://tracing and https://ui.perfetto.dev open,
+one track per test case.
+"""
+
+import json
+import os
+import time
+import weakref
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+from playwright.async_api import expect as _expect
+
+# testsprite_tests/tmp/traces; not via suite.TESTS_DIR, which imports waits.
+TRACE_DIR = Path(__file__).resolve().parent.parent / "tmp" / "traces"
+
+_NETWORK_TYPES = {"fetch", "xhr"}
+
+# Request URLs kept per span; the count is always exact.
+MAX_SPAN_REQUESTS = 20
+
+_tracers = weakref.WeakKeyDictionary()
+
+
+class Tracer:
+    """Spans of one browser context, plus the requests currently in flight."""
+
+    def __init__(self, context=None):
+        self.spans = []
+        self._inflight = set()
+        self._open = []
+        if context is not None:
+            context.on("request", self._on_request)
+            context.on("requestfinished", self._on_request_done)
+            context.on("requestfailed", self._on_request_done)
+
+    def _on_request(self, request):
+        if request.resource_type not in _NETWORK_TYPES:
+            return
+        self._inflight.add(request)
+        for span in self._open:
+            span["requests"] += 1
+            if len(span["urls"]) < MAX_SPAN_REQUESTS:
+                span["urls"].append(f"{request.method} {request.url}")
+
+    def _on_request_done(self, request):
+        self._inflight.discard(request)
+
+    @asynccontextmanager
+    async def span(self, name, selector=None, **args):
+        """Time the enclosed block as span `name`.
+
+        Yields the span dict; set `span["waitMs"]` to record how much of it
+        was spent waiting for the page to be ready.
+        """
+        span = {
+            "name": name,
+            "selector": selector,
+            "ts": time.time(),
+            "durMs": None,
+            "waitMs": None,
+            "inflightAtStart": len(self._inflight),
+            "requests": 0,
+            "urls": [],
+            "error": None,
+            **args,
+        }
+        self._open.append(span)
+        started = time.perf_counter()
+        try:
+            yield span
+        except BaseException as exc:
+            first_line = str(exc).strip().split("\n", 1)[0]
+            span["error"] = f"{type(exc).__name__}: {first_line}" if first_line else type(exc).__name__
+            raise
+        finally:
+            span["durMs"] = round((time.perf_counter() - started) * 1000, 1)
+            if span["waitMs"] is not None:
+                span["waitMs"] = round(span["waitMs"], 1)
+            span["inflightAtEnd"] = len(self._inflight)
+            self._open.remove(span)
+            self.spans.append(span)
+
+    def export(self):
+        return sorted(self.spans, key=lambda s: s["ts"])
+
+
+def tracer_for(context):
+    """Return the tracer of a browser context, creating it on first use."""
+    tracer = _tracers.get(context)
+    if tracer is None:
+        tracer = _tracers[context] = Tracer(context)
+    return tracer
+
+
+def _context_of(target):
+    page = getattr(target, "page", target)
+    return page.context
+
+
+class _TracedAssertions:
+    """Playwright assertions whose `to_*` methods are recorded as spans."""
+
+    def __init__(self, actual, assertions, negated=False):
+        self._actual = actual
+        self._assertions = assertions
+        self._negated = negated
+
+    @property
+    def not_(self):
+        return _TracedAssertions(self._actual, self._assertions.not_, not self._negated)
+
+    def __getattr__(self, name):
+        method = getattr(self._assertions, name)
+        if not name.startswith("to_"):
+            return method
+
+        async def traced(*args, **kwargs):
+            tracer = tracer_for(_context_of(self._actual))
+            label = f"expect.{'not_.' if self._negated else ''}{name}"
+            async with tracer.span(label, selector=describe(self._actual)):
+                return await method(*args, **kwargs)
+
+        return traced
+
+
+def describe(target):
+    """Short label for a locator, page or frame."""
+    # Locators render as "<Locator frame=... selector='...'>".
+    text = repr(target)
+    marker = "selector='"
+    if marker in text:
+        return text.split(marker, 1)[1].rsplit("'", 1)[0]
+    return type(target).__name__
+
+
+def expect(actual, message=None):
+    """Drop-in for `playwright.async_api.expect` that traces each assertion."""
+    return _TracedAssertions(actual, _expect(actual, message))
+
+
+def write_jsonl(results, directory=TRACE_DIR):
+    """Write `<id>.jsonl` with the spans of every result; return the paths."""
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for result in results:
+        path = directory / f"{result['id']}.jsonl"
+        with open(path, "w", encoding="utf-8") as f:
+            for span in result.get("spans") or []:
+                f.write(json.dumps({"test": result["id"], **span}, ensure_ascii=False) + "\n")
+        paths.append(path)
+    return paths
+
+
+def chrome_trace(results):
+    """Build a trace-event document with one thread per test case."""
+    events = []
+    for tid, result in enumerate(sorted(results, key=lambda r: r["id"]), start=1):
+        pid = result.get("pid") or os.getpid()
+        events.append({"ph": "M", "name": "thread_name", "pid": pid, "tid": tid,
+                       "args": {"name": f"{result['id']} {result['title']}"}})
+        for span in result.get("spans") or []:
+            events.append({
+                "name": span["name"] + (f" {span['selector']}" if span["selector"] else ""),
+                "cat": span["name"].split(".")[0],
+                "ph": "X",
+                "ts": round(span["ts"] * 1e6),
+                "dur": round(span["durMs"] * 1000),
+                "pid": pid,
+                "tid": tid,
+                "args": {k: v for k, v in span.items() if k not in ("name", "ts", "durMs")},
+            })
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def write_chrome_trace(results, path=TRACE_DIR / "trace.json"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(chrome_trace(results), f)
+    return path
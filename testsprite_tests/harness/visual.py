@@ -0,0 +1,190 @@
+"""Visual regression: diff captures in test_screenshots/ against baselines.
+
+Captures come from `ScreenshotSink` (see `manifest.json`); baselines live in
+`test_screenshots/baselines/<name>.png` and are promoted from captures with
+`visual_diff.py --update`.
+
+The comparison is vectorised with NumPy over the whole frame:
+
+* per pixel, a perceptual colour distance in YIQ space (the metric
+  pixelmatch uses), so anti-aliasing noise weighs less than a real colour
+  change;
+* masks (rectangles per capture name, from `masks.json`) blank out dynamic
+  regions before anything is counted;
+* the frame is cut into square tiles and each tile's changed fraction is
+  reported, so a diff points at *where* the page moved.
+
+Decoded baselines are kept in an LRU cache keyed by path and mtime, so a
+run that compares many captures against the same few baselines decodes
+each one once. NumPy and Pillow are optional; only this stage needs them.
+"""
+
+import functools
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from .screenshots import SCREENSHOT_DIR
+
+BASELINE_DIR = SCREENSHOT_DIR / "baselines"
+MASKS_PATH = SCREENSHOT_DIR / "masks.json"
+DIFF_DIR = SCREENSHOT_DIR / "diffs"
+
+# Per-pixel YIQ distance, as a fraction of the largest possible one, above
+# which a pixel counts as changed (pixelmatch's default threshold).
+PIXEL_THRESHOLD = 0.1
+# Share of unmasked pixels that may change before a capture fails.
+FAIL_RATIO = 0.001
+TILE = 64
+BASELINE_CACHE_SIZE = 64
+
+# Largest possible squared YIQ delta between two colours.
+_MAX_YIQ_DELTA = 35215.0
+
+
+def _modules():
+    try:
+        import numpy
+        from PIL import Image
+    except ImportError:
+        raise RuntimeError("visual diffing needs NumPy and Pillow: pip install numpy pillow") from None
+    return numpy, Image
+
+
+def decode(path):
+    """Decode an image file to an H x W x 3 float32 RGB array."""
+    np, Image = _modules()
+    with Image.open(path) as image:
+        return np.asarray(image.convert("RGB"), dtype=np.float32)
+
+
+@functools.lru_cache(maxsize=BASELINE_CACHE_SIZE)
+def _cached_baseline(path, mtime_ns):
+    array = decode(path)
+    array.setflags(write=False)
+    return array
+
+
+def load_baseline(path):
+    path = Path(path)
+    return _cached_baseline(str(path), path.stat().st_mtime_ns)
+
+
+def load_masks(path=MASKS_PATH):
+    """Return `{capture name: [(x, y, width, height), ...]}`."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return {name: [tuple(rect) for rect in rects] for name, rects in json.load(f).items()}
+    except FileNotFoundError:
+        return {}
+
+
+def yiq_delta(a, b):
+    """Squared perceptual distance between two RGB arrays, per pixel."""
+    np, _ = _modules()
+    d = a - b
+    y = d @ np.array([0.29889531, 0.58662247, 0.11448223], dtype=np.float32)
+    i = d @ np.array([0.59597799, -0.27417610, -0.32180189], dtype=np.float32)
+    q = d @ np.array([0.21147017, -0.52261711, 0.31114694], dtype=np.float32)
+    return 0.5053 * y * y + 0.299 * i * i + 0.1957 * q * q
+
+
+def tile_ratios(changed, tile=TILE):
+    """Changed fraction of every `tile` x `tile` block of a boolean mask."""
+    np, _ = _modules()
+    height, width = changed.shape
+    rows, cols = -(-height // tile), -(-width // tile)
+    padded = np.zeros((rows * tile, cols * tile), dtype=np.float32)
+    padded[:height, :width] = changed
+    sums = padded.reshape(rows, tile, cols, tile).sum(axis=(1, 3))
+    # Edge tiles are smaller; divide by their real area.
+    heights = np.minimum(tile, height - np.arange(rows) * tile)
+    widths = np.minimum(tile, width - np.arange(cols) * tile)
+    return sums / np.outer(heights, widths)
+
+
+def compare(name, capture_path, baseline_path, masks=(), threshold=PIXEL_THRESHOLD,
+            fail_ratio=FAIL_RATIO, tile=TILE, diff_dir=DIFF_DIR):
+    """Diff one capture against its baseline and return a result dict."""
+    np, Image = _modules()
+    result = {"name": name, "capture": str(capture_path), "baseline": str(baseline_path)}
+    if not Path(baseline_path).exists():
+        return {**result, "status": "new"}
+
+    baseline = load_baseline(baseline_path)
+    current = decode(capture_path)
+    if current.shape != baseline.shape:
+        return {**result, "status": "size_mismatch",
+                "captureSize": list(current.shape[1::-1]), "baselineSize": list(baseline.shape[1::-1])}
+
+    delta = yiq_delta(current, baseline)
+    considered = np.ones(delta.shape, dtype=bool)
+    for x, y, w, h in masks:
+        considered[y:y + h, x:x + w] = False
+    changed = (delta > threshold * threshold * _MAX_YIQ_DELTA) & considered
+
+    changed_pixels = int(changed.sum())
+    ratio = changed_pixels / max(1, int(considered.sum()))
+    tiles = tile_ratios(changed, tile)
+    hot = np.argwhere(tiles > 0)
+    result.update({
+        "status": "diff" if ratio > fail_ratio else "match",
+        "changedPixels": changed_pixels,
+        "changedRatio": round(ratio, 6),
+        "maxDelta": round(float(np.sqrt(delta[considered].max() / _MAX_YIQ_DELTA)), 4) if considered.any() else 0.0,
+        "changedTiles": [
+            {"x": int(c) * tile, "y": int(r) * tile, "ratio": round(float(tiles[r, c]), 4)}
+            for r, c in hot[np.argsort(-tiles[tuple(hot.T)])][:20]
+        ],
+    })
+
+    if result["status"] == "diff":
+        # Faded baseline with the changed pixels in red.
+        overlay = (baseline * 0.3 + 178).astype(np.uint8)
+        overlay[changed] = (255, 0, 0)
+        diff_dir = Path(diff_dir)
+        diff_dir.mkdir(parents=True, exist_ok=True)
+        diff_path = diff_dir / f"{name}.png"
+        Image.fromarray(overlay).save(diff_path)
+        result["diffImage"] = str(diff_path)
+    return result
+
+
+def compare_manifest(directory=SCREENSHOT_DIR, names=None, baseline_dir=None, masks=None, workers=4, **options):
+    """Compare every capture in `directory/manifest.json` with its baseline.
+
+    NumPy releases the GIL in the heavy operations, so captures are diffed
+    on a thread pool.
+    """
+    directory = Path(directory)
+    baseline_dir = Path(baseline_dir) if baseline_dir else directory / "baselines"
+    masks = load_masks(directory / "masks.json") if masks is None else masks
+    with open(directory / "manifest.json", encoding="utf-8") as f:
+        manifest = json.load(f)
+    selected = sorted(n for n in manifest if names is None or n in names)
+
+    def one(name):
+        entry = manifest[name]
+        return compare(name, directory / entry["file"], baseline_dir / f"{name}.png",
+                       masks.get(name, ()), diff_dir=directory / "diffs", **options)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(one, selected))
+
+
+def update_baselines(directory=SCREENSHOT_DIR, names=None, baseline_dir=None):
+    """Promote the current captures to baselines, as PNG. Returns the names updated."""
+    _, Image = _modules()
+    directory = Path(directory)
+    baseline_dir = Path(baseline_dir) if baseline_dir else directory / "baselines"
+    baseline_dir.mkdir(parents=True, exist_ok=True)
+    with open(directory / "manifest.json", encoding="utf-8") as f:
+        manifest = json.load(f)
+    updated = []
+    for name in sorted(manifest):
+        if names is not None and name not in names:
+            continue
+        with Image.open(directory / manifest[name]["file"]) as image:
+            image.convert("RGB").save(baseline_dir / f"{name}.png")
+        updated.append(name)
+    return updated
@@ -0,0 +1,212 @@
+"""Core Web Vitals, long tasks and JS heap per portal route.
+
+An init script registers PerformanceObservers before any app code runs
+and buffers what they see: largest-contentful-paint, layout-shift,
+longtask, event timing and paint entries. After a route has settled,
+`measure_route` reduces the entries recorded since the route was entered:
+
+* ``lcpMs``: last LCP candidate (hard navigations only; browsers stop
+  reporting LCP at the first input, so SPA transitions have none);
+* ``cls``: largest session window of unexpected layout shifts;
+* ``inpMs``: the slowest interaction (Event Timing, grouped by
+  interactionId), e.g. the click that opened the route;
+* ``tbtMs``: total blocking time, the sum of each long task's time over
+  50 ms after first contentful paint;
+* ``longTaskCount``, ``longTaskTotalMs``, ``longTaskMaxMs``;
+* ``heapUsedMB`` / ``domNodes``: from CDP `Performance.getMetrics`.
+
+Routes reached through the UI are measured as SPA transitions. Their
+``transitionMs`` runs from the click until the page has settled.
+"""
+
+import statistics
+import time
+from dataclasses import dataclass
+
+from .pool import BASE_URL, open_app
+from .registry import resolve
+from .waits import Steps
+
+LONG_TASK_MS = 50
+
+
+@dataclass(frozen=True)
+class Route:
+    name: str
+    path: str = "/"
+    # Registry entry clicked after loading `path`, for routes without a URL.
+    click: str = None
+    session: str = None
+
+
+ROUTES = (
+    Route("home"),
+    Route("publish", "/#publish"),
+    Route("property_detail", "/", click="listing.second_card_details"),
+    Route("explore", "/#explore"),
+    Route("map_draw", "/", click="home.draw_on_map"),
+    Route("admin_dashboard", "/#adminDashboard", session="admin"),
+    # No URL mounts the publish journey; admins open it from the dashboard.
+    Route("publish_journey", "/#adminDashboard", click="admin.publish_new", session="admin"),
+)
+
+# Lab budgets per route, starting from the "good" Core Web Vitals
+# thresholds. TBT stands in for INP on loads without interaction.
+DEFAULT_BUDGET = {"lcpMs": 2500, "cls": 0.1, "inpMs": 200, "tbtMs": 200, "heapUsedMB": 60}
+BUDGETS = {
+    "home": {},
+    # PublishPropertyPage: a short page that points publishers to the admin panel.
+    "publish": {},
+    "property_detail": {"transitionMs": 1000},
+    "explore": {},
+    # The Google Maps bundle dominates this one.
+    "map_draw": {"tbtMs": 400, "heapUsedMB": 120, "transitionMs": 2000},
+    "admin_dashboard": {"tbtMs": 300},
+    # PublishJourneyAdmin is one 1,000-line form and loads Google Maps for
+    # its address fields; keep it honest, not lax.
+    "publish_journey": {"tbtMs": 300, "heapUsedMB": 120, "transitionMs": 1500},
+}
+
+_OBSERVER_SCRIPT = """
+(() => {
+    const vitals = window.__vitals = { entries: [] };
+    const keep = (type, fields) => new PerformanceObserver((list) => {
+        for (const e of list.getEntries()) vitals.entries.push({ type, ...fields(e) });
+    });
+    const observe = (type, fields, options = {}) => {
+        try {
+            keep(type, fields).observe({ type, buffered: true, ...options });
+        } catch (_) {
+            // Entry type not supported by this browser.
+        }
+    };
+    observe('paint', (e) => ({ name: e.name, startTime: e.startTime }));
+    observe('largest-contentful-paint', (e) => ({ startTime: e.renderTime || e.loadTime || e.startTime }));
+    observe('layout-shift', (e) => ({ startTime: e.startTime, value: e.value, input: e.hadRecentInput }));
+    observe('longtask', (e) => ({ startTime: e.startTime, duration: e.duration }));
+    observe('event', (e) => ({ startTime: e.startTime, duration: e.duration, id: e.interactionId, name: e.name }),
+            { durationThreshold: 16 });
+    observe('first-input', (e) => ({ startTime: e.startTime, duration: e.duration, id: e.interactionId, name: e.name }));
+})();
+"""
+
+_COLLECT_SCRIPT = """
+({ since, longTaskMs }) => {
+    const entries = (window.__vitals ? window.__vitals.entries : []).filter((e) => e.startTime >= since);
+    const of = (type) => entries.filter((e) => e.type === type);
+
+    const lcp = of('largest-contentful-paint');
+    const fcp = of('paint').find((e) => e.name === 'first-contentful-paint');
+
+    // CLS: largest session window (gaps < 1 s, windows <= 5 s).
+    let cls = 0, current = 0, first = null, last = null;
+    for (const shift of of('layout-shift').filter((e) => !e.input)) {
+        if (first !== null && shift.startTime - last < 1000 && shift.startTime - first < 5000) {
+            current += shift.value;
+        } else {
+            current = shift.value;
+            first = shift.startTime;
+        }
+        last = shift.startTime;
+        cls = Math.max(cls, current);
+    }
+
+    const interactions = new Map();
+    for (const e of [...of('event'), ...of('first-input')]) {
+        if (!e.id) continue;
+        interactions.set(e.id, Math.max(interactions.get(e.id) || 0, e.duration));
+    }
+
+    const tasks = of('longtask');
+    const blockingFrom = since > 0 ? since : (fcp ? fcp.startTime : 0);
+    const tbt = tasks.filter((t) => t.startTime >= blockingFrom)
+        .reduce((sum, t) => sum + Math.max(0, t.duration - longTaskMs), 0);
+    return {
+        lcpMs: since === 0 && lcp.length ? lcp[lcp.length - 1].startTime : null,
+        fcpMs: fcp ? fcp.startTime : null,
+        cls: Math.round(cls * 10000) / 10000,
+        inpMs: interactions.size ? Math.max(...interactions.values()) : null,
+        interactions: interactions.size,
+        tbtMs: tbt,
+        longTaskCount: tasks.length,
+        longTaskTotalMs: tasks.reduce((sum, t) => sum + t.duration, 0),
+        longTaskMaxMs: tasks.reduce((max, t) => Math.max(max, t.duration), 0),
+    };
+}
+"""
+
+
+async def install_observers(context):
+    """Buffer performance entries in every page `context` opens from now on."""
+    await context.add_init_script(_OBSERVER_SCRIPT)
+
+
+async def collect_vitals(page, since=0):
+    """Reduce the entries buffered since `since` (performance.now() ms)."""
+    return await page.evaluate(_COLLECT_SCRIPT, {"since": since, "longTaskMs": LONG_TASK_MS})
+
+
+async def heap_metrics(context, page):
+    """JS heap and DOM size of `page`, from CDP Performance.getMetrics."""
+    session = await context.new_cdp_session(page)
+    try:
+        await session.send("Performance.enable")
+        metrics = {m["name"]: m["value"] for m in (await session.send("Performance.getMetrics"))["metrics"]}
+    finally:
+        await session.detach()
+    return {
+        "heapUsedMB": round(metrics.get("JSHeapUsedSize", 0) / 2**20, 2),
+        "heapTotalMB": round(metrics.get("JSHeapTotalSize", 0) / 2**20, 2),
+        "domNodes": int(metrics.get("Nodes", 0)),
+    }
+
+
+async def measure_route(pool, route, base_url=BASE_URL):
+    """Open `route` in a fresh context and return its vitals sample."""
+    async with pool.context(session=route.session) as context:
+        await install_observers(context)
+        page = await open_app(context, base_url + route.path)
+        steps = Steps(page)
+        await steps.settle()
+        since = 0
+        transition = None
+        if route.click:
+            since = await page.evaluate("performance.now()")
+            started = time.perf_counter()
+            await (await resolve(page, route.click)).click()
+            await steps.settle()
+            transition = round((time.perf_counter() - started) * 1000, 1)
+        sample = await collect_vitals(page, since)
+        sample.update(await heap_metrics(context, page))
+        sample["transitionMs"] = transition
+        sample["url"] = page.url
+        return sample
+
+
+METRICS = (
+    "lcpMs", "fcpMs", "cls", "inpMs", "tbtMs", "transitionMs", "longTaskCount", "longTaskTotalMs",
+    "longTaskMaxMs", "heapUsedMB", "domNodes",
+)
+
+
+def summarize_route(samples):
+    """Median of every metric over the samples of one route."""
+    summary = {}
+    for metric in METRICS:
+        values = sorted(s[metric] for s in samples if s.get(metric) is not None)
+        summary[metric] = round(statistics.median(values), 4 if metric == "cls" else 1) if values else None
+    return summary
+
+
+def budget_for(route_name):
+    return {**DEFAULT_BUDGET, **BUDGETS.get(route_name, {})}
+
+
+def check_budget(route_name, summary):
+    """Return `[(metric, value, budget)]` for every metric over budget."""
+    over = []
+    for metric, limit in budget_for(route_name).items():
+        value = summary.get(metric)
+        if value is not None and value > limit:
+            over.append((metric, value, limit))
+    return over
@@ -0,0 +1,182 @@
+"""Event-driven waiting for the generated steps.
+
+The generated scripts slept a fixed 3 s before every action. `Steps` waits
+instead for the signals those sleeps were standing in for: no fetch/XHR in
+flight (the Supabase calls), a DOM that has stopped mutating (React has
+committed its render), and then Playwright's own actionability checks on
+the target element. Every wait is recorded against the sleep it replaced,
+so the runner can report the time saved per test case.
+"""
+
+import asyncio
+import time
+import weakref
+
+from playwright import async_api
+
+from .perftrace import transitions_for
+from .registry import resolve
+from .tracing import describe, tracer_for
+
+# Fixed delays the generated scripts used, in milliseconds.
+LEGACY_STEP_DELAY = 3000
+LEGACY_GOTO_DELAY = 3000
+
+ACTION_TIMEOUT = 5000
+GOTO_TIMEOUT = 10000
+
+# How long the DOM must stay unchanged to count as settled.
+QUIET_MS = 100
+
+_NETWORK_TYPES = {"fetch", "xhr"}
+
+# Resolves once no mutation happened for `quietMs`, or after `maxMs` anyway,
+# then waits two frames so the settled DOM is also painted.
+_SETTLE_SCRIPT = """
+({ quietMs, maxMs }) => new Promise((resolve) => {
+    const finish = () => {
+        observer.disconnect();
+        clearTimeout(quiet);
+        clearTimeout(limit);
+        requestAnimationFrame(() => requestAnimationFrame(() => resolve()));
+    };
+    let quiet = setTimeout(finish, quietMs);
+    const limit = setTimeout(finish, maxMs);
+    const observer = new MutationObserver(() => {
+        clearTimeout(quiet);
+        quiet = setTimeout(finish, quietMs);
+    });
+    observer.observe(document, { subtree: true, childList: true, attributes: true, characterData: true });
+})
+"""
+
+_ledgers = weakref.WeakKeyDictionary()
+
+
+class WaitLedger:
+    """Per-context record of readiness waits versus the sleeps they replaced."""
+
+    def __init__(self):
+        self.entries = []
+
+    def record(self, action, waited_ms, legacy_ms):
+        self.entries.append((action, waited_ms, legacy_ms))
+
+    def summary(self):
+        waited = sum(e[1] for e in self.entries)
+        legacy = sum(e[2] for e in self.entries)
+        return {
+            "steps": len(self.entries),
+            "waitedMs": round(waited),
+            "legacySleepMs": legacy,
+            "savedMs": round(max(legacy - waited, 0)),
+        }
+
+
+def ledger_for(context):
+    """Return the wait ledger of a browser context, creating it on first use."""
+    ledger = _ledgers.get(context)
+    if ledger is None:
+        ledger = _ledgers[context] = WaitLedger()
+    return ledger
+
+
+class _Target:
+    __slots__ = ("name", "scope")
+
+    def __init__(self, name, scope):
+        self.name = name
+        self.scope = scope
+
+
+class Steps:
+    """Run clicks, fills and navigations once the page is actually ready."""
+
+    def __init__(self, page):
+        self.page = page
+        self.ledger = ledger_for(page.context)
+        self.tracer = tracer_for(page.context)
+        self._inflight = set()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        page.on("request", self._on_request)
+        page.on("requestfinished", self._on_request_done)
+        page.on("requestfailed", self._on_request_done)
+
+    def _on_request(self, request):
+        if request.resource_type in _NETWORK_TYPES:
+            self._inflight.add(request)
+            self._idle.clear()
+
+    def _on_request_done(self, request):
+        self._inflight.discard(request)
+        if not self._inflight:
+            self._idle.set()
+
+    async def settle(self, timeout=LEGACY_STEP_DELAY):
+        """Wait for fetch/XHR idle and a quiet DOM, never longer than `timeout` ms."""
+        deadline = time.monotonic() + timeout / 1000
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout / 1000)
+        except asyncio.TimeoutError:
+            return
+        remaining = int((deadline - time.monotonic()) * 1000)
+        if remaining <= 0:
+            return
+        try:
+            await self.page.evaluate(_SETTLE_SCRIPT, {"quietMs": QUIET_MS, "maxMs": remaining})
+        except async_api.Error:
+            # A navigation replaced the document mid-wait; the new one is
+            # checked by the actionability wait of the next action.
+            pass
+
+    async def _ready(self, action, legacy_ms, span):
+        started = time.perf_counter()
+        await self.settle()
+        waited = (time.perf_counter() - started) * 1000
+        self.ledger.record(action, waited, legacy_ms)
+        span["waitMs"] = waited
+
+    def locate(self, name, scope=None):
+        """Refer to registry selector `name` in `scope` (default: this page).
+
+        Resolution is deferred to the action, after the page has settled,
+        so the registry probes the rendered DOM rather than a stale one.
+        """
+        return _Target(name, scope or self.page)
+
+    async def _resolve(self, locator, span):
+        if isinstance(locator, _Target):
+            resolved = await resolve(locator.scope, locator.name)
+            # Record which candidate won, next to the registry name.
+            span["strategy"] = describe(resolved)
+            return resolved
+        return locator
+
+    @staticmethod
+    def _selector(locator):
+        return locator.name if isinstance(locator, _Target) else describe(locator)
+
+    async def click(self, locator, timeout=ACTION_TIMEOUT):
+        async with self.tracer.span("click", self._selector(locator)) as span:
+            await self._ready("click", LEGACY_STEP_DELAY, span)
+            resolved = await self._resolve(locator, span)
+            transitions = transitions_for(self.page.context)
+            label = transitions and await transitions.matches(resolved)
+            if not label:
+                await resolved.click(timeout=timeout)
+                return
+            # A traced transition lasts until the next step has rendered.
+            async with transitions.record(self.page, label):
+                await resolved.click(timeout=timeout)
+                await self.settle()
+
+    async def fill(self, locator, value, timeout=ACTION_TIMEOUT):
+        async with self.tracer.span("fill", self._selector(locator)) as span:
+            await self._ready("fill", LEGACY_STEP_DELAY, span)
+            await (await self._resolve(locator, span)).fill(value, timeout=timeout)
+
+    async def goto(self, url, timeout=GOTO_TIMEOUT):
+        async with self.tracer.span("goto", url=url) as span:
+            await self.page.goto(url, timeout=timeout)
+            await self._ready("goto", LEGACY_GOTO_DELAY, span)
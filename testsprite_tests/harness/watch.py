@@ -0,0 +1,125 @@
+"""Watch mode: re-run the affected test cases on every save, warm.
+
+A cold run pays for starting Playwright and Chromium, the dev server
+transforming the app's modules, and logging in. `watch` pays once: the
+pool's browser stays up, every session a case needs is logged in before
+the first save, and a warm page keeps the app open on the dev server. Its
+HMR connection makes Vite re-transform a changed module as soon as it is
+saved, so the cases that run next get it from the server's cache.
+
+Changes are found by polling modification times, which needs no extra
+dependency and is quick on a tree this size once node_modules is pruned.
+A changed TC script runs itself, and it is loaded afresh for every run;
+app files go through the impact map (see impact.select_cases). Harness
+modules are imported once, so the watcher only reports changes to them.
+"""
+
+import asyncio
+import fnmatch
+import os
+import time
+
+from .impact import APP_DIR, IGNORED, load_map, repo_path, select_cases
+from .pool import BASE_URL, open_app
+from .suite import discover_cases, run_case, sessions
+
+# How often the tree is scanned, and how long it must stay unchanged
+# before a burst of writes (formatters, "save all") counts as one save.
+POLL_MS = 150
+SETTLE_MS = 100
+
+_PRUNED_DIRS = {".git", "node_modules", "dist", "__pycache__", ".vite"}
+_PRUNED_PATHS = {"testsprite_tests/tmp"}
+HARNESS_FILES = "testsprite_tests/harness/*"
+
+
+def snapshot(root=APP_DIR):
+    """Return `{repo-relative path: mtime_ns}` for every watched file."""
+    files = {}
+    for directory, dirs, names in os.walk(root):
+        relative = os.path.relpath(directory, root).replace(os.sep, "/")
+        prefix = "" if relative == "." else relative + "/"
+        dirs[:] = [d for d in dirs if d not in _PRUNED_DIRS and prefix + d not in _PRUNED_PATHS]
+        for name in names:
+            try:
+                files[prefix + name] = os.stat(os.path.join(directory, name)).st_mtime_ns
+            except FileNotFoundError:
+                continue
+    return files
+
+
+def changes(before, after):
+    """Paths added, removed or modified between two snapshots."""
+    return sorted(path for path in before.keys() | after.keys() if before.get(path) != after.get(path))
+
+
+class Watcher:
+    """Polls the tree and yields each settled batch of changed files."""
+
+    def __init__(self, root=APP_DIR, poll_ms=POLL_MS, settle_ms=SETTLE_MS):
+        self.root = root
+        self.poll_ms = poll_ms
+        self.settle_ms = settle_ms
+        self.files = snapshot(root)
+
+    async def next_batch(self):
+        """Wait for the next save; return `(paths, saved_at)` in epoch seconds."""
+        while True:
+            await asyncio.sleep(self.poll_ms / 1000)
+            current = snapshot(self.root)
+            changed = set(changes(self.files, current))
+            if not changed:
+                continue
+            while True:
+                await asyncio.sleep(self.settle_ms / 1000)
+                latest = snapshot(self.root)
+                more = changes(current, latest)
+                current = latest
+                if not more:
+                    break
+                changed.update(more)
+            self.files = current
+            saved_at = max((current[path] for path in changed if path in current), default=time.time_ns()) / 1e9
+            relevant = sorted(p for p in changed if not any(fnmatch.fnmatch(p, pattern) for pattern in IGNORED))
+            if relevant:
+                return relevant, saved_at
+
+
+def affected_cases(changed, cases_dir, ids=None):
+    """Return `(cases, reasons)` to run for `changed`, harness files left out.
+
+    Saving a TC script runs just that script, even when other cases have
+    no coverage recorded yet; only app changes go through the impact map.
+    """
+    cases = discover_cases(cases_dir, ids=ids)
+    by_path = {repo_path(case.path): case.id for case in cases}
+    scripts = [path for path in changed if fnmatch.fnmatch(path, "testsprite_tests/TC*.py")]
+    app_changes = [path for path in changed if path not in scripts and not fnmatch.fnmatch(path, HARNESS_FILES)]
+    reasons = select_cases(cases, app_changes, load_map()) if app_changes else {}
+    for path in scripts:
+        if path in by_path:
+            reasons.setdefault(by_path[path], []).append(path)
+    return [case for case in cases if case.id in reasons], reasons
+
+
+async def watch(pool, cases_dir, ids=None, url=BASE_URL, on_result=None, on_batch=None):
+    """Run the cases affected by each save until cancelled.
+
+    `on_batch(changed, cases, reasons, latency_ms)` is called before a
+    batch runs, `latency_ms` being the time from the save to that call;
+    `on_result(result, case)` after each case.
+    """
+    for session in sessions(discover_cases(cases_dir, ids=ids)):
+        await pool.session_state(session)
+    async with pool.context() as warm:
+        await open_app(warm, url)
+        watcher = Watcher()
+        while True:
+            changed, saved_at = await watcher.next_batch()
+            cases, reasons = affected_cases(changed, cases_dir, ids)
+            if on_batch:
+                on_batch(changed, cases, reasons, round((time.time() - saved_at) * 1000))
+            for case in cases:
+                result = await run_case(pool, case)
+                if on_result:
+                    on_result(result, case)
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""Load-test the get-properties edge function.
+
+    python -m harness.supabase_stub &                      # or: supabase functions serve
+    python testsprite_tests/load_properties.py -c 50 --ramp 10 --duration 60
+    python testsprite_tests/load_properties.py --user-id <uuid> --anon-key "$VITE_SUPABASE_ANON_KEY"
+
+Prints a one-line summary and writes the full JSON report (throughput,
+latency percentiles and histogram, errors by kind, per-second timeline) to
+tmp/load/. Exits non-zero when the error rate exceeds --max-error-rate.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from datetime import datetime, timezone
+
+from harness.loadgen import DEFAULT_URL, LoadProfile, run_load, summarize_load
+from harness.suite import TESTS_DIR
+
+REPORT_DIR = TESTS_DIR / "tmp" / "load"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default=DEFAULT_URL)
+    parser.add_argument("-c", "--concurrency", type=int, default=10, help="virtual users (default: 10)")
+    parser.add_argument("--ramp", type=float, default=0.0, metavar="S", help="seconds to start all users over")
+    parser.add_argument("--duration", type=float, default=30.0, metavar="S", help="steady-state seconds after the ramp")
+    parser.add_argument("--timeout", type=float, default=10.0, metavar="S", help="per-request timeout")
+    parser.add_argument("--user-id", help="send this userId, exercising the `or` filter")
+    parser.add_argument("--anon-key", help="sent as apikey and bearer token (needed by the Deno runtime)")
+    parser.add_argument("--max-error-rate", type=float, default=0.01)
+    parser.add_argument("--out", help="report path (default: tmp/load/get-properties-<timestamp>.json)")
+    args = parser.parse_args(argv)
+
+    headers = {}
+    if args.anon_key:
+        headers = {"apikey": args.anon_key, "Authorization": f"Bearer {args.anon_key}"}
+    profile = LoadProfile(args.concurrency, args.ramp, args.duration, args.timeout)
+    samples, began = asyncio.run(run_load(profile, args.url, args.user_id, headers))
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        **summarize_load(samples, began, profile, args.url),
+    }
+
+    latency = report["steadyLatencyMs"] or report["latencyMs"] or {}
+    print(f"{report['requests']} requests, {report['steadyThroughputRps']} req/s steady,"
+          f" p50={latency.get('p50')} p95={latency.get('p95')} p99={latency.get('p99')} ms,"
+          f" errors {report['errors']} ({report['errorRate']})")
+    for kind, count in report["errorsByKind"].items():
+        print(f"        {kind}: {count}")
+
+    if args.out:
+        path = args.out
+    else:
+        REPORT_DIR.mkdir(parents=True, exist_ok=True)
+        path = REPORT_DIR / f"get-properties-{datetime.now():%Y%m%d-%H%M%S}.json"
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"report: {path}")
+    return 0 if (report["errorRate"] or 0) <= args.max_error_rate else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""Measure homepage load latency (TC001) and check it against the 3 s budget.
+
+    python testsprite_tests/measure_load.py --runs 20
+    python testsprite_tests/measure_load.py --runs 50 --budget 2500 --gate 99
+
+Each run appends one JSON line to tmp/load_latency.jsonl so the numbers can
+be trended across commits. Exits non-zero when a mode misses the budget.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from datetime import datetime, timezone
+
+from harness import BASE_URL, BrowserPool
+from harness.latency import LOAD_BUDGET_MS, measure, summarize
+from harness.suite import TESTS_DIR
+
+HISTORY_PATH = TESTS_DIR / "tmp" / "load_latency.jsonl"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10, help="loads per mode (default: 10)")
+    parser.add_argument("--url", default=BASE_URL)
+    parser.add_argument("--budget", type=float, default=LOAD_BUDGET_MS, help="first-card budget in ms")
+    parser.add_argument("--gate", type=int, default=95, help="percentile checked against the budget")
+    parser.add_argument("--history", default=str(HISTORY_PATH), help="JSONL file the summary is appended to")
+    args = parser.parse_args(argv)
+
+    async def run():
+        async with BrowserPool() as pool:
+            return await measure(pool, args.runs, args.url)
+
+    samples = asyncio.run(run())
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "url": args.url,
+        **{mode: summarize(samples[mode], args.budget, args.gate) for mode in ("cold", "warm")},
+    }
+
+    for mode in ("cold", "warm"):
+        summary = report[mode]
+        card = summary["metrics"]["firstCardMs"]
+        verdict = "ok" if summary["withinBudget"] else "OVER BUDGET"
+        print(f"{mode:<4}  first card p50={card['p50']} p95={card['p95']} p99={card['p99']} ms  [{verdict}]")
+
+    with open(args.history, "a", encoding="utf-8") as f:
+        f.write(json.dumps(report, ensure_ascii=False) + "\n")
+    return 0 if all(report[mode]["withinBudget"] for mode in ("cold", "warm")) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
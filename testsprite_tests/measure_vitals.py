@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Measure Core Web Vitals, long tasks and JS heap per route against budgets.
+
+    python testsprite_tests/measure_vitals.py                      # every route, 3 runs each
+    python testsprite_tests/measure_vitals.py publish_journey map_draw --runs 5
+    python testsprite_tests/measure_vitals.py --supabase stub
+
+Routes: home, publish, property_detail, explore, map_draw, admin_dashboard,
+publish_journey (see harness/vitals.py for how each is entered and its
+budget). Every run appends one JSON line with the samples and medians of
+each route to tmp/vitals/vitals.jsonl. Exits non-zero when a route's
+median is over budget.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from datetime import datetime, timezone
+
+from harness import BASE_URL, build_pool
+from harness.suite import TESTS_DIR
+from harness.vitals import ROUTES, budget_for, check_budget, measure_route, summarize_route
+
+HISTORY_PATH = TESTS_DIR / "tmp" / "vitals" / "vitals.jsonl"
+
+_COLUMNS = (("lcpMs", "LCP"), ("cls", "CLS"), ("inpMs", "INP"), ("tbtMs", "TBT"),
+            ("transitionMs", "nav"), ("longTaskCount", "tasks"), ("heapUsedMB", "heap MB"))
+
+
+def main(argv=None):
+    names = [route.name for route in ROUTES]
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("routes", nargs="*", metavar="ROUTE", help="routes to measure (default: all)")
+    parser.add_argument("--runs", type=int, default=3, help="fresh-context loads per route (default: 3)")
+    parser.add_argument("--url", default=BASE_URL)
+    parser.add_argument("--headed", action="store_true", help="show the browser window")
+    parser.add_argument("--supabase", choices=("hosted", "stub"), default="hosted")
+    parser.add_argument("--history", default=str(HISTORY_PATH), help="JSONL file each run is appended to")
+    args = parser.parse_args(argv)
+    unknown = set(args.routes) - set(names)
+    if unknown:
+        parser.error(f"unknown route(s) {', '.join(sorted(unknown))}; expected {', '.join(names)}")
+    routes = [route for route in ROUTES if not args.routes or route.name in args.routes]
+
+    async def run():
+        samples = {}
+        async with build_pool(headless=not args.headed, supabase=args.supabase) as pool:
+            for route in routes:
+                samples[route.name] = [await measure_route(pool, route, args.url) for _ in range(args.runs)]
+        return samples
+
+    samples = asyncio.run(run())
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "url": args.url,
+        "runs": args.runs,
+        "routes": {},
+    }
+    print(f"{'route':<16}" + "".join(f"{label:>9}" for _, label in _COLUMNS))
+    failed = False
+    for route in routes:
+        summary = summarize_route(samples[route.name])
+        over = check_budget(route.name, summary)
+        failed = failed or bool(over)
+        report["routes"][route.name] = {
+            "median": summary,
+            "budget": budget_for(route.name),
+            "overBudget": [{"metric": m, "value": v, "budget": b} for m, v, b in over],
+            "samples": samples[route.name],
+        }
+        cells = "".join(f"{'-' if summary[key] is None else summary[key]:>9}" for key, _ in _COLUMNS)
+        print(f"{route.name:<16}{cells}")
+        for metric, value, limit in over:
+            print(f"        OVER BUDGET {metric}: {value} > {limit}")
+
+    history = args.history
+    if history == str(HISTORY_PATH):
+        HISTORY_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(history, "a", encoding="utf-8") as f:
+        f.write(json.dumps(report, ensure_ascii=False) + "\n")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
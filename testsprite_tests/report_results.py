@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Summarise the results stream as a Markdown report.
+
+    python testsprite_tests/report_results.py            # tmp/results/report.md
+    python testsprite_tests/report_results.py --rebuild  # re-read the whole stream
+
+Only the lines appended since the last report are read: running totals and
+the read offset are kept in tmp/results/report-state.json.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from harness.resultstore import STATE_PATH, STORE_DIR, STREAM_PATH, ReportState
+
+REPORT_PATH = STORE_DIR / "report.md"
+
+
+def render(state):
+    tests = state.tests
+    failing = {k: v for k, v in tests.items() if v["lastStatus"] != "PASSED"}
+    lines = [
+        "# Test results",
+        "",
+        f"{state.records} results from {len(state.runs)} recent runs;"
+        f" {len(tests) - len(failing)} of {len(tests)} test cases passing on their last run.",
+        "",
+        "## Test cases",
+        "",
+        "| Test | Last status | Pass rate | Flips | Mean duration | Last run |",
+        "|------|-------------|-----------|-------|---------------|----------|",
+    ]
+    for test_id, test in sorted(tests.items()):
+        rate = test["passed"] / test["runs"]
+        lines.append(
+            f"| {test_id} {test['title']} | {test['lastStatus']} | {rate:.0%} ({test['passed']}/{test['runs']})"
+            f" | {test['flips']} | {test['totalDuration'] / test['runs']:.2f}s | {test['lastRun']} |"
+        )
+
+    lines += ["", "## Recent runs", "", "| Run | Started | Passed | Failed | Test time |",
+              "|-----|---------|--------|--------|-----------|"]
+    for run_id, run in sorted(state.runs.items(), key=lambda item: item[1]["started"], reverse=True):
+        lines.append(f"| {run_id} | {run['started']} | {run['passed']} | {run['failed']} | {run['duration']:.1f}s |")
+
+    if failing:
+        lines += ["", "## Failing", ""]
+        for test_id, test in sorted(failing.items()):
+            error = (test["lastError"] or "").strip()
+            lines += [f"### {test_id} {test['title']}", "", "```", error, "```", ""]
+    return "\n".join(lines).rstrip() + "\n"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--stream", default=str(STREAM_PATH))
+    parser.add_argument("--state", default=str(STATE_PATH))
+    parser.add_argument("--out", default=str(REPORT_PATH))
+    parser.add_argument("--rebuild", action="store_true", help="ignore the saved state and read from the start")
+    args = parser.parse_args(argv)
+
+    state = ReportState() if args.rebuild else ReportState.load(args.state)
+    added = state.update(args.stream)
+    state.save(args.state)
+
+    out = Path(args.out)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(render(state), encoding="utf-8")
+    print(f"{added} new results read, {state.records} total -> {out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Replay TC012's responsive checks under each device profile.
+
+    python testsprite_tests/run_device_matrix.py                   # every profile, in parallel
+    python testsprite_tests/run_device_matrix.py mobile-slow3g tablet --runs 3
+    python testsprite_tests/run_device_matrix.py --serial          # one profile at a time
+
+Profiles: desktop, tablet, mobile-cpu4x, mobile-slow3g (see harness/devices.py).
+Each loads the home page in its own context, waits for every text of
+TC012's RESPONSIVE_TEXTS, then switches to English with the control its
+viewport shows (the header dropdown, or the hamburger menu on phones) and
+times the click that picks the language. Parallel contexts share the
+machine's CPU, so use --serial when comparing timings across runs. Every
+run appends one JSON line to tmp/devices/matrix.jsonl. Exits non-zero
+when a profile fails a check.
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+from datetime import datetime, timezone
+
+from harness import BASE_URL, build_pool, discover_cases
+from harness.devices import PROFILES, run_profile
+from harness.suite import TESTS_DIR
+
+HISTORY_PATH = TESTS_DIR / "tmp" / "devices" / "matrix.jsonl"
+
+_COLUMNS = (("ttfbMs", "TTFB"), ("fcpMs", "FCP"), ("lcpMs", "LCP"), ("textsVisibleMs", "texts"),
+            ("tbtMs", "TBT"), ("interactionMs", "click"), ("inpMs", "INP"), ("cls", "CLS"))
+
+
+def median(samples, key):
+    values = [s[key] for s in samples if s.get(key) is not None]
+    return round(statistics.median(values), 4 if key == "cls" else 1) if values else None
+
+
+def main(argv=None):
+    names = [profile.name for profile in PROFILES]
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("profiles", nargs="*", metavar="PROFILE", help="profiles to run (default: all)")
+    parser.add_argument("--runs", type=int, default=1, help="fresh-context loads per profile (default: 1)")
+    parser.add_argument("--serial", action="store_true", help="run one profile at a time")
+    parser.add_argument("--url", default=BASE_URL)
+    parser.add_argument("--headed", action="store_true", help="show the browser window")
+    parser.add_argument("--supabase", choices=("hosted", "stub"), default="hosted")
+    parser.add_argument("--history", default=str(HISTORY_PATH), help="JSONL file each run is appended to")
+    args = parser.parse_args(argv)
+    unknown = set(args.profiles) - set(names)
+    if unknown:
+        parser.error(f"unknown profile(s) {', '.join(sorted(unknown))}; expected {', '.join(names)}")
+    profiles = [profile for profile in PROFILES if not args.profiles or profile.name in args.profiles]
+    texts = discover_cases(ids=["TC012"])[0].load().RESPONSIVE_TEXTS
+
+    async def run():
+        async with build_pool(headless=not args.headed, supabase=args.supabase) as pool:
+            async def runs(profile):
+                return [await run_profile(pool, profile, texts, url=args.url) for _ in range(args.runs)]
+
+            if args.serial:
+                return [await runs(profile) for profile in profiles]
+            return await asyncio.gather(*(runs(profile) for profile in profiles))
+
+    samples = dict(zip((profile.name for profile in profiles), asyncio.run(run())))
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "url": args.url,
+        "runs": args.runs,
+        "parallel": not args.serial,
+        "profiles": {},
+    }
+    print(f"{'profile':<15}" + "".join(f"{label:>8}" for _, label in _COLUMNS))
+    failed = False
+    for profile in profiles:
+        summary = {key: median(samples[profile.name], key) for key, _ in _COLUMNS}
+        failures = [f for s in samples[profile.name] for f in s["failures"]]
+        failed = failed or bool(failures)
+        report["profiles"][profile.name] = {"median": summary, "samples": samples[profile.name]}
+        cells = "".join(f"{'-' if summary[key] is None else summary[key]:>8}" for key, _ in _COLUMNS)
+        print(f"{profile.name:<15}{cells}")
+        for failure in failures:
+            print(f"        FAILED {failure}")
+
+    history = args.history
+    if history == str(HISTORY_PATH):
+        HISTORY_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(history, "a", encoding="utf-8") as f:
+        f.write(json.dumps(report, ensure_ascii=False) + "\n")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
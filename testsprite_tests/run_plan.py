@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Run the test plan as one step graph, sharing common prefixes between cases.
+
+    python testsprite_tests/run_plan.py --graph     # show the graph, run nothing
+    python testsprite_tests/run_plan.py             # every case in testsprite_frontend_test_plan.json
+    python testsprite_tests/run_plan.py TC003 TC005 TC008
+
+Steps that several cases start with run once; the cases then fork from a
+storage-state snapshot (see harness/engine.py). Results go to the same
+stream as run_suite.py.
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+
+from harness import build_pool, discover_cases
+from harness.engine import PlanEngine, build_graph, compile_case, count_steps, describe_graph
+from harness.results import load_plan
+from harness.resultstore import STREAM_PATH, ResultStore
+from run_suite import print_result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("ids", nargs="*", help="test case ids to run (default: every case in the plan)")
+    parser.add_argument("--graph", action="store_true", help="print the step graph and exit")
+    parser.add_argument("--headed", action="store_true", help="show the browser window")
+    parser.add_argument("--supabase", choices=("hosted", "stub"), default="hosted")
+    parser.add_argument("--network-cache", choices=("off", "record", "replay", "auto"), default="off")
+    parser.add_argument("--stream", default=str(STREAM_PATH), help="results stream to append to")
+    args = parser.parse_args(argv)
+
+    plan = load_plan()
+    cases = [case for case in discover_cases(ids=args.ids) if not plan or case.id in plan]
+    if not cases:
+        parser.error("no test cases matched")
+
+    if args.graph:
+        compiled = [compile_case(case, plan) for case in cases]
+        roots = build_graph([c for c in compiled if not c.opaque])
+        print(describe_graph(roots))
+        for case in (c for c in compiled if c.opaque):
+            print(f"[run whole] {case.case.id} {case.title}")
+        executed, scripted = count_steps(roots)
+        print(f"\n{executed} steps executed for {scripted} scripted")
+        return 0
+
+    store = ResultStore(args.stream)
+    by_id = {case.id: case for case in cases}
+
+    def on_result(result):
+        store.append(result, by_id[result["id"]])
+        print_result(result)
+
+    async def run():
+        pool = build_pool(headless=not args.headed, supabase=args.supabase, network_cache=args.network_cache)
+        async with pool:
+            engine = PlanEngine(pool, on_result)
+            return await engine.run(cases), engine
+
+    started = time.perf_counter()
+    results, engine = asyncio.run(run())
+    failed = [r for r in results if r["testStatus"] != "PASSED"]
+    print(f"\n{len(results) - len(failed)} passed, {len(failed)} failed in {time.perf_counter() - started:.2f}s"
+          f" ({engine.forks} forks, {engine.replays} replayed prefixes)")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Soak the SPA in one tab and flag steadily growing memory.
+
+    python testsprite_tests/run_soak.py                        # 200 cycles, sample every 5
+    python testsprite_tests/run_soak.py --cycles 500 --sample-every 10
+    python testsprite_tests/run_soak.py --supabase stub --cycles 50
+
+One cycle is home -> detail -> back -> explore -> back -> map -> home,
+without reloading (see harness/soak.py). Every sample forces a GC and
+records JS heap, DOM nodes, event listeners and documents. Every run
+appends one JSON line with the samples and fitted growth to
+tmp/soak/soak.jsonl. Exits 1 when a metric grows steadily, 2 when a step
+failed before the soak finished.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from datetime import datetime, timezone
+
+from harness import BASE_URL, build_pool
+from harness.soak import find_growth, soak
+from harness.suite import TESTS_DIR
+
+HISTORY_PATH = TESTS_DIR / "tmp" / "soak" / "soak.jsonl"
+
+_COLUMNS = (("heapUsedMB", "heap MB"), ("domNodes", "nodes"), ("listeners", "listeners"),
+            ("documents", "docs"), ("cycleMs", "cycle ms"))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cycles", type=int, default=200, help="page cycles to run (default: 200)")
+    parser.add_argument("--sample-every", type=int, default=5, help="cycles between samples (default: 5)")
+    parser.add_argument("--url", default=BASE_URL)
+    parser.add_argument("--headed", action="store_true", help="show the browser window")
+    parser.add_argument("--supabase", choices=("hosted", "stub"), default="hosted")
+    parser.add_argument("--history", default=str(HISTORY_PATH), help="JSONL file each run is appended to")
+    args = parser.parse_args(argv)
+    if args.cycles < 1 or args.sample_every < 1:
+        parser.error("--cycles and --sample-every must be at least 1")
+
+    print(f"{'cycle':>6}" + "".join(f"{label:>11}" for _, label in _COLUMNS))
+
+    def show(sample):
+        cells = "".join(f"{'-' if sample[key] is None else sample[key]:>11}" for key, _ in _COLUMNS)
+        print(f"{sample['cycle']:>6}{cells}", flush=True)
+
+    async def run():
+        async with build_pool(headless=not args.headed, supabase=args.supabase) as pool:
+            return await soak(pool, args.cycles, args.sample_every, args.url, on_sample=show)
+
+    samples, error = asyncio.run(run())
+    growth = find_growth(samples)
+    leaks = [metric for metric, fit in growth.items() if fit["leak"]]
+    for metric, fit in growth.items():
+        flag = "  LEAK" if fit["leak"] else ""
+        print(f"{metric:<12} {fit['start']} -> {fit['end']}, {fit['perCycle']:+} per cycle, "
+              f"rising in {fit['risingShare']:.0%} of samples{flag}")
+    if error:
+        print(f"stopped early at {error}")
+
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "url": args.url,
+        "cycles": args.cycles,
+        "error": error,
+        "growth": growth,
+        "leaks": leaks,
+        "samples": samples,
+    }
+    history = args.history
+    if history == str(HISTORY_PATH):
+        HISTORY_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(history, "a", encoding="utf-8") as f:
+        f.write(json.dumps(report, ensure_ascii=False) + "\n")
+    return 2 if error else 1 if leaks else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
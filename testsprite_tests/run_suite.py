@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""Run the TC0xx scripts against warm Chromium instances.
+
+    python testsprite_tests/run_suite.py              # every test case, one worker per core
+    python testsprite_tests/run_suite.py TC001 TC012  # selected cases
+    python testsprite_tests/run_suite.py -j 1         # serially, in this process
+    python testsprite_tests/run_suite.py --cases-dir testsprite_tests/tmp/compacted
+    python testsprite_tests/run_suite.py --record-impact   # also map source files to cases
+    python testsprite_tests/run_suite.py --changed origin/main
+
+Each result is appended to tmp/results/results.jsonl as its test case
+finishes; --export-results also rewrites tmp/test_results.json for
+TestSprite. report_results.py turns the stream into a Markdown report.
+
+With several workers, cases are scheduled longest-first onto the least
+loaded worker, using the median of each case's last few durations from
+the stream; the predicted and actual makespan are printed at the end.
+
+--changed runs only the cases whose recorded coverage (tmp/impact/map.json,
+written by --record-impact) includes a file changed since BASE; see
+harness/impact.py for the rules.
+
+Cases whose script sets NETWORK_PROFILE = "functional" skip images,
+media, fonts and map tiles; --network-profile overrides that for the run.
+--network-bytes also measures the bytes each case transferred (and what
+blocking saved), at the cost of a CDP round-trip per request, so leave it
+off when timing the suite.
+
+--perf-trace records a Chrome trace around every step transition a script
+names in PERF_TRACE (the choices of TC010's publish journey) and stores
+the scripting, layout and paint hotspots of each step with its result;
+the raw traces go to tmp/perftrace/<case>/.
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+from harness import build_pool, discover_cases, run_case
+from harness.impact import MAP_PATH, changed_files, load_map, select_cases, update_map
+from harness.netprofile import PROFILES
+from harness.results import RESULTS_PATH, export_stream
+from harness.resultstore import STREAM_PATH, ResultStore, duration_history
+from harness.shard import default_workers, predict_durations, run_sharded, schedule
+from harness.suite import TESTS_DIR, sessions
+from harness.tracing import TRACE_DIR, write_chrome_trace, write_jsonl
+
+
+def print_result(result):
+    saved = (result["waits"] or {}).get("savedMs", 0) / 1000
+    print(f"{result['id']}  {result['testStatus']:<6}  {result['duration']:7.2f}s  (-{saved:.1f}s sleep)  {result['title']}")
+    for miss in result.get("netcache", {}).get("misses", []):
+        print(f"        cache miss: {miss}")
+    for lookup in result["selectors"]:
+        flags = [flag for flag in ("slow", "ambiguous", "fallback") if lookup[flag]]
+        if flags or lookup["unresolved"]:
+            print(f"        selector {lookup['name']}: max {lookup['maxMs']} ms, {lookup['maxMatches']} matches"
+                  f" ({', '.join(flags) or 'unresolved'})")
+    for step in result.get("perftrace", []):
+        costs = ", ".join(f"{category} {ms} ms" for category, ms in step["selfMs"].items())
+        scripting = step["hotspots"].get("scripting")
+        top = f"; top: {scripting[0]['name']}" if scripting else ""
+        print(f"        step {step['step']} '{step['label']}': {step['durationMs']} ms ({costs}){top}")
+
+
+async def login_sessions(names, pool_options):
+    """Log in once for the whole run and return the storage_state files."""
+    async with build_pool(**pool_options) as pool:
+        return {name: str(await pool.session_state(name)) for name in names}
+
+
+async def run_suite(cases, pool_options, store):
+    results = []
+    async with build_pool(**pool_options) as pool:
+        for case in cases:
+            result = await run_case(pool, case)
+            store.append(result, case)
+            print_result(result)
+            results.append(result)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("ids", nargs="*", help="test case ids to run (default: all)")
+    parser.add_argument("-j", "--workers", type=int, default=default_workers(),
+                        help="worker processes, each with its own browser (default: CPU count)")
+    parser.add_argument("--headed", action="store_true", help="show the browser window")
+    parser.add_argument("--supabase", choices=("hosted", "stub"), default="hosted",
+                        help="hosted project, or the seeded local stand-in (default: hosted)")
+    parser.add_argument("--network-cache", choices=("off", "record", "replay", "auto"), default="off",
+                        help="record/replay Supabase, ViaCEP and Nominatim responses (default: off)")
+    parser.add_argument("--cache-latency", type=int, default=0, metavar="MS",
+                        help="artificial latency added to every cache replay")
+    parser.add_argument("--network-profile", choices=("auto", *PROFILES), default="auto",
+                        help="network profile for every case; auto uses each script's NETWORK_PROFILE (default: auto)")
+    parser.add_argument("--network-bytes", action="store_true",
+                        help="measure the bytes each case transferred (slows every request)")
+    parser.add_argument("--perf-trace", action="store_true",
+                        help="trace the step transitions each script names in PERF_TRACE")
+    parser.add_argument("--cases-dir", default=str(TESTS_DIR),
+                        help="directory holding the TC scripts (default: testsprite_tests)")
+    parser.add_argument("--stream", default=str(STREAM_PATH), help="results stream to append to")
+    parser.add_argument("--export-results", nargs="?", const=str(RESULTS_PATH), metavar="PATH",
+                        help="also rewrite test_results.json from the stream")
+    parser.add_argument("--record-impact", action="store_true",
+                        help=f"record JS coverage and update the source-to-case map ({MAP_PATH.name})")
+    parser.add_argument("--changed", nargs="?", const="HEAD", metavar="BASE",
+                        help="run only the cases affected by changes since BASE (default: HEAD)")
+    args = parser.parse_args(argv)
+
+    cases = discover_cases(args.cases_dir, ids=args.ids)
+    if not cases:
+        parser.error("no test cases matched")
+    if args.changed:
+        changed = changed_files(args.changed)
+        selected = select_cases(cases, changed, load_map())
+        print(f"{len(changed)} changed file(s) since {args.changed}: {len(selected)} of {len(cases)} case(s) affected")
+        for case_id, reasons in selected.items():
+            print(f"  {case_id}  {', '.join(reasons[:3])}{' ...' if len(reasons) > 3 else ''}")
+        cases = [case for case in cases if case.id in selected]
+        if not cases:
+            return 0
+
+    pool_options = {
+        "headless": not args.headed,
+        "supabase": args.supabase,
+        "network_cache": args.network_cache,
+        "cache_latency_ms": args.cache_latency,
+        "coverage": args.record_impact,
+        "network_profile": args.network_profile,
+        "network_bytes": args.network_bytes,
+        "perf_trace": args.perf_trace,
+    }
+    store = ResultStore(args.stream)
+    makespan = None
+    started = time.perf_counter()
+    if args.workers > 1 and len(cases) > 1:
+        # Workers would otherwise each log in on first use; do it once here.
+        needed = sessions(cases)
+        if needed:
+            pool_options["storage_states"] = asyncio.run(login_sessions(needed, pool_options))
+        history = duration_history(args.stream, Path(args.stream).parent / "report-state.json")
+        shards, predicted = schedule(cases, args.workers, predict_durations(cases, history))
+        results = run_sharded(cases, args.workers, pool_options, on_result=print_result, store=store, shards=shards)
+        durations = {r["id"]: r["duration"] for r in results}
+        actual = max(sum(durations.get(case.id, 0.0) for case in cases) for cases in shards)
+        makespan = f"makespan over {len(shards)} workers: predicted {predicted:.2f}s, actual {actual:.2f}s"
+    else:
+        results = asyncio.run(run_suite(cases, pool_options, store))
+    if args.export_results:
+        export_stream(args.stream, args.export_results)
+    if args.record_impact:
+        update_map(results, cases)
+    write_jsonl(results, TRACE_DIR)
+    trace = write_chrome_trace(results, TRACE_DIR / "trace.json")
+
+    failed = [r for r in results if r["testStatus"] != "PASSED"]
+    saved = sum((r["waits"] or {}).get("savedMs", 0) for r in results) / 1000
+    print(f"\n{len(results) - len(failed)} passed, {len(failed)} failed in {time.perf_counter() - started:.2f}s"
+          f" ({saved:.1f}s of fixed sleeps avoided)")
+    if makespan:
+        print(makespan)
+    network = [r["network"] for r in results if r.get("network")]
+    if network and args.network_bytes:
+        blocked = sum(n["blocked"] for n in network)
+        unknown = sum(n["blockedUnknownSize"] for n in network)
+        print(f"network: {sum(n['bytes'] for n in network) / 1e6:.1f} MB transferred,"
+              f" ~{sum(n['bytesSaved'] for n in network) / 1e6:.1f} MB saved by blocking {blocked} request(s)"
+              + (f" ({unknown} of unknown size)" if unknown else ""))
+    print(f"step trace: {trace} (open in https://ui.perfetto.dev)")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
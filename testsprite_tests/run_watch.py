@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Keep a warm browser up and re-run the affected test cases on every save.
+
+    python testsprite_tests/run_watch.py                    # watch the whole tree
+    python testsprite_tests/run_watch.py TC010 TC015        # only ever run these
+    python testsprite_tests/run_watch.py --supabase stub --network-cache auto
+
+Saving a TC script re-runs it; saving an app file re-runs the cases that
+exercised it, per tmp/impact/map.json (record it with run_suite.py
+--record-impact, or pass --record-impact here to keep it current as you
+go). The browser, the logged-in sessions and a page on the dev server stay
+warm between saves (see harness/watch.py). Results go to the same stream
+as run_suite.py. Stop with Ctrl-C.
+"""
+
+import argparse
+import asyncio
+import fnmatch
+import sys
+
+from harness import build_pool
+from harness.impact import update_map
+from harness.resultstore import STREAM_PATH, ResultStore
+from harness.suite import TESTS_DIR
+from harness.watch import HARNESS_FILES, watch
+from run_suite import print_result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("ids", nargs="*", help="test case ids that may run (default: all)")
+    parser.add_argument("--headed", action="store_true", help="show the browser window")
+    parser.add_argument("--supabase", choices=("hosted", "stub"), default="hosted")
+    parser.add_argument("--network-cache", choices=("off", "record", "replay", "auto"), default="off")
+    parser.add_argument("--record-impact", action="store_true",
+                        help="record JS coverage and update the source-to-case map after every run")
+    parser.add_argument("--cases-dir", default=str(TESTS_DIR))
+    parser.add_argument("--stream", default=str(STREAM_PATH), help="results stream to append to")
+    args = parser.parse_args(argv)
+
+    store = ResultStore(args.stream)
+
+    def on_batch(changed, cases, reasons, latency_ms):
+        print(f"\n{len(changed)} file(s) saved: {', '.join(changed[:3])}{' ...' if len(changed) > 3 else ''}")
+        if any(fnmatch.fnmatch(path, HARNESS_FILES) for path in changed):
+            print("        harness changed; restart the watcher to load it")
+        if not cases:
+            print("        no test case affected")
+            return
+        print(f"        running {len(cases)} case(s), {latency_ms} ms after the save")
+        for case in cases:
+            print(f"        {case.id}: {', '.join(reasons[case.id][:3])}")
+
+    def on_result(result, case):
+        store.append(result, case)
+        print_result(result)
+        if args.record_impact:
+            update_map([result], [case])
+
+    async def run():
+        pool_options = {
+            "headless": not args.headed,
+            "supabase": args.supabase,
+            "network_cache": args.network_cache,
+            "coverage": args.record_impact,
+        }
+        async with build_pool(**pool_options) as pool:
+            print(f"watching {TESTS_DIR.parent} (Ctrl-C to stop)")
+            await watch(pool, args.cases_dir, ids=args.ids or None, on_result=on_result, on_batch=on_batch)
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
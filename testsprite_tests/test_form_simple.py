@@ -4,9 +4,13 @@ Teste simples do formulário multietapas de publicação
 """
 
 import asyncio
-from playwright.async_api import async_playwright
+import os
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
 import time
 
+from harness.netcache import NetworkCache
+from harness.screenshots import SCREENSHOT_DIR, ScreenshotSink
+
 async def test_form_steps():
     """Testa cada etapa do formulário multietapas"""
     
@@ -14,7 +18,13 @@ async def test_form_steps():
         # Lançar navegador
         browser = await p.chromium.launch(headless=False, slow_mo=1000)
         context = await browser.new_context()
+        # Por padrão fala com os serviços reais; NETWORK_CACHE=record|replay|auto usa o cache local
+        network_cache = os.environ.get("NETWORK_CACHE", "off")
+        if network_cache != "off":
+            await NetworkCache(network_cache)(context)
         page = await context.new_page()
+        # Screenshots são gravadas em segundo plano, uma vez por conteúdo
+        shots = ScreenshotSink(SCREENSHOT_DIR)
         
         try:
             print("🚀 Iniciando teste do formulário multietapas...")
@@ -32,7 +42,7 @@ async def test_form_steps():
             print(f"📄 Título da página: {title}")
             
             # Capturar screenshot inicial
-            await page.screenshot(path="test_screenshots/01_initial_page.png")
+            await shots.capture(page, "01_initial_page")
             print("📸 Screenshot inicial capturada")
             
             # PASSO 1: Informações Básicas
@@ -78,7 +88,7 @@ async def test_form_steps():
                 print("❌ Campo preço não encontrado")
             
             # Capturar screenshot do passo 1
-            await page.screenshot(path="test_screenshots/02_step1_filled.png")
+            await shots.capture(page, "02_step1_filled")
             print("📸 Screenshot do Passo 1 preenchido")
             
             # Clicar no botão "Próximo"
@@ -103,14 +113,18 @@ async def test_form_steps():
             # Preencher CEP
             cep_input = page.locator('input[placeholder*="CEP"]')
             if await cep_input.is_visible():
-                await cep_input.fill("88010-000")
+                # Aguardar a resposta da busca do endereço em vez de um tempo fixo
+                try:
+                    async with page.expect_response(lambda r: "viacep.com.br" in r.url, timeout=5000):
+                        await cep_input.fill("88010-000")
+                except PlaywrightTimeoutError:
+                    print("⚠️ Busca do CEP não respondeu em 5s")
                 print("✅ CEP preenchido")
-                await asyncio.sleep(3)  # Aguardar busca do endereço
             else:
                 print("❌ Campo CEP não encontrado")
             
             # Capturar screenshot do passo 2
-            await page.screenshot(path="test_screenshots/03_step2_filled.png")
+            await shots.capture(page, "03_step2_filled")
             print("📸 Screenshot do Passo 2 preenchido")
             
             # Clicar no botão "Próximo" novamente
@@ -160,7 +174,7 @@ async def test_form_steps():
                 print("❌ Checkboxes de características não encontrados")
             
             # Capturar screenshot do passo 3
-            await page.screenshot(path="test_screenshots/04_step3_filled.png")
+            await shots.capture(page, "04_step3_filled")
             print("📸 Screenshot do Passo 3 preenchido")
             
             # Clicar no botão "Próximo" para o passo 4
@@ -190,7 +204,7 @@ async def test_form_steps():
                 print("❌ Botão de upload de imagens não encontrado")
             
             # Capturar screenshot final
-            await page.screenshot(path="test_screenshots/05_step4_final.png")
+            await shots.capture(page, "05_step4_final")
             print("📸 Screenshot final capturada")
             
             print("\n🎯 Teste concluído!")
@@ -198,15 +212,17 @@ async def test_form_steps():
             
         except Exception as e:
             print(f"❌ Erro durante o teste: {str(e)}")
-            await page.screenshot(path="test_screenshots/error.png")
+            await shots.capture(page, "error")
             
         finally:
+            await shots.close()
+            print(f"📸 Screenshots: {shots.report()}")
             await browser.close()
 
 if __name__ == "__main__":
     # Criar pasta para screenshots
     import os
-    os.makedirs("test_screenshots", exist_ok=True)
+    os.makedirs(SCREENSHOT_DIR, exist_ok=True)
     
     # Executar teste
     asyncio.run(test_form_steps())
\ No newline at end of file
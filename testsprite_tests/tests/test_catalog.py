@@ -0,0 +1,45 @@
+import io
+import json
+
+from harness.catalog import (
+    FIRST_ID, imovel, iter_imoveis, iter_midias, midias, profile_count, write_copy, write_json,
+)
+
+
+def copy_script(seed, listings=60):
+    out = io.StringIO()
+    counts = write_copy(out, seed, listings)
+    return out.getvalue(), counts
+
+
+def test_same_seed_gives_the_same_catalog():
+    assert copy_script(7) == copy_script(7)
+    first, second = io.StringIO(), io.StringIO()
+    write_json(first, 7, 60, {})
+    write_json(second, 7, 60, {})
+    assert first.getvalue() == second.getvalue()
+
+
+def test_different_seeds_give_different_catalogs():
+    assert copy_script(7)[0] != copy_script(8)[0]
+
+
+def test_rows_do_not_depend_on_the_rows_before_them():
+    assert list(iter_imoveis(7, 60))[41] == imovel(7, 41, profile_count(60))
+    media = [row for row in iter_midias(7, 60) if row["imovel_id"] == FIRST_ID + 41]
+    assert [{k: v for k, v in row.items() if k != "id"} for row in media] == midias(7, 41)
+
+
+def test_counts_and_json_fixture_shape():
+    script, counts = copy_script(7)
+    assert counts["imoveis"] == 60 and counts["perfis"] == profile_count(60)
+    assert script.count("COPY public.") == 3
+    out = io.StringIO()
+    base = {"imoveis": [{"id": 1, "titulo": "Seeded"}], "admins": [{"id": 1}]}
+    json_counts = write_json(out, 7, 60, base)
+    fixture = json.loads(out.getvalue())
+    assert json_counts == {table: len(rows) for table, rows in fixture.items()}
+    assert fixture["imoveis"][0] == base["imoveis"][0]
+    assert fixture["imoveis"][1]["id"] == FIRST_ID
+    assert fixture["admins"] == base["admins"]
+    assert len(fixture["midias_imovel"]) == counts["midias_imovel"]
@@ -0,0 +1,92 @@
+import asyncio
+
+import pytest
+from playwright import async_api
+
+from harness.devices import PROFILES, SWITCHED_TEXT
+from harness.registry import SELECTORS, resolve
+
+# Header.tsx's markup and the Tailwind rules its visibility depends on:
+# the dropdown is `hidden md:block`, the hamburger and its menu `lg:hidden`.
+_HEADER = """
+<style>
+  .hidden { display: none; }
+  @media (min-width: 768px) { .md\\:block { display: block; } }
+  @media (min-width: 1024px) { .lg\\:hidden { display: none; } .lg\\:flex { display: flex; } }
+  .max-h-0 { max-height: 0; } .overflow-hidden { overflow: hidden; } .opacity-0 { opacity: 0; }
+  .pointer-events-none { pointer-events: none; } .relative { position: relative; } .absolute { position: absolute; }
+</style>
+<div id="root"><div>
+  <header>
+    <nav>
+      <div><a href="#">Quallity Home</a></div>
+      <div class="hidden lg:flex"><a href="#">Comprar</a></div>
+      <div>
+        <div class="relative hidden md:block">
+          <button data-testid="language-switcher" onclick="toggle(this.nextElementSibling)">PT</button>
+          <div class="absolute opacity-0 pointer-events-none">
+            <button onclick="choose('pt')"><span>Português</span></button>
+            <button onclick="choose('en')"><span>English</span></button>
+            <button onclick="choose('es')"><span>Español</span></button>
+          </div>
+        </div>
+        <button class="lg:hidden" onclick="toggle(document.getElementById('menu'))">&#9776;</button>
+      </div>
+    </nav>
+    <div id="menu" class="lg:hidden max-h-0 opacity-0 overflow-hidden"><div><div>
+      <div><a href="#">Comprar</a></div>
+      <div>
+        <button onclick="openLanguages(this.parentElement)"><div><span>Idioma</span></div></button>
+      </div>
+    </div></div></div>
+  </header>
+  <section><h1>Lar dos sonhos? Encontre aqui.</h1></section>
+</div></div>
+<script>
+  function toggle(el) {
+    for (const c of ["opacity-0", "pointer-events-none", "max-h-0", "overflow-hidden"]) el.classList.toggle(c);
+  }
+  function openLanguages(parent) {
+    parent.insertAdjacentHTML("beforeend", '<div><button onclick="choose(\\'pt\\')"><span>Português</span></button>'
+      + '<button onclick="choose(\\'en\\')"><span>English</span></button></div>');
+  }
+  function choose(lang) {
+    if (lang === "en") document.querySelector("h1").textContent = "Dream home? Find it here.";
+  }
+</script>
+"""
+
+
+def test_every_language_switch_step_is_registered():
+    for profile in PROFILES:
+        assert profile.language_switch[-1].endswith("_en"), profile.name
+        assert all(name in SELECTORS for name in profile.language_switch), profile.name
+
+
+async def _switch_language(profile):
+    """Click through `profile`'s language switch; return each step's visibility and the heading."""
+    async with async_api.async_playwright() as playwright:
+        try:
+            browser = await playwright.chromium.launch()
+        except async_api.Error as exc:
+            pytest.skip(f"chromium unavailable: {str(exc).splitlines()[0]}")
+        context = await browser.new_context(**profile.new_context_options())
+        page = await context.new_page()
+        await page.set_content(_HEADER)
+        visible = {}
+        for name in profile.language_switch:
+            locator = await resolve(page, name)
+            visible[name] = await locator.is_visible()
+            if not visible[name]:
+                break
+            await locator.click(timeout=5000)
+        heading = await page.locator("h1").text_content()
+        await browser.close()
+        return visible, heading
+
+
+@pytest.mark.parametrize("profile", PROFILES, ids=lambda profile: profile.name)
+def test_language_switch_is_visible_at_the_profile_viewport(profile):
+    visible, heading = asyncio.run(_switch_language(profile))
+    assert visible == dict.fromkeys(profile.language_switch, True)
+    assert heading == SWITCHED_TEXT
@@ -0,0 +1,100 @@
+import asyncio
+
+from harness.engine import build_graph, compile_case, count_steps, describe_graph, step_label
+from harness.suite import discover_cases
+
+HEAD = '''from harness import Steps, open_app
+{session}
+async def run_test(context):
+    page = await open_app(context)
+    steps = Steps(page)
+
+    # Interact with the page elements to simulate user flow
+'''
+
+TAIL = '''
+    # --> Assertions to verify final state
+    steps.log.append("assert {case}")
+'''
+
+
+def write(directory, name, targets, session=None):
+    body = "".join(
+        f"    frame = context.pages[-1]\n    elem = steps.locate({target!r}, frame)\n    await steps.click(elem)\n\n"
+        for target in targets
+    )
+    source = HEAD.format(session=f'SESSION = "{session}"\n' if session else "") + body
+    (directory / name).write_text(source + TAIL.format(case=name[:5]), encoding="utf-8")
+
+
+class _Steps:
+    """Records what the compiled steps do, in order."""
+
+    def __init__(self):
+        self.log = []
+
+    def locate(self, name, scope=None):
+        return name
+
+    async def click(self, target):
+        self.log.append(f"click {target}")
+
+
+class _Context:
+    pages = [None]
+
+
+def compiled_cases(directory):
+    return [compile_case(case) for case in discover_cases(directory)]
+
+
+def test_compiled_steps_run_in_script_order_then_the_tail(tmp_path):
+    write(tmp_path, "TC001_A.py", ["nav.publish", "publish.admin_access", "admin.logout"])
+    [case] = compiled_cases(tmp_path)
+    assert not case.opaque
+    assert [step_label(signature) for signature, _ in case.steps] == [
+        "click nav.publish", "click publish.admin_access", "click admin.logout",
+    ]
+    steps = _Steps()
+
+    async def run():
+        for _, step in case.steps:
+            await step(_Context(), None, steps)
+        await case.tail(_Context(), None, steps)
+
+    asyncio.run(run())
+    assert steps.log == ["click nav.publish", "click publish.admin_access", "click admin.logout", "assert TC001"]
+
+
+def test_scripts_without_the_standard_head_run_whole(tmp_path):
+    (tmp_path / "TC001_Own_load.py").write_text(
+        "async def run_test(context):\n    page = await context.new_page()\n    await page.goto('/')\n",
+        encoding="utf-8",
+    )
+    [case] = compiled_cases(tmp_path)
+    assert case.opaque and case.steps == []
+
+
+def test_shared_prefixes_become_one_path_per_session(tmp_path):
+    write(tmp_path, "TC001_A.py", ["nav.publish", "publish.admin_access", "admin.logout"])
+    write(tmp_path, "TC002_B.py", ["nav.publish", "publish.admin_access"])
+    write(tmp_path, "TC003_C.py", ["nav.publish", "header.logo"])
+    write(tmp_path, "TC004_D.py", ["nav.publish"], session="admin")
+    roots = build_graph(compiled_cases(tmp_path))
+    assert set(roots) == {None, "admin"}
+
+    [publish] = roots[None].children.values()
+    assert [step_label(s) for s in publish.children] == ["click publish.admin_access", "click header.logo"]
+    admin_access, logo = publish.children.values()
+    assert [c.case.id for c in admin_access.cases] == ["TC002"]
+    assert [c.case.id for c in admin_access.leaves()] == ["TC002", "TC001"]
+    assert [c.case.id for c in logo.cases] == ["TC003"]
+    assert [n.signature for n in next(iter(admin_access.children.values())).path()] == [
+        publish.signature, admin_access.signature, next(iter(admin_access.children)),
+    ]
+    # 1 + 2 + 1 shared-tree steps in the logged-out root, 1 for admin,
+    # against the 3 + 2 + 2 + 1 the scripts contain.
+    assert count_steps(roots) == (5, 8)
+    assert describe_graph(roots).splitlines()[:3] == [
+        "[logged out]", "  - click nav.publish  x3", "    - click publish.admin_access  x2",
+    ]
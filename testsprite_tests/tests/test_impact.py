@@ -0,0 +1,54 @@
+from types import SimpleNamespace
+
+from harness.impact import APP_DIR, _exercised, repo_path, select_cases
+
+CASES = [SimpleNamespace(id=f"TC00{i}", path=APP_DIR / "testsprite_tests" / f"TC00{i}_case.py") for i in (1, 2, 3)]
+CEP = "components/AddressSearchByCEP.tsx"
+# Every case loads every component through App.tsx; only TC001 runs CEP's code.
+MAPPING = {
+    "TC001": {"files": ["pages/Home.tsx", CEP, "config.ts"], "loaded": ["App.tsx", "pages/Home.tsx", CEP, "config.ts"]},
+    "TC002": {"files": ["pages/Publish.tsx", "config.ts"], "loaded": ["App.tsx", "pages/Publish.tsx", CEP, "config.ts"]},
+}
+
+
+def script_coverage(*functions):
+    """A ScriptCoverage entry: the module body, then `(name, call count)` per function."""
+    body = {"functionName": "", "ranges": [{"startOffset": 0, "count": 1}]}
+    return {"functions": [body] + [{"functionName": name, "ranges": [{"startOffset": 10, "count": count}]}
+                                   for name, count in functions]}
+
+
+def test_a_file_is_exercised_when_its_functions_run_or_it_has_none():
+    assert _exercised(script_coverage(("AddressSearchByCEP", 2)))
+    assert not _exercised(script_coverage(("AddressSearchByCEP", 0)))
+    assert _exercised(script_coverage())
+
+
+def test_a_component_every_case_loads_selects_only_the_case_that_ran_it():
+    assert select_cases(CASES[:2], [CEP], MAPPING) == {"TC001": [CEP]}
+
+
+def test_side_effect_modules_select_every_case_that_loaded_them():
+    assert list(select_cases(CASES[:2], ["config.ts"], MAPPING)) == ["TC001", "TC002"]
+
+
+def test_loaded_but_never_run_selects_nothing():
+    assert select_cases(CASES[:2], ["App.tsx"], MAPPING) == {}
+
+
+def test_unmapped_files_and_cases_select_everything_they_can():
+    selected = select_cases(CASES, ["vite.config.ts"], MAPPING)
+    assert list(selected) == ["TC001", "TC002", "TC003"]
+    assert selected["TC003"] == ["no coverage recorded", "vite.config.ts (unmapped)"]
+
+
+def test_scripts_select_themselves_and_ignored_files_nothing():
+    changed = ["testsprite_tests/TC002_case.py", "README.md", "testsprite_tests/tmp/x.json"]
+    assert select_cases(CASES[:2], changed, MAPPING) == {"TC002": ["testsprite_tests/TC002_case.py"]}
+
+
+def test_cases_outside_the_repository_keep_absolute_paths(tmp_path):
+    outside = SimpleNamespace(id="TC009", path=tmp_path / "TC009_case.py")
+    assert repo_path(outside.path) == (tmp_path / "TC009_case.py").resolve().as_posix()
+    assert repo_path(CASES[0].path) == "testsprite_tests/TC001_case.py"
+    assert select_cases([outside], [CEP], {"TC009": MAPPING["TC001"]}) == {"TC009": [CEP]}
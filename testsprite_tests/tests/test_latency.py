@@ -0,0 +1,41 @@
+import pytest
+
+from harness.latency import percentile, summarize
+
+
+def sample(first_card, ttfb=50.0):
+    return {"ttfbMs": ttfb, "domContentLoadedMs": 400.0, "loadMs": 900.0, "firstCardMs": first_card}
+
+
+def test_percentile_of_one_sample_is_that_sample():
+    assert [percentile([120.0], p) for p in (0, 50, 95, 100)] == [120.0] * 4
+
+
+@pytest.mark.parametrize("pct, expected", [(0, 1), (10, 1), (11, 2), (50, 5), (95, 10), (100, 10)])
+def test_percentile_uses_the_nearest_rank(pct, expected):
+    assert percentile(list(range(10, 0, -1)), pct) == expected
+
+
+def test_percentile_of_no_samples_is_none():
+    assert percentile([], 50) is None
+
+
+def test_missing_samples_rank_as_slowest():
+    assert percentile([100.0, None], 50) == 100.0
+    assert percentile([100.0, None], 100) == float("inf")
+
+
+def test_summarize_checks_the_gated_percentile_against_the_budget():
+    samples = [sample(1000.0 + i) for i in range(19)] + [sample(5000.0)]
+    summary = summarize(samples, budget_ms=3000)
+    assert summary["runs"] == 20 and summary["gate"] == "p95"
+    assert summary["metrics"]["firstCardMs"] == {"p50": 1009.0, "p95": 1018.0, "p99": 5000.0}
+    assert summary["withinBudget"]
+    assert not summarize(samples, budget_ms=3000, gate=99)["withinBudget"]
+
+
+def test_summarize_without_samples_or_cards_is_over_budget():
+    assert not summarize([])["withinBudget"]
+    empty = summarize([sample(None)])
+    assert empty["metrics"]["firstCardMs"] == {"p50": None, "p95": None, "p99": None}
+    assert not empty["withinBudget"]
@@ -0,0 +1,51 @@
+from harness.loadgen import LoadProfile, summarize_load
+
+URL = "http://localhost:54321/functions/v1/get-properties"
+
+
+def sample(t, ms, error=None, size=1000):
+    return {"t": t, "ms": ms, "error": error, "bytes": size}
+
+
+def test_summary_splits_ramp_from_steady_state():
+    profile = LoadProfile(concurrency=2, ramp_s=1.0, duration_s=2.0)
+    samples = [
+        sample(100.2, 300),                      # during the ramp
+        sample(101.1, 10), sample(101.5, 20),
+        sample(102.3, 30), sample(102.8, 40, error="timeout"),
+    ]
+    report = summarize_load(samples, 100.0, profile, URL)
+
+    assert report["requests"] == 5
+    assert report["errors"] == 1 and report["errorsByKind"] == {"timeout": 1}
+    assert report["errorRate"] == 0.2
+    assert report["throughputRps"] == round(4 / 3, 1)
+    assert report["steadyThroughputRps"] == 1.5
+    assert report["latencyMs"]["max"] == 300
+    assert report["steadyLatencyMs"]["max"] == 30
+    assert report["steadyLatencyMs"]["p50"] == 20
+    assert report["bytesPerResponse"] == 1000
+
+
+def test_histogram_counts_successes_by_upper_bound():
+    profile = LoadProfile(duration_s=1.0)
+    samples = [sample(0.1, 4), sample(0.2, 5), sample(0.3, 99), sample(0.4, 20000), sample(0.5, 1, error="reset")]
+    histogram = {b["leMs"]: b["count"] for b in summarize_load(samples, 0.0, profile, URL)["histogram"]}
+    assert histogram[5] == 1 and histogram[10] == 1 and histogram[100] == 1 and histogram[None] == 1
+    assert sum(histogram.values()) == 4
+
+
+def test_timeline_is_per_second_with_errors_and_p95():
+    profile = LoadProfile(duration_s=2.0)
+    samples = [sample(0.1, 10), sample(0.9, 50), sample(1.2, 5, error="HTTP 500")]
+    timeline = summarize_load(samples, 0.0, profile, URL)["timeline"]
+    assert timeline == [
+        {"second": 0, "requests": 2, "errors": 0, "p95Ms": 50},
+        {"second": 1, "requests": 1, "errors": 1, "p95Ms": None},
+    ]
+
+
+def test_empty_run():
+    report = summarize_load([], 0.0, LoadProfile(duration_s=1.0), URL)
+    assert report["requests"] == 0 and report["errorRate"] is None
+    assert report["latencyMs"] is None and report["bytesPerResponse"] is None
@@ -0,0 +1,79 @@
+import pytest
+
+from harness.loops import compact_source, compact_steps, split_steps
+
+HEAD = '''import asyncio
+
+from harness import Steps, open_app
+
+async def run_test(context):
+    page = await open_app(context)
+    steps = Steps(page)
+
+    # Interact with the page elements to simulate user flow
+'''
+
+
+def script(*steps):
+    body = []
+    for action, arg in steps:
+        if action == "goto":
+            body.append(f"    await steps.goto({arg!r})\n")
+        elif action == "wheel":
+            body.append("    await page.mouse.wheel(0, 300)\n")
+        else:
+            body.append(f"    frame = context.pages[-1]\n    elem = steps.locate({arg!r}, frame)\n")
+            body.append(f"    await steps.{action}(elem)\n" if action == "click" else "    await steps.fill(elem, 'x')\n")
+        body.append("\n")
+    return HEAD + "".join(body)
+
+
+def kept_targets(source):
+    steps = split_steps(source)
+    return [steps[i].target or steps[i].action for i in compact_steps(steps).kept]
+
+
+def test_repeated_wizard_clicks_are_preserved():
+    source = script(("click", "publish.next"), ("click", "publish.next"), ("click", "publish.next"))
+    assert kept_targets(source) == ["publish.next"] * 3
+    assert compact_source(source)[0] == source
+
+
+def test_repeated_click_and_fill_pairs_are_preserved():
+    source = script(("click", "admin.add_photo"), ("fill", "admin.caption"),
+                    ("click", "admin.add_photo"), ("fill", "admin.caption"))
+    assert len(kept_targets(source)) == 4
+
+
+def test_navigation_link_cycle_is_collapsed():
+    pair = (("click", "nav.publish"), ("click", "publish.admin_access"))
+    source = script(*pair * 6)
+    assert kept_targets(source) == ["nav.publish", "publish.admin_access"]
+    compacted, compaction = compact_source(source)
+    assert compaction.cycles == [(0, 2, 6)]
+    assert "(compacted: 10 repeated step(s) removed)" in compacted
+
+
+def test_cycles_with_a_reset_are_collapsed_even_with_scrolls():
+    source = script(("goto", "http://localhost:3000"), ("wheel", None), ("goto", "http://localhost:3000"), ("wheel", None))
+    assert kept_targets(source) == ["goto", "wheel"]
+
+
+@pytest.mark.parametrize("action, target", [("click", "admin_login.submit"), ("click", "admin.logout"),
+                                            ("fill", "admin_login.email")])
+def test_a_reset_does_not_make_state_changing_steps_collapsible(action, target):
+    source = script(*(("goto", "http://localhost:3000"), (action, target)) * 3)
+    assert kept_targets(source) == ["goto", target] * 3
+    assert compact_source(source)[0] == source
+
+
+def test_repeated_scrolls_without_a_reset_are_preserved():
+    source = script(("wheel", None), ("wheel", None), ("wheel", None))
+    assert kept_targets(source) == ["wheel"] * 3
+
+
+def test_compacted_source_still_parses_and_keeps_the_head():
+    compacted, _ = compact_source(script(("goto", "http://localhost:3000"), ("goto", "http://localhost:3000")))
+    compile(compacted, "compacted", "exec")
+    assert compacted.startswith(HEAD)
+    assert compacted.count("await steps.goto(") == 1
@@ -0,0 +1,49 @@
+import asyncio
+
+from harness.netprofile import apply_profile, profile_report
+
+
+class _Context:
+    def __init__(self):
+        self.listeners = {}
+
+    def on(self, event, listener):
+        self.listeners[event] = listener
+
+    async def route(self, pattern, handler):
+        pass
+
+
+class _Request:
+    url = "https://example.com/app.js"
+    resource_type = "script"
+
+    def __init__(self):
+        self.size_reads = 0
+
+    async def sizes(self):
+        self.size_reads += 1
+        return {"responseHeadersSize": 100, "responseBodySize": 900}
+
+
+def run(measure_bytes):
+    async def scenario():
+        context, request = _Context(), _Request()
+        await apply_profile(context, "full", measure_bytes=measure_bytes)
+        context.listeners["requestfinished"](request)
+        context.listeners["requestfinished"](request)
+        return await profile_report(context), request.size_reads
+
+    return asyncio.run(scenario())
+
+
+def test_sizes_are_not_read_unless_bytes_are_measured():
+    report, reads = run(measure_bytes=False)
+    assert reads == 0
+    assert report["requests"] == 2 and report["bytes"] is None
+
+
+def test_measured_bytes_add_up():
+    report, reads = run(measure_bytes=True)
+    assert reads == 2
+    assert report["requests"] == 2 and report["bytes"] == 2000
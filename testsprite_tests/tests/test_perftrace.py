@@ -0,0 +1,127 @@
+import asyncio
+import json
+
+from harness.perftrace import PerfTrace, summarize, trace_transitions, transitions_for
+
+MAIN, WORKER = (1, 10), (1, 20)
+
+
+def meta(thread, name):
+    return {"ph": "M", "name": "thread_name", "pid": thread[0], "tid": thread[1], "args": {"name": name}}
+
+
+def slice_(thread, name, ts, dur, **data):
+    return {"ph": "X", "name": name, "pid": thread[0], "tid": thread[1], "ts": ts, "dur": dur, "args": {"data": data}}
+
+
+def begin_end(thread, name, ts, end):
+    pid, tid = thread
+    return [{"ph": "B", "name": name, "pid": pid, "tid": tid, "ts": ts, "args": {}},
+            {"ph": "E", "name": name, "pid": pid, "tid": tid, "ts": end}]
+
+
+HANDLER = {"functionName": "onClick", "url": "http://localhost:5173/components/Form.tsx?t=1", "lineNumber": 42}
+
+EVENTS = [
+    meta(MAIN, "CrRendererMain"),
+    meta(WORKER, "DedicatedWorker thread"),
+    slice_(MAIN, "RunTask", 0, 10_000),
+    slice_(MAIN, "FunctionCall", 1_000, 6_000, **HANDLER),
+    slice_(MAIN, "Layout", 2_000, 2_000, stackTrace=[HANDLER]),
+    *begin_end(MAIN, "Paint", 8_000, 9_000),
+    slice_(MAIN, "RunTask", 12_000, 3_000),
+    slice_(MAIN, "EventDispatch", 12_500, 500, type="click"),
+    # Off the main thread: not what blocks the user.
+    slice_(WORKER, "RunTask", 0, 50_000),
+    slice_(WORKER, "FunctionCall", 0, 50_000, **HANDLER),
+]
+
+
+def test_summarize_splits_self_time_by_category():
+    summary = summarize(EVENTS)
+    assert summary["selfMs"] == {"scripting": 4.5, "layout": 2.0, "paint": 1.0}
+    assert summary["longestTaskMs"] == 10.0
+    assert summary["hotspots"]["scripting"] == [
+        {"name": "onClick Form.tsx:42", "selfMs": 4.0, "count": 1},
+        {"name": "click handler", "selfMs": 0.5, "count": 1},
+    ]
+    assert summary["hotspots"]["layout"] == [{"name": "Layout forced by onClick Form.tsx:42", "selfMs": 2.0, "count": 1}]
+
+
+def test_summarize_keeps_the_top_hotspots():
+    assert len(summarize(EVENTS, top=1)["hotspots"]["scripting"]) == 1
+    assert summarize([]) == {"selfMs": {"scripting": 0.0, "layout": 0.0, "paint": 0.0}, "longestTaskMs": 0.0,
+                             "hotspots": {}}
+
+
+class _Session:
+    """Replays EVENTS the way Chrome delivers a trace: in chunks, then complete."""
+
+    def __init__(self):
+        self.handlers = {}
+        self.sent = []
+        self.detached = False
+
+    def on(self, event, handler):
+        self.handlers[event] = handler
+
+    async def send(self, method, params=None):
+        self.sent.append(method)
+        if method == "Tracing.end":
+            self.handlers["Tracing.dataCollected"]({"value": EVENTS[:4]})
+            self.handlers["Tracing.dataCollected"]({"value": EVENTS[4:]})
+            self.handlers["Tracing.tracingComplete"]({})
+
+    async def detach(self):
+        self.detached = True
+
+
+class _Context:
+    def __init__(self):
+        self.session = _Session()
+
+    async def new_cdp_session(self, page):
+        return self.session
+
+
+class _Page:
+    def __init__(self, context):
+        self.context = context
+
+
+class _Locator:
+    def __init__(self, text):
+        self.text = text
+
+    async def inner_text(self, timeout=None):
+        return self.text
+
+
+def test_record_writes_the_trace_and_summarizes_each_step(tmp_path):
+    hook, context = PerfTrace(tmp_path), _Context()
+
+    async def scenario():
+        await hook(context)
+        trace_transitions(context, r"^(Venda|Aluguel)$", "TC010")
+        transitions = transitions_for(context)
+        labels = [await transitions.matches(_Locator(text)) for text in ("Aluguel", "Publicar Imóvel")]
+        for label in ("Aluguel", "Venda"):
+            async with transitions.record(_Page(context), label):
+                pass
+        return labels, hook.report(context)
+
+    labels, steps = asyncio.run(scenario())
+    assert labels == ["Aluguel", None]
+    assert context.session.sent == ["Tracing.start", "Tracing.end"] * 2 and context.session.detached
+    assert [(s["step"], s["label"]) for s in steps] == [(1, "Aluguel"), (2, "Venda")]
+    assert steps[0]["selfMs"] == summarize(EVENTS)["selfMs"]
+    with open(tmp_path / "TC010" / "step-01.json", encoding="utf-8") as f:
+        assert json.load(f) == {"traceEvents": EVENTS}
+    with open(tmp_path / "TC010" / "summary.json", encoding="utf-8") as f:
+        assert json.load(f) == steps
+
+
+def test_contexts_without_the_hook_trace_nothing():
+    context = _Context()
+    trace_transitions(context, r"Venda")
+    assert transitions_for(context) is None
@@ -0,0 +1,58 @@
+import asyncio
+
+import pytest
+
+from harness import registry
+
+
+class _Locator:
+    def __init__(self, scope, selector):
+        self.scope, self.selector = scope, selector
+
+    async def count(self):
+        self.scope.probed.append(self.selector)
+        return 1 if self.selector in self.scope.present else 0
+
+    @property
+    def first(self):
+        return self
+
+
+class _Page:
+    """Just enough of a Playwright page for `resolve`: which selectors match."""
+
+    def __init__(self, present):
+        self.present = set(present)
+        self.probed = []
+        self.page = self
+        self.context = self
+
+    def locator(self, selector):
+        return _Locator(self, selector)
+
+
+@pytest.fixture
+def entry(monkeypatch):
+    candidates = ('[data-testid="next"]', 'role=button[name="Próximo"]', "xpath=html/body/div/button", "xpath=html/body/button")
+    monkeypatch.setitem(registry.SELECTORS, "test.next", candidates)
+    monkeypatch.setattr(registry, "_resolved", {})
+    return candidates
+
+
+def resolve(page):
+    return asyncio.run(registry.resolve(page, "test.next")).selector
+
+
+def test_preferred_candidate_wins_once_it_renders_after_a_fallback_hit(entry):
+    # Before the test id rendered, only the second XPath matched.
+    assert resolve(_Page({entry[3]})) == entry[3]
+    page = _Page({entry[0], entry[3]})
+    assert resolve(page) == entry[0]
+    assert page.probed == [entry[0]]
+
+
+def test_cached_fallback_is_tried_first_among_fallbacks(entry):
+    resolve(_Page({entry[3]}))
+    page = _Page({entry[2], entry[3]})
+    assert resolve(page) == entry[3]
+    assert page.probed == [entry[0], entry[1], entry[3]]
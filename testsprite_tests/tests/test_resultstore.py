@@ -0,0 +1,88 @@
+import json
+from types import SimpleNamespace
+
+from harness import resultstore
+from harness.resultstore import RECENT_DURATIONS, ReportState, ResultStore, duration_history, iter_records
+
+
+def record(test_id, status="PASSED", duration=1.0, run="r1", timestamp="2026-01-01T00:00:00.000+00:00"):
+    return {"run": run, "timestamp": timestamp, "id": test_id, "title": f"{test_id} title",
+            "testStatus": status, "testError": None if status == "PASSED" else "boom", "duration": duration}
+
+
+def write(path, *records):
+    with open(path, "a", encoding="utf-8") as f:
+        for r in records:
+            f.write(json.dumps(r) + "\n")
+
+
+def test_update_counts_flips_and_caps_recent_durations(tmp_path):
+    stream = tmp_path / "results.jsonl"
+    statuses = ["PASSED", "FAILED", "FAILED", "PASSED", "PASSED", "PASSED", "PASSED"]
+    write(stream, *(record("TC001", status, duration=float(i)) for i, status in enumerate(statuses)))
+    state = ReportState()
+    assert state.update(stream) == len(statuses)
+    test = state.tests["TC001"]
+    assert (test["runs"], test["passed"], test["failed"], test["flips"]) == (7, 5, 2, 2)
+    assert test["recentDurations"] == [2.0, 3.0, 4.0, 5.0, 6.0][-RECENT_DURATIONS:]
+    assert test["totalDuration"] == 21.0
+    assert state.runs["r1"] == {"started": record("x")["timestamp"], "passed": 5, "failed": 2, "duration": 21.0}
+
+
+def test_update_reads_only_new_complete_lines(tmp_path):
+    stream = tmp_path / "results.jsonl"
+    write(stream, record("TC001"))
+    state = ReportState()
+    assert state.update(stream) == 1
+    # A line still being written is left for the next update.
+    with open(stream, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record("TC002"))[:20])
+    assert state.update(stream) == 0
+    assert state.offset == stream.stat().st_size - 20
+    with open(stream, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record("TC002"))[20:] + "\n")
+    assert state.update(stream) == 1
+    assert set(state.tests) == {"TC001", "TC002"} and state.records == 2
+
+
+def test_update_starts_over_when_the_stream_was_truncated(tmp_path):
+    stream = tmp_path / "results.jsonl"
+    write(stream, record("TC001"), record("TC002"))
+    state = ReportState()
+    state.update(stream)
+    stream.write_text("")
+    write(stream, record("TC003"))
+    assert state.update(stream) == 1
+    assert set(state.tests) == {"TC003"} and state.records == 1
+
+
+def test_only_recent_runs_are_kept(tmp_path, monkeypatch):
+    monkeypatch.setattr(resultstore, "RECENT_RUNS", 3)
+    stream = tmp_path / "results.jsonl"
+    write(stream, *(record("TC001", run=f"r{i}", timestamp=f"2026-01-0{i}T00:00:00") for i in range(1, 6)))
+    state = ReportState()
+    state.update(stream)
+    assert sorted(state.runs) == ["r3", "r4", "r5"]
+    assert state.tests["TC001"]["runs"] == 5
+
+
+def test_saved_state_resumes_from_its_offset(tmp_path):
+    stream, state_path = tmp_path / "results.jsonl", tmp_path / "state.json"
+    write(stream, record("TC001", duration=2.0))
+    ReportState.load(state_path).update(stream)
+    assert duration_history(stream, state_path) == {"TC001": [2.0]}
+    write(stream, record("TC001", duration=3.0))
+    resumed = ReportState.load(state_path)
+    assert resumed.offset > 0
+    assert resumed.update(stream) == 1
+    assert duration_history(stream, state_path) == {"TC001": [2.0, 3.0]}
+
+
+def test_append_stores_the_script_by_content(tmp_path):
+    script = tmp_path / "TC001_x.py"
+    script.write_text("print('hi')\n", encoding="utf-8")
+    store = ResultStore(tmp_path / "results.jsonl", run_id="r1")
+    stored = store.append({**record("TC001"), "spans": [1], "coverage": {}}, SimpleNamespace(path=script))
+    assert "spans" not in stored and "coverage" not in stored
+    assert store.load_code(stored["codeSha"]) == "print('hi')\n"
+    assert [r for r, _ in iter_records(store.path)] == [stored]
@@ -0,0 +1,55 @@
+import asyncio
+import json
+
+from harness.screenshots import ScreenshotSink
+
+
+class _Context:
+    """Enough of a BrowserContext for the tracer to attach to."""
+
+    def on(self, event, handler):
+        pass
+
+
+class _Page:
+    """Hands out the frames of a scripted run, one per screenshot."""
+
+    def __init__(self, frames):
+        self.context = _Context()
+        self.frames = list(frames)
+
+    async def screenshot(self, **options):
+        return self.frames.pop(0)
+
+
+def capture_all(directory, names, frames):
+    async def scenario():
+        page = _Page(frames)
+        async with ScreenshotSink(directory) as shots:
+            for name in names:
+                await shots.capture(page, name)
+        return shots
+
+    return asyncio.run(scenario())
+
+
+def test_identical_frames_are_stored_once(tmp_path):
+    names = ["01_initial_page", "02_same_again", "03_changed"]
+    shots = capture_all(tmp_path, names, [b"frame-a", b"frame-a", b"frame-b"])
+    assert shots.report()["captures"] == 3
+    assert (shots.stats["written"], shots.stats["duplicates"]) == (2, 1)
+    objects = sorted(p for p in (tmp_path / "objects").rglob("*.png"))
+    assert sorted(p.read_bytes() for p in objects) == [b"frame-a", b"frame-b"]
+
+    manifest = json.loads((tmp_path / "manifest.json").read_text(encoding="utf-8"))
+    assert manifest["01_initial_page"]["sha256"] == manifest["02_same_again"]["sha256"]
+    assert manifest["03_changed"]["sha256"] != manifest["01_initial_page"]["sha256"]
+    # Every capture name still resolves to its own frame.
+    assert [(tmp_path / f"{name}.png").read_bytes() for name in names] == [b"frame-a", b"frame-a", b"frame-b"]
+
+
+def test_frames_already_on_disk_are_not_rewritten(tmp_path):
+    capture_all(tmp_path, ["01_initial_page"], [b"frame-a"])
+    shots = capture_all(tmp_path, ["01_initial_page", "02_new"], [b"frame-a", b"frame-c"])
+    assert (shots.stats["written"], shots.stats["duplicates"]) == (1, 1)
+    assert len(list((tmp_path / "objects").rglob("*.png"))) == 2
@@ -0,0 +1,48 @@
+from types import SimpleNamespace
+
+from harness.shard import DEFAULT_DURATION, crashed_results, predict_durations, run_sharded, schedule, shard
+from harness.suite import discover_cases
+
+
+def test_worker_crash_fails_its_shard_instead_of_aborting():
+    cases = discover_cases(ids=["TC001", "TC002"])
+    # An unknown build_pool option makes every worker die before a browser starts.
+    results = run_sharded(cases, 2, {"no_such_option": True})
+    assert [r["id"] for r in results] == ["TC001", "TC002"]
+    assert all(r["testStatus"] == "FAILED" for r in results)
+    assert all("worker crashed" in r["testError"] and "no_such_option" in r["testError"] for r in results)
+
+
+def test_crashed_results_keep_the_result_shape():
+    case = discover_cases(ids=["TC001"])[0]
+    [result] = crashed_results([case], RuntimeError("boom"))
+    assert result["id"] == "TC001" and result["title"] == case.title
+    assert result["testError"].endswith("RuntimeError: boom")
+    assert result["selectors"] == [] and result["spans"] == []
+
+
+def cases_named(*ids):
+    return [SimpleNamespace(id=case_id) for case_id in ids]
+
+
+def test_predict_durations_uses_medians_and_falls_back():
+    cases = cases_named("TC001", "TC002", "TC003")
+    predicted = predict_durations(cases, {"TC001": [1.0, 9.0, 2.0], "TC002": [4.0], "TC003": []})
+    assert predicted == {"TC001": 2.0, "TC002": 4.0, "TC003": 3.0}
+    assert predict_durations(cases_named("TC001"), {}) == {"TC001": DEFAULT_DURATION}
+
+
+def test_schedule_balances_longest_first():
+    cases = cases_named("a", "b", "c", "d", "e")
+    predicted = {"a": 7.0, "b": 5.0, "c": 4.0, "d": 3.0, "e": 1.0}
+    shards, makespan = schedule(cases, 2, predicted)
+    assert [[c.id for c in s] for s in shards] == [["a", "d"], ["b", "c", "e"]]
+    assert makespan == 10.0
+    # Round-robin would put a, c and e together for 12 s.
+    assert max(sum(predicted[c.id] for c in s) for s in shard(cases, 2)) == 12.0
+
+
+def test_schedule_never_makes_empty_shards():
+    shards, makespan = schedule(cases_named("a", "b"), 8, {"a": 2.0, "b": 1.0})
+    assert [[c.id for c in s] for s in shards] == [["a"], ["b"]]
+    assert makespan == 2.0
@@ -0,0 +1,40 @@
+from harness.soak import find_growth
+
+
+def samples(cycles=50, every=5, **series):
+    """Samples every `every` cycles; each series maps a metric to f(cycle)."""
+    rows = [{"cycle": 0, "cycleMs": None, **{m: f(0) for m, f in series.items()}}]
+    for cycle in range(every, cycles + 1, every):
+        rows.append({"cycle": cycle, "cycleMs": 400.0 + cycle, **{m: f(cycle) for m, f in series.items()}})
+    return rows
+
+
+def test_steady_growth_is_a_leak_and_flat_metrics_are_not():
+    growth = find_growth(samples(domNodes=lambda c: 1200 + 3 * c, listeners=lambda c: 80 + c % 2))
+    assert growth["domNodes"]["leak"] and growth["domNodes"]["perCycle"] == 3.0
+    assert growth["domNodes"]["risingShare"] == 1.0
+    assert not growth["listeners"]["leak"]
+
+
+def test_growth_during_warm_up_is_ignored():
+    # Lazy chunks load in the first cycles, then the heap stays flat.
+    growth = find_growth(samples(heapUsedMB=lambda c: 20.0 if c > 10 else 5.0 + c))
+    assert growth["heapUsedMB"]["perCycle"] == 0.0
+    assert not growth["heapUsedMB"]["leak"]
+
+
+def test_noisy_growth_below_the_rising_share_is_not_a_leak():
+    # Large but mostly falling steps: a sawtooth, not a leak.
+    growth = find_growth(samples(domNodes=lambda c: 1000 + 3 * c + (60 if c % 10 else 0)))
+    assert growth["domNodes"]["perCycle"] > 1
+    assert not growth["domNodes"]["leak"]
+
+
+def test_cycle_time_is_fitted_but_never_flagged():
+    growth = find_growth(samples(domNodes=lambda c: 1000))
+    assert growth["cycleMs"]["perCycle"] == 1.0
+    assert not growth["cycleMs"]["leak"]
+
+
+def test_too_few_samples_fit_nothing():
+    assert find_growth(samples(cycles=10, domNodes=lambda c: c)) == {}
@@ -0,0 +1,168 @@
+import asyncio
+import json
+
+import pytest
+
+from harness.supabase_stub import StubError, SupabaseStub, context_hook, install, parse_filters, parse_select
+
+ROWS = [
+    {"id": 1, "titulo": "Casa Centro", "preco": 500000, "status": "ativo", "cidade": "Campinas"},
+    {"id": 2, "titulo": "Apartamento", "preco": 250000, "status": "inativo", "cidade": None},
+    {"id": 3, "titulo": "casa praia", "preco": 900000, "status": "ativo", "cidade": "Santos"},
+]
+
+
+def seed():
+    return {
+        "imoveis": [dict(row, anunciante_id="u1") for row in ROWS],
+        "midias_imovel": [{"id": 10, "imovel_id": 1, "url": "a.jpg"}, {"id": 11, "imovel_id": 1, "url": "b.jpg"}],
+        "perfis": [{"id": "u1", "nome_completo": "Ana"}],
+    }
+
+
+def matching(params):
+    predicates = parse_filters(params)
+    return [row["id"] for row in ROWS if all(p(row) for p in predicates)]
+
+
+def get(stub, query, headers=None):
+    status, _, body = stub.dispatch("GET", "/rest/v1/imoveis", query, headers or {}, None)
+    return status, json.loads(body)
+
+
+def test_parse_select_columns_casts_and_embeds():
+    assert parse_select("*") == (None, [])
+    assert parse_select("id, preco::text, nome:titulo") == (["id", "preco", "titulo"], [])
+    columns, embeds = parse_select("id, perfis:anunciante_id(*), midias_imovel(url)")
+    assert columns == ["id"]
+    assert embeds == [("perfis", "anunciante_id", "*"), ("midias_imovel", "midias_imovel", "url")]
+
+
+@pytest.mark.parametrize("params, ids", [
+    ([("status", "eq.ativo")], [1, 3]),
+    ([("status", "neq.ativo")], [2]),
+    ([("preco", "gte.500000")], [1, 3]),
+    ([("preco", "lt.500000")], [2]),
+    ([("titulo", "ilike.*casa*")], [1, 3]),
+    ([("titulo", "like.Casa%")], [1]),
+    ([("cidade", "is.null")], [2]),
+    ([("cidade", "not.is.null")], [1, 3]),
+    ([("id", "in.(1,3)")], [1, 3]),
+    ([("or", "(preco.lt.300000,cidade.eq.Santos)")], [2, 3]),
+    ([("or", "(status.eq.inativo,and(preco.gt.600000,status.eq.ativo))")], [2, 3]),
+    ([("not.or", "(id.eq.1,id.eq.2)")], [3]),
+    ([("status", "eq.ativo"), ("preco", "lt.600000")], [1]),
+])
+def test_filters(params, ids):
+    assert matching(params) == ids
+
+
+def test_order_limit_offset_and_content_range():
+    stub = SupabaseStub(seed())
+    status, headers, body = stub.dispatch(
+        "GET", "/rest/v1/imoveis", "select=id&order=preco.desc&limit=2&offset=1", {"prefer": "count=exact"}, None,
+    )
+    assert status == 200
+    assert json.loads(body) == [{"id": 1}, {"id": 2}]
+    assert headers["Content-Range"] == "1-2/3"
+
+
+def test_order_puts_nulls_last_ascending_and_first_descending():
+    stub = SupabaseStub(seed())
+    assert [r["id"] for r in get(stub, "select=id&order=cidade.asc")[1]] == [1, 3, 2]
+    assert [r["id"] for r in get(stub, "select=id&order=cidade.desc")[1]] == [2, 3, 1]
+
+
+def test_embeds_follow_relations():
+    stub = SupabaseStub(seed())
+    _, rows = get(stub, "select=id,perfis:anunciante_id(nome_completo),midias_imovel(url)&id=eq.1")
+    assert rows == [{"id": 1, "perfis": {"nome_completo": "Ana"}, "midias_imovel": [{"url": "a.jpg"}, {"url": "b.jpg"}]}]
+
+
+@pytest.mark.parametrize("method, path, body", [
+    ("POST", "/rest/v1/imoveis", b"{bad"),
+    ("PATCH", "/rest/v1/imoveis", b"{bad"),
+    ("POST", "/rest/v1/rpc/verify_admin_login", b"{bad"),
+])
+def test_malformed_json_is_a_400(method, path, body):
+    status, _, data = SupabaseStub(seed()).dispatch(method, path, "id=eq.1", {}, body)
+    assert status == 400
+    assert json.loads(data)["code"] == "PGRST102"
+
+
+def test_malformed_json_on_auth_is_a_400_in_gotrue_shape():
+    status, _, data = SupabaseStub(seed()).dispatch("POST", "/auth/v1/token", "grant_type=password", {}, b"{bad")
+    assert status == 400
+    assert json.loads(data)["error_code"] == "PGRST102"
+
+
+@pytest.mark.parametrize("query", ["limit=ten", "offset=x", "limit=-1"])
+def test_bad_limit_or_offset_is_a_400(query):
+    status, body = get(SupabaseStub(seed()), query)
+    assert status == 400
+    assert body["code"] == "PGRST100"
+
+
+def test_unknown_operator_is_a_400():
+    with pytest.raises(StubError) as exc:
+        matching([("preco", "between.1")])
+    assert exc.value.status == 400
+
+
+class _Context:
+    """Records the handler a hook routes, which is all the hook needs."""
+
+    def __init__(self):
+        self.handlers = []
+
+    async def route(self, pattern, handler):
+        self.handlers.append(handler)
+
+
+class _Route:
+    def __init__(self, method, url, body=None):
+        self.request = self
+        self.method, self.url, self.post_data_buffer = method, url, body
+        self.fulfilled = None
+
+    async def all_headers(self):
+        return {"prefer": "return=representation"}
+
+    async def fulfill(self, status, headers, body):
+        self.fulfilled = (status, json.loads(body))
+
+
+def test_each_context_gets_its_own_stub():
+    async def scenario():
+        hook = context_hook(seed())
+        first, second = _Context(), _Context()
+        await hook(first)
+        insert = _Route("POST", "https://x.supabase.co/rest/v1/imoveis", b'{"titulo": "Nova"}')
+        await first.handlers[0](insert)
+        # A context opened later must not wipe what the first one wrote.
+        await hook(second)
+        in_first = _Route("GET", "https://x.supabase.co/rest/v1/imoveis?titulo=eq.Nova")
+        in_second = _Route("GET", "https://x.supabase.co/rest/v1/imoveis?titulo=eq.Nova")
+        await first.handlers[0](in_first)
+        await second.handlers[0](in_second)
+        return insert.fulfilled, in_first.fulfilled, in_second.fulfilled
+
+    inserted, in_first, in_second = asyncio.run(scenario())
+    assert inserted[0] == 201
+    assert len(in_first[1]) == 1
+    assert in_second[1] == []
+
+
+def test_route_is_fulfilled_even_when_dispatch_fails():
+    async def scenario():
+        stub = SupabaseStub(seed())
+        stub.dispatch = lambda *args: 1 / 0
+        context = _Context()
+        await install(context, stub, "https://x.supabase.co")
+        route = _Route("GET", "https://x.supabase.co/rest/v1/imoveis")
+        await context.handlers[0](route)
+        return route.fulfilled
+
+    status, body = asyncio.run(scenario())
+    assert status == 500
+    assert "ZeroDivisionError" in body["message"]
@@ -0,0 +1,26 @@
+import os
+from types import SimpleNamespace
+
+from harness.shard import crashed_results
+from harness.tracing import chrome_trace
+
+
+def result(test_id, pid, spans=()):
+    return {"id": test_id, "title": f"{test_id} title", "pid": pid, "spans": list(spans)}
+
+
+def test_one_thread_per_case_with_its_spans():
+    span = {"name": "click", "selector": "nav.publish", "ts": 1.5, "durMs": 12.0, "status": "ok"}
+    trace = chrome_trace([result("TC002", 4321), result("TC001", 4321, [span])])
+    meta, click, second = trace["traceEvents"]
+    assert meta["args"]["name"] == "TC001 TC001 title" and meta["tid"] == 1
+    assert click == {"name": "click nav.publish", "cat": "click", "ph": "X", "ts": 1_500_000, "dur": 12_000,
+                     "pid": 4321, "tid": 1, "args": {"selector": "nav.publish", "status": "ok"}}
+    assert second["tid"] == 2
+
+
+def test_crashed_results_are_placed_in_this_process():
+    [crashed] = crashed_results([SimpleNamespace(id="TC003", title="Broken")], RuntimeError("boom"))
+    assert crashed["pid"] is None
+    trace = chrome_trace([crashed, result("TC004", None)])
+    assert {event["pid"] for event in trace["traceEvents"]} == {os.getpid()}
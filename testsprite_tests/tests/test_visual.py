@@ -0,0 +1,62 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+Image = pytest.importorskip("PIL.Image")
+
+from harness.visual import compare, tile_ratios  # noqa: E402
+
+
+def save(path, array):
+    Image.fromarray(array.astype(np.uint8)).save(path)
+    return path
+
+
+@pytest.fixture
+def frames(tmp_path):
+    base = np.full((100, 150, 3), 240, dtype=np.uint8)
+    changed = base.copy()
+    changed[10:30, 70:90] = (200, 30, 30)  # a 20 x 20 red box
+    return {
+        "baseline": save(tmp_path / "baseline.png", base),
+        "same": save(tmp_path / "same.png", base),
+        "changed": save(tmp_path / "changed.png", changed),
+        "diffs": tmp_path / "diffs",
+    }
+
+
+def test_tile_ratios_divide_edge_tiles_by_their_real_area():
+    changed = np.zeros((100, 150), dtype=bool)
+    changed[64:100, 128:150] = True   # the whole bottom-right edge tile (36 x 22)
+    changed[0:32, 0:64] = True        # half of the top-left tile
+    ratios = tile_ratios(changed, 64)
+    assert ratios.shape == (2, 3)
+    assert ratios[0, 0] == 0.5
+    assert ratios[1, 2] == 1.0
+    assert ratios.sum() == 1.5
+
+
+def test_identical_frames_match(frames):
+    result = compare("home", frames["same"], frames["baseline"], diff_dir=frames["diffs"])
+    assert result["status"] == "match"
+    assert result["changedPixels"] == 0 and result["changedTiles"] == []
+
+
+def test_changed_region_is_located_and_drawn(frames):
+    result = compare("home", frames["changed"], frames["baseline"], tile=64, diff_dir=frames["diffs"])
+    assert result["status"] == "diff"
+    assert result["changedPixels"] == 400
+    assert [(t["x"], t["y"]) for t in result["changedTiles"]] == [(64, 0)]
+    assert (frames["diffs"] / "home.png").exists()
+
+
+def test_masked_region_is_ignored(frames):
+    result = compare("home", frames["changed"], frames["baseline"], masks=[(60, 0, 40, 40)], diff_dir=frames["diffs"])
+    assert result["status"] == "match" and result["changedPixels"] == 0
+
+
+def test_missing_baseline_and_size_mismatch(frames, tmp_path):
+    assert compare("home", frames["same"], tmp_path / "none.png")["status"] == "new"
+    small = save(tmp_path / "small.png", np.zeros((50, 150, 3)))
+    result = compare("home", small, frames["baseline"])
+    assert result["status"] == "size_mismatch"
+    assert result["captureSize"] == [150, 50] and result["baselineSize"] == [150, 100]
@@ -0,0 +1,22 @@
+from harness.registry import SELECTORS
+from harness.vitals import BUDGETS, DEFAULT_BUDGET, ROUTES, budget_for, check_budget, summarize_route
+
+
+def test_every_route_has_a_budget_and_known_click():
+    assert {route.name for route in ROUTES} == set(BUDGETS)
+    assert all(route.click in SELECTORS for route in ROUTES if route.click)
+
+
+def test_publish_journey_is_opened_from_the_admin_dashboard():
+    [journey] = [route for route in ROUTES if route.name == "publish_journey"]
+    assert (journey.session, journey.click) == ("admin", "admin.publish_new")
+    assert budget_for("publish_journey")["transitionMs"] == 1500
+    assert budget_for("publish") == DEFAULT_BUDGET
+
+
+def test_medians_and_budget_check():
+    samples = [{"tbtMs": 100, "cls": 0.05, "transitionMs": None}, {"tbtMs": 500, "cls": 0.2},
+               {"tbtMs": 350, "cls": 0.15}]
+    summary = summarize_route(samples)
+    assert (summary["tbtMs"], summary["cls"], summary["transitionMs"]) == (350, 0.15, None)
+    assert check_budget("publish_journey", summary) == [("cls", 0.15, 0.1), ("tbtMs", 350, 300)]
@@ -0,0 +1,64 @@
+import asyncio
+
+from harness import watch
+from harness.impact import APP_DIR
+from harness.suite import discover_cases, run_case, sessions
+from harness.watch import affected_cases, changes, snapshot
+
+SCRIPT = "async def run_test(context):\n    pass\n"
+
+
+def write_cases(directory):
+    (directory / "TC001_Home.py").write_text('SESSION = "admin"\n' + SCRIPT, encoding="utf-8")
+    (directory / "TC002_Search.py").write_text(SCRIPT, encoding="utf-8")
+    (directory / "TC003_Broken.py").write_text("def run_test(context)\n", encoding="utf-8")
+
+
+def test_changes_finds_added_removed_and_modified_files():
+    before = {"a.ts": 1, "b.ts": 1, "c.ts": 1}
+    after = {"a.ts": 1, "b.ts": 2, "d.ts": 1}
+    assert changes(before, after) == ["b.ts", "c.ts", "d.ts"]
+    assert changes(after, after) == []
+
+
+def test_snapshot_prunes_dependencies_and_output(tmp_path):
+    paths = ("src/App.tsx", "node_modules/react/index.js", "testsprite_tests/tmp/x.json", "testsprite_tests/TC001_A.py")
+    for path in paths:
+        (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / path).write_text("", encoding="utf-8")
+    assert sorted(snapshot(tmp_path)) == ["src/App.tsx", "testsprite_tests/TC001_A.py"]
+
+
+def test_a_saved_script_runs_itself_and_harness_changes_run_nothing(monkeypatch):
+    monkeypatch.setattr(watch, "load_map", lambda: {})
+    script = "testsprite_tests/TC002_Advanced_Search_Returns_Accurate_Results.py"
+    cases, reasons = affected_cases([script], APP_DIR / "testsprite_tests")
+    assert [case.id for case in cases] == ["TC002"] and reasons == {"TC002": [script]}
+    assert affected_cases(["testsprite_tests/harness/waits.py"], APP_DIR / "testsprite_tests") == ([], {})
+
+
+def test_app_changes_go_through_the_impact_map(monkeypatch):
+    detail = "components/PropertyDetailPage.tsx"
+    mapping = {f"TC{n:03d}": {"files": [], "loaded": ["App.tsx", detail]} for n in range(1, 16)}
+    mapping["TC014"]["files"].append(detail)
+    monkeypatch.setattr(watch, "load_map", lambda: mapping)
+    cases, reasons = affected_cases(["components/PropertyDetailPage.tsx"], APP_DIR / "testsprite_tests")
+    assert [case.id for case in cases] == ["TC014"]
+    assert reasons == {"TC014": ["components/PropertyDetailPage.tsx"]}
+
+
+def test_cases_outside_the_repository_are_still_selected(tmp_path, monkeypatch):
+    write_cases(tmp_path)
+    monkeypatch.setattr(watch, "load_map", lambda: {})
+    cases, reasons = affected_cases(["App.tsx"], tmp_path)
+    assert [case.id for case in cases] == ["TC001", "TC002", "TC003"]
+    assert reasons["TC001"] == ["no coverage recorded", "App.tsx (unmapped)"]
+
+
+def test_a_script_that_does_not_import_does_not_stop_the_others(tmp_path):
+    write_cases(tmp_path)
+    assert sessions(discover_cases(tmp_path)) == {"admin"}
+    # The broken script is reported when it runs, before any context opens.
+    broken = discover_cases(tmp_path, ids=["TC003"])[0]
+    result = asyncio.run(run_case(None, broken))
+    assert result["testStatus"] == "FAILED" and "SyntaxError" in result["testError"]
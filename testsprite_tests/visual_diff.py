@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""Compare the captures in test_screenshots/ with their baselines.
+
+    python testsprite_tests/visual_diff.py                   # every capture in manifest.json
+    python testsprite_tests/visual_diff.py tc012_mobile      # selected captures
+    python testsprite_tests/visual_diff.py --update          # accept the current captures as baselines
+
+Dynamic regions are masked per capture in test_screenshots/masks.json:
+
+    {"tc012_desktop": [[0, 0, 1280, 64]]}
+
+Changed captures get a red overlay in test_screenshots/diffs/. Exits
+non-zero when any capture differs or has changed size.
+"""
+
+import argparse
+import json
+import sys
+
+from harness.screenshots import SCREENSHOT_DIR
+from harness.visual import FAIL_RATIO, PIXEL_THRESHOLD, TILE, compare_manifest, update_baselines
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("names", nargs="*", help="capture names (default: all in the manifest)")
+    parser.add_argument("--dir", default=str(SCREENSHOT_DIR), help="screenshot directory")
+    parser.add_argument("--update", action="store_true", help="promote the captures to baselines")
+    parser.add_argument("--threshold", type=float, default=PIXEL_THRESHOLD, help="per-pixel perceptual threshold (0-1)")
+    parser.add_argument("--fail-ratio", type=float, default=FAIL_RATIO, help="changed-pixel share that fails a capture")
+    parser.add_argument("--tile", type=int, default=TILE, help="tile size in pixels for the change map")
+    parser.add_argument("-j", "--workers", type=int, default=4)
+    parser.add_argument("--json", action="store_true", help="print the full results as JSON")
+    args = parser.parse_args(argv)
+    names = set(args.names) or None
+
+    if args.update:
+        for name in update_baselines(args.dir, names):
+            print(f"baseline updated: {name}")
+        return 0
+
+    results = compare_manifest(args.dir, names, workers=args.workers, threshold=args.threshold,
+                               fail_ratio=args.fail_ratio, tile=args.tile)
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for result in results:
+            line = f"{result['status']:<13} {result['name']}"
+            if "changedRatio" in result:
+                line += f"  {result['changedRatio']:.4%} changed, max delta {result['maxDelta']}"
+            if "diffImage" in result:
+                line += f"  -> {result['diffImage']}"
+            print(line)
+    failed = [r for r in results if r["status"] in ("diff", "size_mismatch")]
+    new = sum(1 for r in results if r["status"] == "new")
+    print(f"\n{len(results) - len(failed) - new} match, {len(failed)} changed, {new} without baseline")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())